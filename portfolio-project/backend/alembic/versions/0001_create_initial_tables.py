@@ -0,0 +1,58 @@
+"""create initial tables
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+기존에 INIT_DB(create_all)로 테이블을 만든 데이터베이스는
+`alembic -c alembic.ini stamp 0001` 로 이 리비전을 표시한 뒤 upgrade 하세요.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("is_admin", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_user_id", "user", ["id"])
+    op.create_index("ix_user_username", "user", ["username"], unique=True)
+
+    op.create_table(
+        "board",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("slug", sa.String(length=50), nullable=True),
+        sa.Column("tags", sa.String(length=255), nullable=True),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["owner_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_board_id", "board", ["id"])
+    op.create_index("ix_board_title", "board", ["title"])
+    op.create_index("ix_board_slug", "board", ["slug"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_board_slug", table_name="board")
+    op.drop_index("ix_board_title", table_name="board")
+    op.drop_index("ix_board_id", table_name="board")
+    op.drop_table("board")
+    op.drop_index("ix_user_username", table_name="user")
+    op.drop_index("ix_user_id", table_name="user")
+    op.drop_table("user")
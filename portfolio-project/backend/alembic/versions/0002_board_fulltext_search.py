@@ -0,0 +1,42 @@
+"""board full-text search vector
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+제목(가중치 A)과 본문(가중치 B)으로 tsvector 생성 컬럼을 만들고 GIN 인덱스를 추가합니다.
+생성 컬럼(STORED)이므로 INSERT/UPDATE 시 PostgreSQL이 자동으로 갱신합니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "board",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_board_search_vector", "board", ["search_vector"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_board_search_vector", table_name="board")
+    op.drop_column("board", "search_vector")
@@ -0,0 +1,67 @@
+"""normalized tags
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+쉼표로 구분된 board.tags 문자열을 tag / board_tag 테이블로 정규화합니다.
+board.tags 컬럼은 API 응답 호환을 위해 그대로 유지하며, 기존 데이터는 이 마이그레이션에서 백필됩니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tag",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_tag_id", "tag", ["id"])
+    op.create_index("ix_tag_name", "tag", ["name"], unique=True)
+
+    op.create_table(
+        "board_tag",
+        sa.Column("board_id", sa.Integer(), nullable=False),
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["board.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tag_id"], ["tag.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("board_id", "tag_id"),
+    )
+    op.create_index("ix_board_tag_tag_id_board_id", "board_tag", ["tag_id", "board_id"])
+
+    # 기존 게시글의 태그 문자열을 분리하여 백필
+    op.execute(
+        """
+        INSERT INTO tag (name)
+        SELECT DISTINCT btrim(t.name)
+        FROM board, unnest(string_to_array(board.tags, ',')) AS t(name)
+        WHERE btrim(t.name) <> ''
+        ON CONFLICT (name) DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO board_tag (board_id, tag_id)
+        SELECT DISTINCT board.id, tag.id
+        FROM board, unnest(string_to_array(board.tags, ',')) AS t(name)
+        JOIN tag ON tag.name = btrim(t.name)
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_board_tag_tag_id_board_id", table_name="board_tag")
+    op.drop_table("board_tag")
+    op.drop_index("ix_tag_name", table_name="tag")
+    op.drop_index("ix_tag_id", table_name="tag")
+    op.drop_table("tag")
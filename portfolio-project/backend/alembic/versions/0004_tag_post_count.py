@@ -0,0 +1,39 @@
+"""tag post count
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+태그별 게시글 수(고정 페이지 제외)를 tag.post_count에 저장하고 기존 데이터로 채웁니다.
+이후에는 게시글 생성/수정/삭제 시 CRUD 계층에서 같은 트랜잭션으로 증감됩니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tag",
+        sa.Column("post_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE tag SET post_count = (
+            SELECT count(*)
+            FROM board_tag
+            JOIN board ON board.id = board_tag.board_id
+            WHERE board_tag.tag_id = tag.id AND board.slug IS NULL
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tag", "post_count")
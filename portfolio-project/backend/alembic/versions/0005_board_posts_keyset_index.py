@@ -0,0 +1,33 @@
+"""board posts keyset index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+게시글 목록의 (created_at, id) 정렬과 키셋 페이지네이션을 위한 부분 인덱스를 추가합니다.
+고정 페이지(slug IS NOT NULL)는 목록에 나오지 않으므로 인덱스에서 제외합니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # created_at이 비어 있는 행은 키셋 비교에서 빠지므로 먼저 채워 둡니다.
+    op.execute("UPDATE board SET created_at = now() WHERE created_at IS NULL")
+    op.create_index(
+        "ix_board_posts_created_at_id",
+        "board",
+        ["created_at", "id"],
+        postgresql_where=sa.text("slug IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_board_posts_created_at_id", table_name="board")
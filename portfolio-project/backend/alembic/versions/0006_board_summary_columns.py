@@ -0,0 +1,60 @@
+"""board summary columns
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+목록 화면용 요약 컬럼(excerpt, cover_image)을 추가하고 기존 게시글 본문으로부터 채웁니다.
+이후에는 게시글 생성/수정 시 CRUD 계층에서 함께 저장됩니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.content import find_cover_image, make_excerpt
+
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    op.add_column("board", sa.Column("excerpt", sa.String(length=300), nullable=True))
+    op.add_column("board", sa.Column("cover_image", sa.String(length=500), nullable=True))
+
+    # 본문 전체를 한 번에 메모리에 올리지 않도록 id 순으로 나누어 백필합니다.
+    conn = op.get_bind()
+    board = sa.table(
+        "board",
+        sa.column("id", sa.Integer),
+        sa.column("content", sa.Text),
+        sa.column("excerpt", sa.String),
+        sa.column("cover_image", sa.String),
+    )
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(board.c.id, board.c.content)
+            .where(board.c.id > last_id)
+            .order_by(board.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            board.update().where(board.c.id == sa.bindparam("b_id")),
+            [
+                {"b_id": row.id, "excerpt": make_excerpt(row.content), "cover_image": find_cover_image(row.content)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_column("board", "cover_image")
+    op.drop_column("board", "excerpt")
@@ -0,0 +1,38 @@
+"""board version
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+
+게시글 전체의 버전을 board_version 테이블의 한 행에 저장하고 기존 데이터로 채웁니다.
+목록 ETag를 요청마다 board 전체 집계(count + max)로 계산하지 않도록, 이후에는
+게시글 생성/수정/삭제 시 CRUD 계층에서 같은 트랜잭션으로 올립니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "board_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("last_modified", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        """
+        INSERT INTO board_version (id, version, last_modified)
+        SELECT 1, count(*), max(coalesce(updated_at, created_at)) FROM board
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("board_version")
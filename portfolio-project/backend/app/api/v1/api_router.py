@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import login, board, upload, sitemap, pdf
+from app.api.v1.endpoints import admin, login, board, upload, sitemap, pdf
 
 api_router = APIRouter()
 
@@ -16,6 +16,9 @@ api_router.include_router(upload.router, prefix="/upload", tags=["upload"])
 # PDF generation (Playwright)
 api_router.include_router(pdf.router, prefix="/pdf", tags=["pdf"])
 
+# 관리자용 운영 정보 라우터 (캐시 통계 등)
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+
 # SEO sitemap 라우터
 api_router.include_router(sitemap.router, tags=["seo"])
 
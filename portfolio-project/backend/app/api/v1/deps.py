@@ -1,13 +1,17 @@
+import hashlib
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import models, schemas
 from app.core import security
+from app.core.cache import LRUCache
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.crud import crud_user
 
 # OAuth2PasswordBearer는 "/api/v1/login" 엔드포인트에서 토큰을 가져오는 의존성입니다.
@@ -15,17 +19,38 @@ reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
 )
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> models.User:
+# 검증을 통과한 토큰 -> (사용자 ID, 만료 시각) 캐시
+# 키는 jti가 아니라 토큰 전체의 해시입니다. jti만으로 찾으면 같은 jti를 넣어 위조한 토큰이
+# 서명 검증 없이 통과할 수 있기 때문입니다. (토큰 문자열이 같으면 jti/iss/aud/exp도 같음)
+verified_token_cache = LRUCache(max_items=settings.AUTH_CACHE_MAX_ITEMS, ttl=settings.AUTH_CACHE_TTL)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Could not validate credentials",
+    )
+
+
+def verify_access_token(token: str) -> int:
     """
-    API 요청 헤더의 JWT 토큰을 검증하고, 해당 토큰의 사용자 정보를 반환합니다.
-    
+    JWT를 검증하고 사용자 ID(sub)를 반환합니다. 검증 결과는 AUTH_CACHE_TTL 동안 캐시됩니다.
+
     보안 강화:
     - issuer (iss) 클레임 검증
     - audience (aud) 클레임 검증
     - 알고리즘 고정 (알고리즘 혼동 공격 방지)
+    - 캐시 히트여도 만료(exp)는 매번 현재 시각과 비교
     """
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    cached = verified_token_cache.get(cache_key)
+    if cached is not None:
+        user_id, expires_at = cached
+        if expires_at > time.time():
+            return user_id
+        verified_token_cache.delete(cache_key)
+        raise _credentials_exception()
+
     try:
         payload = jwt.decode(
             token, 
@@ -36,22 +61,35 @@ def get_current_user(
             options={
                 "require_exp": True,
                 "require_sub": True,
+                "require_jti": True,
             }
         )
         token_data = schemas.TokenPayload(**payload)
-    except (JWTError, ValidationError) as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-        )
-    
+    except (JWTError, ValidationError):
+        raise _credentials_exception()
+    if token_data.sub is None:
+        raise _credentials_exception()
+
+    verified_token_cache.set(cache_key, (token_data.sub, float(payload["exp"])))
+    return token_data.sub
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(reusable_oauth2)
+) -> models.User:
+    """
+    API 요청 헤더의 JWT 토큰을 검증하고, 해당 토큰의 사용자 정보를 반환합니다.
+    토큰 검증 결과와 사용자 정보는 짧게 캐시되어, 캐시 히트 시에는 DB를 조회하지 않습니다.
+    """
+    user_id = verify_access_token(token)
+
     # 토큰에서 추출한 사용자 ID를 사용하여 DB에서 사용자 정보를 조회합니다.
-    user = crud_user.user.get(db, id=token_data.sub)
+    user = await crud_user.user.aget(db, id=user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
-def get_current_active_admin_user(
+async def get_current_active_admin_user(
     current_user: models.User = Depends(get_current_user),
 ) -> models.User:
     """
@@ -0,0 +1,268 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models, portfolio_archive, schemas
+from app.api.v1 import deps
+from app.core.config import settings
+from app.core.image_fetcher import remote_image_fetcher
+from app.core.serialization import post_json_cache
+from app.crud import crud_board
+from app.crud.base import crud_cache
+from app.crud.crud_user import user as crud_user
+from app.db import profiler
+from app.db.pool import async_pool_monitor, sync_pool_monitor
+from app.db.session import SessionLocal, async_engine, engine
+
+router = APIRouter()
+
+
+@router.get("/cache-stats")
+def read_cache_stats(
+    current_user: models.User = Depends(deps.get_current_active_admin_user)
+) -> Dict[str, Any]:
+    """
+    캐시 크기 조정을 위한 히트/미스/제거 횟수를 조회합니다. (관리자 권한 필요)
+
+    - `crud`: 게시글 ID/slug 조회 캐시 (비활성화되어 있으면 null)
+    - `post_json`: 게시글 조회 응답의 직렬화 결과 캐시 (BOARD_JSON_CACHE_MAX_BYTES)
+    - `users`: 인증 시 사용하는 사용자 정보 캐시 (AUTH_CACHE_TTL)
+    - `auth_tokens`: 검증을 통과한 액세스 토큰 캐시
+    - `pdf_remote_images`: PDF에 인라인하는 원격 이미지 캐시
+    """
+    return {
+        "crud": crud_cache.stats() if crud_cache is not None else None,
+        "post_json": post_json_cache.stats(),
+        "users": crud_user.cache.stats() if crud_user.cache is not None else None,
+        "auth_tokens": deps.verified_token_cache.stats(),
+        "pdf_remote_images": remote_image_fetcher.cache.stats(),
+    }
+
+
+@router.get("/db-pool")
+def read_db_pool_stats(
+    current_user: models.User = Depends(deps.get_current_active_admin_user)
+) -> Dict[str, Any]:
+    """
+    DB 커넥션 풀의 현재 상태와 누적 통계를 조회합니다. (관리자 권한 필요)
+
+    - `pool`: 풀 크기, 대기/사용 중 연결 수, overflow 수 (현재 값)
+    - `checkout_wait_seconds`: 연결을 얻기까지 기다린 시간 (최근 요청 기준 백분위)
+    - `timeouts`: DB_POOL_TIMEOUT 안에 연결을 얻지 못한 횟수 (풀 고갈)
+    """
+    return {
+        "async": async_pool_monitor.snapshot(async_engine.sync_engine.pool),
+        "sync": sync_pool_monitor.snapshot(engine.pool),
+    }
+
+
+@router.get("/sql-profile")
+def read_sql_profiles(
+    limit: int = 20,
+    current_user: models.User = Depends(deps.get_current_active_admin_user),
+) -> List[Dict[str, Any]]:
+    """
+    최근 요청들의 SQL 프로파일을 최신순으로 조회합니다. (관리자 권한 필요, SQL_PROFILER_ENABLED일 때만)
+
+    - `statements`: 정규화된 문장별 실행 횟수와 누적 시간 (시간 순)
+    - `n_plus_one`: 같은 문장이 SQL_N_PLUS_ONE_THRESHOLD번 이상 실행된 경우와 호출 위치
+    """
+    if not settings.SQL_PROFILER_ENABLED:
+        raise HTTPException(status_code=404, detail="SQL profiler is disabled")
+    return list(reversed(profiler.recent_profiles))[:limit]
+
+
+# --- 게시글 일괄 처리 ---
+# 유효한 항목은 한 트랜잭션(커밋 1회)으로 처리하고, 항목별 결과를 입력 순서대로 반환합니다.
+# 검증에 실패한 항목(중복 slug, 없는 ID 등)은 건너뛰며 나머지는 그대로 반영됩니다.
+
+def _check_batch_size(items: Sequence[Any]) -> None:
+    if len(items) > settings.BOARD_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many items (max {settings.BOARD_BULK_MAX_ITEMS})",
+        )
+
+
+async def _commit_batch(db: AsyncSession, apply):
+    try:
+        return await apply()
+    except IntegrityError:
+        # 검증과 커밋 사이에 다른 요청이 같은 slug를 사용한 경우 등 (배치 전체가 롤백됨)
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Batch conflicts with concurrent changes; nothing was applied",
+        )
+
+
+def _slug_errors(
+    slugs: Sequence[Optional[str]], owners: Dict[str, int], ids: Sequence[Optional[int]]
+) -> Dict[int, str]:
+    """항목 index -> 오류 메시지. 다른 글이 이미 쓰는 slug나 같은 배치 안에서 중복된 slug를 찾습니다."""
+    errors: Dict[int, str] = {}
+    seen = set()
+    for index, (slug, post_id) in enumerate(zip(slugs, ids)):
+        if slug is None:
+            continue
+        if slug in seen:
+            errors[index] = f"Duplicate slug '{slug}' in batch"
+        elif slug in owners and owners[slug] != post_id:
+            errors[index] = f"Slug '{slug}' is already used by post {owners[slug]}"
+        seen.add(slug)
+    return errors
+
+
+@router.post("/posts/bulk-create", response_model=List[schemas.BoardBulkResult])
+async def bulk_create_posts(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    posts_in: List[schemas.BoardCreate],
+    current_user: models.User = Depends(deps.get_current_active_admin_user),
+):
+    """게시글 여러 개를 한 트랜잭션으로 생성합니다. (관리자 권한 필요)"""
+    _check_batch_size(posts_in)
+    slugs = [post.slug for post in posts_in]
+    owners = await crud_board.board.aget_slug_owners(db, slugs=[slug for slug in slugs if slug])
+    errors = _slug_errors(slugs, owners, [None] * len(posts_in))
+
+    valid = [index for index in range(len(posts_in)) if index not in errors]
+    created = await _commit_batch(db, lambda: crud_board.board.acreate_multi_with_owner(
+        db, objs_in=[posts_in[index] for index in valid], owner_id=current_user.id,
+    ))
+    results = [
+        schemas.BoardBulkResult(index=index, status="invalid", detail=detail)
+        for index, detail in errors.items()
+    ]
+    results += [
+        schemas.BoardBulkResult(index=index, id=post.id, status="created", post=post)
+        for index, post in zip(valid, created)
+    ]
+    return sorted(results, key=lambda result: result.index)
+
+
+@router.post("/posts/bulk-update", response_model=List[schemas.BoardBulkResult])
+async def bulk_update_posts(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    posts_in: List[schemas.BoardBulkUpdateItem],
+    current_user: models.User = Depends(deps.get_current_active_admin_user),
+):
+    """게시글 여러 개를 한 트랜잭션으로 수정합니다. 각 항목은 `id`와 바꿀 필드만 담습니다. (관리자 권한 필요)"""
+    _check_batch_size(posts_in)
+    ids = [post.id for post in posts_in]
+    existing = await crud_board.board.aget_existing_ids(db, ids=ids)
+    slugs = [post.slug if "slug" in post.model_fields_set else None for post in posts_in]
+    owners = await crud_board.board.aget_slug_owners(db, slugs=[slug for slug in slugs if slug])
+    errors = _slug_errors(slugs, owners, ids)
+    seen = set()
+    for index, post_id in enumerate(ids):
+        if post_id in seen:
+            errors.setdefault(index, f"Duplicate id {post_id} in batch")
+        seen.add(post_id)
+
+    results: List[schemas.BoardBulkResult] = []
+    changes = {}
+    for index, post in enumerate(posts_in):
+        if index in errors:
+            results.append(schemas.BoardBulkResult(index=index, id=post.id, status="invalid", detail=errors[index]))
+        elif post.id not in existing:
+            results.append(schemas.BoardBulkResult(index=index, id=post.id, status="not_found"))
+        else:
+            changes[post.id] = (index, post.model_dump(exclude_unset=True, exclude={"id"}))
+
+    updated = await _commit_batch(db, lambda: crud_board.board.aupdate_multi(
+        db, objs_in={post_id: data for post_id, (_, data) in changes.items()},
+    ))
+    for post in updated:
+        results.append(schemas.BoardBulkResult(index=changes[post.id][0], id=post.id, status="updated", post=post))
+    # 검증과 수정 사이에 삭제된 글
+    updated_ids = {post.id for post in updated}
+    for post_id, (index, _) in changes.items():
+        if post_id not in updated_ids:
+            results.append(schemas.BoardBulkResult(index=index, id=post_id, status="not_found"))
+    return sorted(results, key=lambda result: result.index)
+
+
+@router.post("/posts/bulk-delete", response_model=List[schemas.BoardBulkResult])
+async def bulk_delete_posts(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    payload: schemas.BoardBulkDelete,
+    current_user: models.User = Depends(deps.get_current_active_admin_user),
+):
+    """게시글 여러 개를 한 번의 DELETE로 삭제합니다. (관리자 권한 필요)"""
+    _check_batch_size(payload.ids)
+    deleted = await crud_board.board.aremove_multi(db, ids=list(dict.fromkeys(payload.ids)))
+    deleted_by_id = {post.id: post for post in deleted}
+    results = []
+    seen = set()
+    for index, post_id in enumerate(payload.ids):
+        post = deleted_by_id.get(post_id)
+        if post_id in seen:
+            results.append(schemas.BoardBulkResult(
+                index=index, id=post_id, status="invalid", detail=f"Duplicate id {post_id} in batch",
+            ))
+        elif post is not None:
+            results.append(schemas.BoardBulkResult(index=index, id=post_id, status="deleted", post=post))
+        else:
+            results.append(schemas.BoardBulkResult(index=index, id=post_id, status="not_found"))
+        seen.add(post_id)
+    return results
+
+
+# --- 전체 내보내기/가져오기 (app.portfolio_archive) ---
+
+@router.get("/export")
+def export_portfolio(
+    current_user: models.User = Depends(deps.get_current_active_admin_user),
+):
+    """
+    모든 게시글과 본문에서 참조하는 업로드 이미지를 gzip tar 아카이브로 내려받습니다. (관리자 권한 필요)
+    전체를 메모리에 올리지 않고 만들면서 바로 전송합니다.
+    """
+    def stream() -> Iterator[bytes]:
+        # StreamingResponse는 엔드포인트가 반환된 뒤에 본문을 읽으므로 요청용 세션 대신 자체 세션을 사용합니다.
+        db = SessionLocal()
+        try:
+            for chunk in portfolio_archive.iter_export(db):
+                if chunk:
+                    yield chunk
+        finally:
+            db.close()
+
+    filename = f"portfolio-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.tar.gz"
+    return StreamingResponse(
+        stream(),
+        media_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/import")
+async def import_portfolio(
+    file: UploadFile = File(...),
+    current_user: models.User = Depends(deps.get_current_active_admin_user),
+) -> Dict[str, Any]:
+    """
+    /admin/export로 만든 아카이브를 가져옵니다. (관리자 권한 필요)
+    slug가 있는 글은 slug 기준, 나머지는 ID 기준으로 덮어쓰며 가져온 글의 작성자는 요청한 관리자입니다.
+    """
+    def run() -> Dict[str, Any]:
+        db = SessionLocal()
+        try:
+            return portfolio_archive.import_archive(db, file.file, owner_id=current_user.id)
+        finally:
+            db.close()
+
+    try:
+        return await run_in_threadpool(run)
+    except portfolio_archive.ArchiveError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    finally:
+        await file.close()
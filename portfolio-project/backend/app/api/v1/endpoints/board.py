@@ -1,121 +1,235 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional, Any
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Optional, Any, Tuple
 
 from app import models, schemas
 from app.api.v1 import deps
+from app.core.config import settings
+from app.core.http_cache import conditional_response, make_etag
+from app.core.serialization import post_json_cache
 from app.crud import crud_board
 
 router = APIRouter()
 
+# 다음 페이지 커서를 전달하는 응답 헤더 (CORS expose_headers에도 등록되어 있어야 함)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def _json_response(response: Response, content: bytes) -> Response:
+    """
+    미리 직렬화한 JSON으로 응답합니다. (Response를 직접 반환하면 response_model 검증/인코딩을 건너뜀)
+    의존성으로 받은 response에 설정한 헤더(ETag, 다음 커서 등)를 옮겨 담습니다.
+    """
+    json_response = Response(content=content, media_type="application/json")
+    json_response.headers.raw.extend(response.headers.raw)
+    return json_response
+
+
+async def _collection_not_modified(request: Request, response: Response, db: AsyncSession) -> Optional[Response]:
+    """
+    목록/태그 응답의 조건부 요청 처리. 게시글 전체 버전 + 경로/쿼리로 ETag를 만들어
+    변경이 없으면 본문 조회 없이 304를 반환합니다. (초 단위 Last-Modified는 같은 초의 변경을 놓치므로 ETag로만 판단)
+    """
+    version, last_modified = await crud_board.board.aget_collection_version(db)
+    etag = make_etag(request.url.path, sorted(request.query_params.multi_items()), version, last_modified)
+    return conditional_response(
+        request, response, etag=etag, last_modified=last_modified, use_last_modified=False
+    )
+
+
+async def _post_not_modified(
+    request: Request, response: Response, db: AsyncSession, *, id: Optional[int] = None, slug: Optional[str] = None
+) -> Tuple[Optional[Response], Optional[datetime]]:
+    """
+    게시글 하나의 조건부 요청 처리. (304 응답 또는 None, ETag에 사용한 마지막 수정 시각)을 반환합니다.
+    없는 게시글이면 (None, None)을 반환하여 이후 404 처리에 맡깁니다.
+    본문은 반환된 시각의 버전으로 읽어야 ETag와 내용이 어긋나지 않습니다.
+    """
+    exists, last_modified = await crud_board.board.aget_last_modified(db, id=id, slug=slug)
+    if not exists:
+        return None, None
+    etag = make_etag("post", id if id is not None else slug, last_modified)
+    return conditional_response(request, response, etag=etag, last_modified=last_modified), last_modified
+
+
+async def _read_posts_page(
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    *,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    tags: Optional[str],
+    tag_mode: str,
+    search: Optional[str],
+    summary: bool,
+) -> Response:
+    """
+    read_posts / read_post_summaries 공통 처리: 필터링된 한 페이지를 조회하고 다음 커서 헤더를 설정합니다.
+    게시글별 직렬화 결과를 캐시하므로, 바뀌지 않은 글은 다시 검증/인코딩하지 않습니다.
+    """
+    not_modified = await _collection_not_modified(request, response, db)
+    if not_modified:
+        return not_modified
+    tag_list = crud_board.split_tags(tags)
+    try:
+        posts, next_cursor = await crud_board.board.aget_posts_page(
+            db, tags=tag_list, match_all=tag_mode == "and", search=search,
+            skip=skip, limit=limit, cursor=cursor, summary=summary,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    schema = schemas.BoardSummary if summary else schemas.Board
+    return _json_response(response, post_json_cache.dumps_list(posts, schema))
+
 @router.get("/", response_model=List[schemas.Board])
-def read_posts(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
-    tags: Optional[str] = Query(None, description="쉼표로 구분된 태그들"),
+async def read_posts(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.BOARD_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값 (지정하면 skip은 무시)"),
+    tags: Optional[str] = Query(None, description="쉼표로 구분된 태그들 (정확히 일치)"),
+    tag_mode: str = Query("or", pattern="^(and|or)$", description="or: 태그 중 하나라도 일치, and: 모든 태그 일치"),
     search: Optional[str] = Query(None, description="제목 또는 내용 검색어")
 ):
     """
     포트폴리오 게시글을 조회하거나, 태그 및 검색어를 기준으로 필터링하여 조회합니다.
     고정 페이지(About, Contact)는 제외됩니다.
+
+    최신 글 순(created_at, id 역순)으로 정렬되며, 다음 페이지가 있으면 `X-Next-Cursor` 응답 헤더에
+    커서를 담아 반환합니다. 다음 페이지는 `cursor` 파라미터로 조회합니다. (skip/limit도 계속 지원)
+    """
+    return await _read_posts_page(
+        request, response, db, skip=skip, limit=limit, cursor=cursor,
+        tags=tags, tag_mode=tag_mode, search=search, summary=False,
+    )
+
+@router.get("/summary", response_model=List[schemas.BoardSummary])
+async def read_post_summaries(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.BOARD_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값 (지정하면 skip은 무시)"),
+    tags: Optional[str] = Query(None, description="쉼표로 구분된 태그들 (정확히 일치)"),
+    tag_mode: str = Query("or", pattern="^(and|or)$", description="or: 태그 중 하나라도 일치, and: 모든 태그 일치"),
+    search: Optional[str] = Query(None, description="제목 또는 내용 검색어")
+):
     """
-    if tags and search:
-        # 태그와 검색어 모두 있는 경우
-        tag_list = [tag.strip() for tag in tags.split(',')]
-        posts = crud_board.board.get_multi_by_tags_and_search(db, tags=tag_list, search=search, skip=skip, limit=limit)
-    elif tags:
-        # 태그만 있는 경우
-        tag_list = [tag.strip() for tag in tags.split(',')]
-        posts = crud_board.board.get_multi_by_tags_posts_only(db, tags=tag_list, skip=skip, limit=limit)
-    elif search:
-        # 검색어만 있는 경우
-        posts = crud_board.board.get_multi_by_search(db, search=search, skip=skip, limit=limit)
-    else:
-        # 필터 없이 전체 조회
-        posts = crud_board.board.get_multi_posts_only(db, skip=skip, limit=limit)
-    return posts
+    게시글 목록을 카드 표시용 요약(제목, 태그, 날짜, 발췌문, 대표 이미지)으로 조회합니다.
+    필터/정렬/커서는 `GET /board/`와 같으며, 본문(content)은 DB에서 읽지도 응답하지도 않습니다.
+    본문이 필요하면 `GET /board/{post_id}` 또는 `GET /board/slug/{slug}`를 사용하세요.
+    """
+    return await _read_posts_page(
+        request, response, db, skip=skip, limit=limit, cursor=cursor,
+        tags=tags, tag_mode=tag_mode, search=search, summary=True,
+    )
 
 @router.get("/tags", response_model=List[str])
-def get_all_tags(db: Session = Depends(deps.get_db)):
+async def get_all_tags(request: Request, response: Response, db: AsyncSession = Depends(deps.get_async_db)):
     """
     데이터베이스에 저장된 모든 유니크한 태그 목록을 조회합니다.
     """
-    return crud_board.board.get_all_tags(db)
+    not_modified = await _collection_not_modified(request, response, db)
+    if not_modified:
+        return not_modified
+    return await crud_board.board.aget_all_tags(db)
 
 @router.get("/tags/count", response_model=dict)
-def get_tags_with_count(db: Session = Depends(deps.get_db)):
+async def get_tags_with_count(request: Request, response: Response, db: AsyncSession = Depends(deps.get_async_db)):
     """
     태그별 포스팅 개수를 포함한 태그 목록을 조회합니다.
     """
-    return crud_board.board.get_tags_with_count(db)
+    not_modified = await _collection_not_modified(request, response, db)
+    if not_modified:
+        return not_modified
+    return await crud_board.board.aget_tags_with_count(db)
 
 
 @router.post("/", response_model=schemas.Board, status_code=status.HTTP_201_CREATED)
-def create_post(
+async def create_post(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     post_in: schemas.BoardCreate,
     current_user: models.User = Depends(deps.get_current_active_admin_user)
 ):
     """새로운 게시글을 생성합니다. (관리자 권한 필요)"""
-    post = crud_board.board.create_with_owner(db=db, obj_in=post_in, owner_id=current_user.id)
+    post = await crud_board.board.acreate_with_owner(db, obj_in=post_in, owner_id=current_user.id)
     return post
 
 @router.get("/slug/{slug}", response_model=schemas.Board)
-def read_post_by_slug(
+async def read_post_by_slug(
     *,
-    db: Session = Depends(deps.get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
     slug: str,
 ) -> Any:
     """고유 슬러그(slug)로 About, Contact 같은 고정 페이지를 조회합니다."""
-    post = crud_board.board.get_by_slug(db, slug=slug)
+    not_modified, last_modified = await _post_not_modified(request, response, db, slug=slug)
+    if not_modified:
+        return not_modified
+    post = await crud_board.board.aget_by_slug(db, slug=slug, last_modified=last_modified)
     if not post:
         raise HTTPException(
             status_code=404, 
             detail="The post with this slug does not exist"
         )
-    return post
+    return _json_response(response, post_json_cache.dumps(post, schemas.Board))
     
 @router.get("/{post_id}", response_model=schemas.Board)
-def read_post(
+async def read_post(
     *,
-    db: Session = Depends(deps.get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
     post_id: int,
 ):
-    """ID를 기준으로 특정 게시글 하나를 조회합니다."""
-    post = crud_board.board.get(db=db, id=post_id)
+    """
+    ID를 기준으로 특정 게시글 하나를 조회합니다.
+    ETag/Last-Modified를 내려주며, 변경이 없으면 본문을 읽지 않고 304를 반환합니다.
+    """
+    not_modified, last_modified = await _post_not_modified(request, response, db, id=post_id)
+    if not_modified:
+        return not_modified
+    post = await crud_board.board.aget(db, id=post_id, last_modified=last_modified)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    return post
+    return _json_response(response, post_json_cache.dumps(post, schemas.Board))
 
 
 @router.put("/{post_id}", response_model=schemas.Board)
-def update_post(
+async def update_post(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     post_id: str,
     post_in: schemas.BoardUpdate,
     current_user: models.User = Depends(deps.get_current_active_admin_user)
 ):
     """기존 게시글을 ID 또는 slug를 사용하여 수정합니다. (관리자 권한 필요)"""
-    post = crud_board.board.get_by_id_or_slug(db=db, post_id=post_id)
+    post = await crud_board.board.aget_by_id_or_slug(db, post_id=post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    post = crud_board.board.update(db=db, db_obj=post, obj_in=post_in)
+    post = await crud_board.board.aupdate(db, db_obj=post, obj_in=post_in)
     return post
 
 
 @router.delete("/{post_id}", response_model=schemas.Board)
-def delete_post(
+async def delete_post(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     post_id: str,
     current_user: models.User = Depends(deps.get_current_active_admin_user)
 ):
     """게시글을 ID 또는 slug를 사용하여 삭제합니다. (관리자 권한 필요)"""
-    post = crud_board.board.get_by_id_or_slug(db=db, post_id=post_id)
+    post = await crud_board.board.aget_by_id_or_slug(db, post_id=post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    post = crud_board.board.remove(db=db, id=post.id)
+    post = await crud_board.board.aremove(db, id=post.id)
     return post
@@ -1,19 +1,20 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas, models
 from app.api.v1 import deps
 from app.core import security
 from app.core.config import settings
+from app.core.password_hasher import PasswordHasherBusy
 from app.crud import crud_user
 
 router = APIRouter()
 
 @router.post("/access-token", response_model=schemas.Token)
-def login_access_token(
-    db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()
+async def login_access_token(
+    db: AsyncSession = Depends(deps.get_async_db), form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """
     OAuth2 호환 폼 데이터로 액세스 토큰을 발급받습니다.
@@ -22,9 +23,17 @@ def login_access_token(
     성공 시 JWT 토큰을 반환합니다.
     관리자의 경우 더 짧은 세션 타임아웃이 적용됩니다.
     """
-    user = crud_user.user.authenticate(
-        db, username=form_data.username, password=form_data.password
-    )
+    try:
+        user = await crud_user.user.aauthenticate(
+            db, username=form_data.username, password=form_data.password
+        )
+    except PasswordHasherBusy:
+        # 로그인 요청이 몰리면 다른 API가 느려지지 않도록 대기열에 쌓지 않고 바로 거절합니다.
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts are being processed. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -44,7 +53,7 @@ def login_access_token(
     }
 
 @router.post("/test-token", response_model=schemas.User)
-def test_token(current_user: models.User = Depends(deps.get_current_user)):
+async def test_token(current_user: models.User = Depends(deps.get_current_user)):
     """
     테스트용 엔드포인트: 현재 로그인된 사용자의 정보를 반환합니다.
     프론트엔드에서 토큰의 유효성을 확인할 때 유용하게 사용할 수 있습니다.
@@ -52,7 +61,7 @@ def test_token(current_user: models.User = Depends(deps.get_current_user)):
     return current_user
 
 @router.post("/refresh-token", response_model=schemas.Token)
-def refresh_token(current_user: models.User = Depends(deps.get_current_user)):
+async def refresh_token(current_user: models.User = Depends(deps.get_current_user)):
     """
     현재 토큰을 사용하여 새로운 토큰을 발급받습니다.
     관리자의 경우 더 짧은 세션 타임아웃이 적용됩니다.
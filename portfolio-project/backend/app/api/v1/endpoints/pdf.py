@@ -1,12 +1,21 @@
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Iterable, Optional
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
+import asyncio
+import base64
 import logging
 import io
+import re
 from PIL import Image
-from playwright.async_api import async_playwright
+
+from app.core.browser_pool import BrowserPoolTimeout, browser_pool
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.image_fetcher import remote_image_fetcher
+from app.core.pdf_cache import pdf_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -37,6 +46,56 @@ def _resize_image_for_pdf(data: bytes, max_width: int = 1024) -> tuple[bytes, st
         logger.warning("Resize failed, using original: %s", e)
         return data, "image/png"
 
+STATIC_DIRECTORY = (Path(__file__).resolve().parents[3] / 'static').resolve()
+
+# Ready-to-use data URIs of local static images, keyed by (path, mtime, size)
+_static_data_uri_cache = LRUCache(max_bytes=settings.PDF_STATIC_IMAGE_CACHE_MAX_BYTES)
+
+_SRC_ATTR_RE = re.compile(r'src=["\']([^"\']+)["\']')
+
+
+def _replace_img_sources(html: str, replacements: Dict[str, str]) -> str:
+    """Rewrite every src="..." whose value is in `replacements` in a single pass."""
+    def _sub(match):
+        new_src = replacements.get(match.group(1))
+        return f'src="{new_src}"' if new_src is not None else match.group(0)
+    return _SRC_ATTR_RE.sub(_sub, html)
+
+def _static_data_uri(src: str) -> Optional[str]:
+    """Return a (cached) data URI for a /static/... src, or None if it is not a local static file."""
+    normalized_path = urlparse(src).path or src
+    if not normalized_path.startswith('/static/'):
+        return None
+    # Map to app/static path (and refuse anything that escapes it, e.g. "/static/../")
+    local_path = (STATIC_DIRECTORY / normalized_path[len('/static/'):]).resolve()
+    if not local_path.is_relative_to(STATIC_DIRECTORY):
+        logger.warning("Refusing to inline path outside static directory: %s", src)
+        return None
+    try:
+        stat = local_path.stat()
+        # mtime/size are part of the key, so a replaced file is never served stale
+        cache_key = (str(local_path), stat.st_mtime_ns, stat.st_size)
+        data_uri = _static_data_uri_cache.get(cache_key)
+        if data_uri is None:
+            # Resize local images too
+            data, mime = _resize_image_for_pdf(local_path.read_bytes())
+            data_uri = f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+            _static_data_uri_cache.set(cache_key, data_uri)
+        return data_uri
+    except Exception:
+        logger.warning("Could not inline local static image: %s", local_path)
+        return None
+
+
+def _inline_local_static(sources: Iterable[str]) -> Dict[str, str]:
+    """Map each /static/... src to its data URI (blocking; run it in a worker thread)."""
+    replacements = {}
+    for src in sources:
+        data_uri = _static_data_uri(src)
+        if data_uri is not None:
+            replacements[src] = data_uri
+    return replacements
+
 class GeneratePdfRequest(BaseModel):
     html: Optional[str] = None
     url: Optional[str] = None
@@ -47,150 +106,137 @@ class GeneratePdfRequest(BaseModel):
 # Reject unreasonably large payloads early to avoid memory issues (5 MB)
 MAX_HTML_SIZE_BYTES = 5 * 1024 * 1024
 
-@router.post("/generate")
-async def generate_pdf(payload: GeneratePdfRequest):
-    """Render provided HTML or URL to a PDF using Playwright and return as application/pdf"""
-    if not payload.html and not payload.url:
-        raise HTTPException(status_code=400, detail="Either 'html' or 'url' must be provided")
+# Page options shared by every render; they are part of the render cache key
+PDF_FORMAT = 'A4'
+PDF_MARGIN = {"top": "15mm", "bottom": "15mm", "left": "15mm", "right": "15mm"}
 
-    if payload.html and len(payload.html.encode('utf-8')) > MAX_HTML_SIZE_BYTES:
-        logger.warning("PDF request rejected: html payload too large (%d bytes)", len(payload.html.encode('utf-8')))
-        raise HTTPException(status_code=413, detail="HTML payload too large")
 
-    try:
-        # Log failed images reported by frontend (helps debug inlining failures)
-        if getattr(payload, 'failed_images', None):
-            logger.warning("Frontend reported failed images: %s", payload.failed_images)
+async def _render_pdf(payload: GeneratePdfRequest) -> bytes:
+    """Inline images into the payload HTML and print it (or the URL) with a pooled browser page."""
+    # Log failed images reported by frontend (helps debug inlining failures)
+    if getattr(payload, 'failed_images', None):
+        logger.warning("Frontend reported failed images: %s", payload.failed_images)
 
-        # Attempt to fetch and inline remote images skipped by the client (skipped_images)
-        if getattr(payload, 'skipped_images', None):
+    payload_html = None
+    if payload.html:
+        # Collect every image replacement first, then rewrite the HTML once
+        replacements: Dict[str, str] = {}
+
+        # Fetch remote images skipped by the client concurrently
+        if payload.skipped_images:
             try:
-                import re, base64, requests
-                from pathlib import Path
-                for url in payload.skipped_images:
-                    try:
-                        if not re.match(r'^https?://', url):
-                            logger.warning('Skipping non-http url for remote fetch: %s', url)
-                            continue
-                        resp = requests.get(url, stream=True, timeout=10)
-                        resp.raise_for_status()
-                        data = resp.content if hasattr(resp, 'content') else b''.join(resp.iter_content(8192))
-                        # Resize to prevent crash
-                        data, mime = _resize_image_for_pdf(data)
-                        b64 = base64.b64encode(data).decode('ascii')
-                        payload.html = re.sub(re.escape(f'src="{url}"'), f'src="data:{mime};base64,{b64}"', payload.html)
-                        logger.warning('Inlined remote image %s (%d bytes)', url, len(data))
-                    except Exception as e:
-                        logger.warning('Failed to fetch remote image %s: %s', url, e)
+                replacements.update(
+                    await remote_image_fetcher.fetch_many(payload.skipped_images, transform=_resize_image_for_pdf)
+                )
             except Exception:
                 logger.exception('Error while attempting to inline remote skipped images')
 
         # Server-side inline for local static images (e.g., src="/static/images/...")
-        if payload.html:
-            try:
-                import re, base64
-                from pathlib import Path
-                # Find all src="/static/..." or src='/static/...'
-                def _inline_local_static(match):
-                    src = match.group(1)
-                    parsed = urlparse(src)
-                    normalized_path = parsed.path or src
-                    if not normalized_path.startswith('/static/'):
-                        return match.group(0)
-                    # Map to app/static path
-                    local_path = Path(__file__).resolve().parents[3] / 'static' / normalized_path.replace('/static/', '')
-                    try:
-                        data = local_path.read_bytes()
-                        # Resize local images too
-                        data, mime = _resize_image_for_pdf(data)
-                        b64 = base64.b64encode(data).decode('ascii')
-                        return f'src="data:{mime};base64,{b64}"'
-                    except Exception:
-                        logger.warning("Could not inline local static image: %s", local_path)
-                        return match.group(0)
-
-                payload_html = payload.html
-                payload_html = re.sub(r'src=["\']([^"\']+)["\']', _inline_local_static, payload_html)
-            except Exception:
-                logger.exception("Error while attempting to inline local static images")
-                payload_html = payload.html
+        try:
+            sources = set(_SRC_ATTR_RE.findall(payload.html)) - replacements.keys()
+            replacements.update(await asyncio.to_thread(_inline_local_static, sources))
+        except Exception:
+            logger.exception("Error while attempting to inline local static images")
+
+        payload_html = _replace_img_sources(payload.html, replacements) if replacements else payload.html
+
+    # Borrow a warm page from the shared browser pool (no per-request Chromium launch)
+    async with browser_pool.page() as page:
+        if payload.url:
+            # navigate to URL
+            await page.goto(payload.url, wait_until='networkidle')
         else:
-            payload_html = None
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(args=[
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage"
-            ])
-            page = await browser.new_page()
-
-            if payload.url:
-                # navigate to URL
-                await page.goto(payload.url, wait_until='networkidle')
-            else:
-                # directly set HTML content (useful to avoid network dependency)
-                await page.set_content(payload_html or payload.html, wait_until='networkidle')
-
+            # directly set HTML content (useful to avoid network dependency)
+            await page.set_content(payload_html or payload.html, wait_until='networkidle')
+
+        try:
+            pdf_bytes = await page.pdf(
+                format=PDF_FORMAT,
+                landscape=bool(payload.landscape),
+                print_background=True,
+                display_header_footer=False,
+                margin=PDF_MARGIN,
+                prefer_css_page_size=True
+            )
+        except Exception as primary_err:
+            # Diagnostic logging: gather basic metrics about content and images
             try:
-                pdf_bytes = await page.pdf(
-                    format='A4',
-                    print_background=True,
-                    display_header_footer=False,
-                    margin={"top": "15mm", "bottom": "15mm", "left": "15mm", "right": "15mm"},
-                    prefer_css_page_size=True
-                )
-            except Exception as primary_err:
-                # Diagnostic logging: gather basic metrics about content and images
+                import time
+                html_content = payload_html or payload.html or ''
+                img_matches = re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', html_content)
+                total_b64_len = sum(len(m) for m in img_matches if m.startswith('data:'))
+                logger.warning("Initial page.pdf failed; img_count=%d total_b64_len=%d html_len=%d",
+                               len(img_matches), total_b64_len, len(html_content))
+
+                # Try to capture a screenshot for debugging
                 try:
-                    import re, time, base64
-                    from pathlib import Path
-                    html_content = payload_html or payload.html or ''
-                    img_matches = re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', html_content)
-                    total_b64_len = sum(len(m) for m in img_matches if m.startswith('data:'))
-                    logger.warning("Initial page.pdf failed; img_count=%d total_b64_len=%d html_len=%d",
-                                   len(img_matches), total_b64_len, len(html_content))
-
-                    # Try to capture a screenshot for debugging
-                    try:
-                        screenshot_bytes = await page.screenshot(full_page=True)
-                        screenshot_path = Path('/tmp') / f'pdf_error_screenshot_{int(time.time())}.png'
-                        screenshot_path.write_bytes(screenshot_bytes)
-                        logger.warning("Wrote PDF debug screenshot to %s", screenshot_path)
-                    except Exception:
-                        logger.exception("Failed to take screenshot for diagnostics")
+                    screenshot_bytes = await page.screenshot(full_page=True)
+                    screenshot_path = Path('/tmp') / f'pdf_error_screenshot_{int(time.time())}.png'
+                    screenshot_path.write_bytes(screenshot_bytes)
+                    logger.warning("Wrote PDF debug screenshot to %s", screenshot_path)
                 except Exception:
-                    logger.exception("Failed to gather diagnostics after page.pdf failure")
-
-                # Retry with fallback scales
-                last_exc = primary_err
-                for scale in (0.9, 0.8, 0.7):
-                    try:
-                        logger.warning("Retrying page.pdf with scale=%s", scale)
-                        pdf_bytes = await page.pdf(
-                            format='A4',
-                            print_background=True,
-                            display_header_footer=False,
-                            margin={"top": "15mm", "bottom": "15mm", "left": "15mm", "right": "15mm"},
-                            scale=scale
-                        )
-                        logger.warning("PDF generation succeeded with scale=%s", scale)
-                        break
-                    except Exception as retry_err:
-                        logger.exception("Retry with scale=%s failed", scale)
-                        last_exc = retry_err
-                else:
-                    # All retries failed
-                    await browser.close()
-                    logger.exception("All PDF retries failed: %s", last_exc)
-                    raise last_exc
-
-            await browser.close()
-
-            return Response(content=pdf_bytes, media_type="application/pdf",
-                            headers={"Content-Disposition": "attachment; filename=portfolio.pdf"})
+                    logger.exception("Failed to take screenshot for diagnostics")
+            except Exception:
+                logger.exception("Failed to gather diagnostics after page.pdf failure")
+
+            # Retry with fallback scales
+            last_exc = primary_err
+            for scale in (0.9, 0.8, 0.7):
+                try:
+                    logger.warning("Retrying page.pdf with scale=%s", scale)
+                    pdf_bytes = await page.pdf(
+                        format=PDF_FORMAT,
+                        landscape=bool(payload.landscape),
+                        print_background=True,
+                        display_header_footer=False,
+                        margin=PDF_MARGIN,
+                        scale=scale
+                    )
+                    logger.warning("PDF generation succeeded with scale=%s", scale)
+                    break
+                except Exception as retry_err:
+                    logger.exception("Retry with scale=%s failed", scale)
+                    last_exc = retry_err
+            else:
+                # All retries failed
+                logger.exception("All PDF retries failed: %s", last_exc)
+                raise last_exc
 
+        return pdf_bytes
+
+
+@router.post("/generate")
+async def generate_pdf(payload: GeneratePdfRequest):
+    """Render provided HTML or URL to a PDF using Playwright and return as application/pdf"""
+    if not payload.html and not payload.url:
+        raise HTTPException(status_code=400, detail="Either 'html' or 'url' must be provided")
+
+    if payload.html and len(payload.html.encode('utf-8')) > MAX_HTML_SIZE_BYTES:
+        logger.warning("PDF request rejected: html payload too large (%d bytes)", len(payload.html.encode('utf-8')))
+        raise HTTPException(status_code=413, detail="HTML payload too large")
+
+    # Identical HTML/URL + options (and the same remote images) always yields the same PDF.
+    # Key on exactly what _render_pdf renders: the URL when one is given, otherwise the HTML.
+    cache_key = pdf_cache.make_key(
+        html=None if payload.url else payload.html,
+        url=payload.url,
+        options={
+            "format": PDF_FORMAT,
+            "margin": PDF_MARGIN,
+            "landscape": bool(payload.landscape),
+            "skipped_images": sorted(payload.skipped_images or []),
+        },
+    )
+
+    try:
+        pdf_bytes = await pdf_cache.get_or_render(cache_key, lambda: _render_pdf(payload))
+    except BrowserPoolTimeout:
+        logger.warning("PDF request rejected: all browsers busy")
+        raise HTTPException(status_code=503, detail="PDF renderer is busy, please retry later")
     except Exception as exc:
         # Log full stacktrace for debugging
         logger.exception("Failed to generate PDF: %s", exc)
         raise HTTPException(status_code=500, detail="Internal error while generating PDF")
+
+    return Response(content=pdf_bytes, media_type="application/pdf",
+                    headers={"Content-Disposition": "attachment; filename=portfolio.pdf"})
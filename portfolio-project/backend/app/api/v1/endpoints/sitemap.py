@@ -1,48 +1,157 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
-from datetime import datetime
+from typing import Callable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+from xml.sax.saxutils import escape
 
 from app.api.v1 import deps
+from app.core.cache import LRUCache
+from app.core.config import settings
 from app.crud import crud_board
+from app.db.session import SessionLocal
 
 router = APIRouter()
 
-@router.get("/sitemap.xml", response_class=PlainTextResponse)
+SITEMAP_MEDIA_TYPE = "application/xml"
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+# 스트리밍 시 한 번에 내보내는 <url> 항목 수
+URLS_PER_CHUNK = 500
+
+# 고정 페이지들 (경로, changefreq, priority)
+STATIC_PAGES = [
+    ("/", "weekly", "1.0"),
+    ("/about", "monthly", "0.8"),
+    ("/contact", "monthly", "0.8"),
+]
+
+# 렌더링된 sitemap 캐시. 키에 게시글 전체 버전이 들어가므로 게시글이 바뀌면 자연스럽게 새로 생성됩니다.
+_sitemap_cache = LRUCache(max_bytes=settings.SITEMAP_CACHE_MAX_BYTES)
+# 버전별 (게시글 수, 태그 목록, 분할 파일 수). 캐시 히트 시에는 버전 조회 쿼리 하나만 실행됩니다.
+_layout_cache = LRUCache(max_items=4)
+
+
+def _url_entry(path: str, changefreq: str, priority: str, lastmod: Optional[str] = None) -> str:
+    loc = escape(f"{settings.SITE_URL.rstrip('/')}{path}")
+    lastmod_tag = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
+    return (
+        f"  <url><loc>{loc}</loc>{lastmod_tag}"
+        f"<changefreq>{changefreq}</changefreq><priority>{priority}</priority></url>"
+    )
+
+
+def _iter_url_entries(
+    db: Session, *, start: int, stop: int, post_total: int, tags: List[str]
+) -> Iterator[str]:
+    """
+    전체 URL 목록(고정 페이지 -> 게시글(id 순) -> 태그 페이지) 중 [start, stop) 구간의 <url> 항목을 생성합니다.
+    게시글은 서버 사이드 커서로 스트리밍하므로 전체 목록을 메모리에 올리지 않습니다.
+    """
+    for path, changefreq, priority in STATIC_PAGES[start:stop]:
+        yield _url_entry(path, changefreq, priority)
+
+    post_start = max(start - len(STATIC_PAGES), 0)
+    post_stop = min(stop - len(STATIC_PAGES), post_total)
+    if post_stop > post_start:
+        for post_id, last_modified in crud_board.board.iter_post_last_modified(
+            db, skip=post_start, limit=post_stop - post_start
+        ):
+            yield _url_entry(f"/post/{post_id}", "weekly", "0.9", last_modified.strftime("%Y-%m-%d"))
+
+    tag_offset = len(STATIC_PAGES) + post_total
+    for tag in tags[max(start - tag_offset, 0):max(stop - tag_offset, 0)]:
+        # 태그는 쿼리 문자열로 인코딩한 뒤 XML 이스케이프합니다. (&, <, 공백, 한글 등)
+        yield _url_entry(f"/?tag={quote(tag, safe='')}", "weekly", "0.7")
+
+
+def _render_urlset(start: int, stop: int, post_total: int, tags: List[str]) -> Iterator[str]:
+    # StreamingResponse는 엔드포인트가 반환된 뒤에 본문을 읽으므로 요청용 세션 대신 자체 세션을 사용합니다.
+    db = SessionLocal()
+    try:
+        yield f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NAMESPACE}">\n'
+        batch = []
+        for entry in _iter_url_entries(db, start=start, stop=stop, post_total=post_total, tags=tags):
+            batch.append(entry)
+            if len(batch) >= URLS_PER_CHUNK:
+                yield "\n".join(batch) + "\n"
+                batch = []
+        if batch:
+            yield "\n".join(batch) + "\n"
+        yield "</urlset>\n"
+    finally:
+        db.close()
+
+
+def _render_index(shard_count: int, lastmod: Optional[str]) -> Iterator[str]:
+    base_url = settings.SITE_URL.rstrip("/")
+    lastmod_tag = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
+    yield f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NAMESPACE}">\n'
+    for page in range(1, shard_count + 1):
+        loc = escape(f"{base_url}/sitemap-{page}.xml")
+        yield f"  <sitemap><loc>{loc}</loc>{lastmod_tag}</sitemap>\n"
+    yield "</sitemapindex>\n"
+
+
+def _cached_stream(key: Tuple, render: Callable[[], Iterator[str]]) -> Response:
+    """캐시된 sitemap이 있으면 바로 반환하고, 없으면 스트리밍하면서 완성된 결과를 캐시에 저장합니다."""
+    cached = _sitemap_cache.get(key)
+    if cached is not None:
+        return Response(content=cached, media_type=SITEMAP_MEDIA_TYPE)
+
+    def stream() -> Iterator[bytes]:
+        parts = []
+        for chunk in render():
+            data = chunk.encode("utf-8")
+            parts.append(data)
+            yield data
+        # 끝까지 전송된 경우에만 저장합니다. (중간에 끊긴 응답은 캐시하지 않음)
+        _sitemap_cache.set(key, b"".join(parts))
+
+    return StreamingResponse(stream(), media_type=SITEMAP_MEDIA_TYPE)
+
+
+def _sitemap_layout(db: Session) -> Tuple[Tuple, int, List[str], int]:
+    """(캐시 버전, 게시글 수, 태그 목록, 분할 파일 수). 분할 파일 수가 1이면 sitemap 하나로 제공합니다."""
+    collection_version, last_modified = crud_board.board.get_collection_version(db)
+    version = (settings.SITE_URL, settings.SITEMAP_MAX_URLS, collection_version, last_modified)
+    layout = _layout_cache.get(version)
+    if layout is None:
+        post_total = crud_board.board.count_posts_only(db)
+        tags = crud_board.board.get_all_tags(db)
+        total_urls = len(STATIC_PAGES) + post_total + len(tags)
+        shard_count = max(1, -(-total_urls // settings.SITEMAP_MAX_URLS))
+        layout = (post_total, tags, shard_count)
+        _layout_cache.set(version, layout)
+    return (version, *layout)
+
+
+@router.get("/sitemap.xml", response_class=Response)
 def generate_sitemap(db: Session = Depends(deps.get_db)):
     """
-    검색 엔진을 위한 sitemap.xml을 동적으로 생성합니다.
+    검색 엔진을 위한 sitemap.xml을 스트리밍으로 생성합니다.
+
+    URL이 SITEMAP_MAX_URLS(프로토콜 한도 50,000)를 넘으면 `/sitemap-{n}.xml` 분할 파일을 가리키는
+    sitemap index를 반환합니다. 결과는 게시글이 바뀔 때까지 메모리에 캐시됩니다.
     """
-    base_url = "https://portfolio.ywsung.ai.kr"  # 실제 도메인으로 변경 필요
-    
-    # 기본 페이지들
-    urls = [
-        f'  <url><loc>{base_url}/</loc><changefreq>weekly</changefreq><priority>1.0</priority></url>',
-        f'  <url><loc>{base_url}/about</loc><changefreq>monthly</changefreq><priority>0.8</priority></url>',
-        f'  <url><loc>{base_url}/contact</loc><changefreq>monthly</changefreq><priority>0.8</priority></url>',
-    ]
-    
-    # 모든 포트폴리오 게시글 추가 (고정 페이지 제외)
-    posts = crud_board.board.get_multi_posts_only(db, limit=1000)
-    for post in posts:
-        last_modified = post.updated_at or post.created_at
-        urls.append(
-            f'  <url><loc>{base_url}/post/{post.id}</loc>'
-            f'<lastmod>{last_modified.strftime("%Y-%m-%d")}</lastmod>'
-            f'<changefreq>weekly</changefreq><priority>0.9</priority></url>'
+    version, post_total, tags, shard_count = _sitemap_layout(db)
+    if shard_count == 1:
+        return _cached_stream(
+            ("urlset", 1, version),
+            lambda: _render_urlset(0, settings.SITEMAP_MAX_URLS, post_total, tags),
         )
-    
-    # 태그별 페이지 추가
-    tags = crud_board.board.get_all_tags(db)
-    for tag in tags:
-        urls.append(
-            f'  <url><loc>{base_url}/?tag={tag}</loc>'
-            f'<changefreq>weekly</changefreq><priority>0.7</priority></url>'
-        )
-    
-    sitemap_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{chr(10).join(urls)}
-</urlset>'''
-    
-    return sitemap_content
\ No newline at end of file
+    last_modified = version[-1]
+    lastmod = last_modified.strftime("%Y-%m-%d") if last_modified else None
+    return _cached_stream(("index", version), lambda: _render_index(shard_count, lastmod))
+
+
+@router.get("/sitemap-{page}.xml", response_class=Response)
+def generate_sitemap_shard(page: int, db: Session = Depends(deps.get_db)):
+    """sitemap index가 가리키는 n번째 분할 sitemap을 반환합니다. (1부터 시작)"""
+    version, post_total, tags, shard_count = _sitemap_layout(db)
+    if page < 1 or page > shard_count:
+        raise HTTPException(status_code=404, detail="Sitemap page not found")
+    start = (page - 1) * settings.SITEMAP_MAX_URLS
+    return _cached_stream(
+        ("urlset", page, version),
+        lambda: _render_urlset(start, start + settings.SITEMAP_MAX_URLS, post_total, tags),
+    )
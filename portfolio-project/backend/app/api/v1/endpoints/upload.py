@@ -1,30 +1,107 @@
-import shutil
+import os
+import tempfile
 import uuid
-import io  # io 모듈 추가
 from pathlib import Path
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status
-from PIL import Image  # Pillow 라이브러리 추가
+from typing import Callable
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from PIL import Image
 
 from app import models
 from app.api.v1 import deps
+from app.core.config import settings
+from app.core.image_jobs import ImageJob, JobQueueFull, image_jobs
+from app.core.image_processing import convert_to_webp
 
-router = APIRouter()
+# 업로드 스트림을 디스크로 복사할 때 한 번에 읽는 크기
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# multipart 경계/헤더 등 파일 외 요청 본문에 허용하는 여유분
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+def _payload_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File is too large (max {settings.UPLOAD_MAX_BYTES} bytes).",
+    )
+
+
+class UploadSizeLimitRoute(APIRoute):
+    """
+    Reject oversized request bodies before the multipart form is parsed:
+    first by the declared Content-Length, then by counting the bytes that
+    are actually received (chunked uploads have no Content-Length).
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+        limit = settings.UPLOAD_MAX_BYTES + MULTIPART_OVERHEAD_BYTES
+
+        async def handler(request: Request):
+            declared = request.headers.get("content-length")
+            if declared and declared.isdigit() and int(declared) > limit:
+                raise _payload_too_large()
+
+            received = 0
+            receive = request.receive
+
+            async def limited_receive():
+                nonlocal received
+                message = await receive()
+                if message["type"] == "http.request":
+                    received += len(message.get("body", b""))
+                    if received > limit:
+                        raise _payload_too_large()
+                return message
+
+            return await original_handler(Request(request.scope, limited_receive))
+
+        return handler
+
+
+router = APIRouter(route_class=UploadSizeLimitRoute)
 
 # 업로드된 이미지를 저장할 디렉터리 경로
 UPLOAD_DIRECTORY = Path("app/static/images/")
 # 디렉터리가 없으면 생성
 UPLOAD_DIRECTORY.mkdir(parents=True, exist_ok=True)
 
+# 리사이즈 기준 (가로 최대 1024px, 비율 유지) 및 WebP 품질
+MAX_WIDTH = 1024
+WEBP_QUALITY = 90
+
+
+def _discard(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _job_response(job: ImageJob) -> dict:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "file_path": job.context["file_path"] if job.status == "done" else None,
+        "error": job.error,
+    }
+
+
 @router.post("/")
 async def upload_image(  # 비동기 처리를 위해 async 추가
     file: UploadFile = File(...),
+    wait: bool = Query(True, description="false이면 변환 완료를 기다리지 않고 작업 ID를 즉시 반환"),
     current_user: models.User = Depends(deps.get_current_active_admin_user)
 ):
     """
     이미지 파일을 서버에 업로드합니다. (관리자 권한 필요)
-    
+
     업로드된 이미지는 WebP 포맷으로 변환되어 저장됩니다.
+    변환(디코딩/리사이즈/인코딩)은 별도 프로세스 풀에서 실행되어 이벤트 루프를 막지 않습니다.
     업로드 성공 시, 이미지에 접근할 수 있는 URL 경로를 반환합니다.
+    `wait=false`이면 202와 함께 작업 ID를 반환하며, `/upload/jobs/{job_id}`로 결과를 조회합니다.
     """
     # 이미지 파일인지 MIME 타입으로 확인
     if not file.content_type.startswith("image/"):
@@ -32,36 +109,59 @@ async def upload_image(  # 비동기 처리를 위해 async 추가
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Uploaded file is not an image.",
         )
-        
+
     # UUID를 사용하여 고유한 파일 이름 생성 (확장자는 항상 .webp)
     unique_filename = f"{uuid.uuid4()}.webp"
     file_path = UPLOAD_DIRECTORY / unique_filename
-    
+    public_path = f"/static/images/{unique_filename}"
+
+    tmp_path = None
     try:
-        # 파일을 메모리로 읽기 (shutil 대신)
-        contents = await file.read()
-        if not contents:
+        # 선언된 파일 크기가 한도를 넘으면 복사 전에 바로 거절
+        if file.size is not None and file.size > settings.UPLOAD_MAX_BYTES:
+            raise _payload_too_large()
+
+        # 파일 전체를 메모리에 올리지 않고, 청크 단위로 임시 파일에 복사 (크기 한도 초과 시 즉시 중단)
+        size = 0
+        with tempfile.NamedTemporaryFile(prefix="upload-", delete=False) as tmp:
+            tmp_path = tmp.name
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.UPLOAD_MAX_BYTES:
+                    raise _payload_too_large()
+                await run_in_threadpool(tmp.write, chunk)
+        if size == 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File is empty.",
             )
 
-        # PIL을 사용하여 메모리 상의 이미지 열기
-        img = Image.open(io.BytesIO(contents))
-
-        # 리사이즈 로직 추가 (가로 최대 1024px, 비율 유지)
-        MAX_WIDTH = 1024
-        if img.width > MAX_WIDTH:
-            aspect_ratio = img.height / float(img.width)
-            target_height = int(MAX_WIDTH * aspect_ratio)
-            img = img.resize((MAX_WIDTH, target_height), Image.Resampling.LANCZOS)
-        
-        # WebP 포맷으로 저장 (품질 90)
-        img.save(file_path, "WEBP", quality=90)
-            
+        # 변환 작업을 프로세스 풀에 제출 (임시 파일에 쓴 뒤 rename 하므로 원자적으로 저장됨)
+        job = image_jobs.submit(
+            convert_to_webp, tmp_path, str(file_path.resolve()), MAX_WIDTH, WEBP_QUALITY,
+            settings.UPLOAD_MAX_IMAGE_PIXELS,
+            file_path=public_path,
+        )
+        # 작업이 끝나면(성공/실패 무관) 업로드 원본 임시 파일을 삭제
+        source_path, tmp_path = tmp_path, None
+        job.future.add_done_callback(lambda _: _discard(source_path))
+        if not wait:
+            return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=_job_response(job))
+        await job.wait()
+
     except HTTPException as e:
         # HTTP 예외는 그대로 다시 발생시킴
         raise e
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many uploads are being processed. Please retry shortly.",
+        )
+    except Image.DecompressionBombError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Image resolution is too large (max {settings.UPLOAD_MAX_IMAGE_PIXELS} pixels).",
+        )
     except Exception as e:
         # PIL 처리 중 예외 발생 가능 (예: 손상된 이미지 파일)
         raise HTTPException(
@@ -69,8 +169,22 @@ async def upload_image(  # 비동기 처리를 위해 async 추가
             detail=f"Failed to process image: {str(e)}",
         )
     finally:
+        if tmp_path is not None:
+            _discard(tmp_path)
         # FastAPI의 UploadFile 객체를 닫아줌
         await file.close()
-        
+
     # 프론트엔드에서 사용할 수 있는 URL 경로 반환
-    return {"file_path": f"/static/images/{unique_filename}"}
+    return {"file_path": public_path}
+
+
+@router.get("/jobs/{job_id}")
+async def read_upload_job(
+    job_id: str,
+    current_user: models.User = Depends(deps.get_current_active_admin_user)
+):
+    """`wait=false`로 제출한 이미지 변환 작업의 상태와 결과 경로를 조회합니다. (관리자 권한 필요)"""
+    job = image_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+    return _job_response(job)
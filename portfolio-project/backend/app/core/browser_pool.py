@@ -0,0 +1,144 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from playwright.async_api import Browser, Page, Playwright, async_playwright
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+]
+
+
+class BrowserPoolTimeout(Exception):
+    """Raised when no browser slot becomes free within the acquire timeout."""
+
+
+class _BrowserSlot:
+    """One Chromium process plus the number of renders it has served."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.browser: Optional[Browser] = None
+        self.renders = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+
+class BrowserPool:
+    """
+    Long-lived pool of headless Chromium processes for PDF rendering.
+
+    Each slot serves one render at a time, so the pool size is also the
+    concurrency cap. Every render gets a fresh browser context (isolated
+    cookies/storage) which is closed afterwards. A browser is relaunched
+    after `max_renders` renders or as soon as it is found disconnected.
+    """
+
+    def __init__(self, size: int, max_renders: int, acquire_timeout: float):
+        self.size = max(1, size)
+        self.max_renders = max(1, max_renders)
+        self.acquire_timeout = acquire_timeout
+        self._playwright: Optional[Playwright] = None
+        self._slots: List[_BrowserSlot] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+        self._closed = False
+
+    async def start(self) -> None:
+        """Start Playwright and warm up every slot. Safe to call repeatedly."""
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            self._closed = False
+            self._playwright = await async_playwright().start()
+            self._slots = [_BrowserSlot(i) for i in range(self.size)]
+            self._idle = asyncio.Queue()
+            for slot in self._slots:
+                try:
+                    await self._launch(slot)
+                except Exception:
+                    # 워밍업 실패는 치명적이지 않음: 첫 사용 시 다시 launch 합니다.
+                    logger.exception("Failed to warm up browser slot %d", slot.index)
+                self._idle.put_nowait(slot)
+            logger.info("Browser pool started with %d slot(s)", self.size)
+
+    async def close(self) -> None:
+        """Close every browser and stop Playwright."""
+        async with self._start_lock:
+            self._closed = True
+            for slot in self._slots:
+                await self._shutdown(slot)
+            self._slots = []
+            self._idle = None
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception:
+                    logger.exception("Failed to stop Playwright")
+                self._playwright = None
+            logger.info("Browser pool closed")
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Borrow a browser slot and yield a new page in a fresh context."""
+        if self._idle is None:
+            await self.start()
+        if self._closed or self._idle is None:
+            raise RuntimeError("Browser pool is closed")
+
+        try:
+            slot = await asyncio.wait_for(self._idle.get(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            raise BrowserPoolTimeout("No browser available within %.1fs" % self.acquire_timeout)
+
+        context = None
+        try:
+            if not slot.alive:
+                await self._launch(slot)
+            context = await slot.browser.new_context()
+            page = await context.new_page()
+            yield page
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    logger.warning("Failed to close browser context on slot %d", slot.index)
+            slot.renders += 1
+            if not slot.alive or slot.renders >= self.max_renders:
+                # 크래시했거나 렌더 횟수를 초과한 브라우저는 재활용(종료 후 다음 사용 시 재기동)
+                logger.info("Recycling browser slot %d after %d render(s)", slot.index, slot.renders)
+                await self._shutdown(slot)
+            if self._idle is not None:
+                self._idle.put_nowait(slot)
+
+    async def _launch(self, slot: _BrowserSlot) -> None:
+        await self._shutdown(slot)
+        slot.browser = await self._playwright.chromium.launch(args=CHROMIUM_ARGS)
+        slot.renders = 0
+
+    async def _shutdown(self, slot: _BrowserSlot) -> None:
+        browser, slot.browser = slot.browser, None
+        slot.renders = 0
+        if browser is None:
+            return
+        try:
+            await browser.close()
+        except Exception:
+            logger.warning("Failed to close browser on slot %d", slot.index)
+
+
+browser_pool = BrowserPool(
+    size=settings.PDF_BROWSER_POOL_SIZE,
+    max_renders=settings.PDF_BROWSER_MAX_RENDERS,
+    acquire_timeout=settings.PDF_BROWSER_ACQUIRE_TIMEOUT,
+)
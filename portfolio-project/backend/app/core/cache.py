@@ -0,0 +1,175 @@
+import importlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache with optional item, byte and TTL limits.
+
+    * `max_items`: maximum number of entries (None = unlimited)
+    * `max_bytes`: maximum total size as measured by `sizeof` (None = unlimited)
+    * `ttl`: seconds after which an entry expires (None = never)
+
+    Hit/miss/eviction counters are kept so callers can size the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, Tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, size, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            # 예산보다 큰 항목은 저장하지 않습니다 (다른 항목을 모두 밀어내지 않도록).
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, size, expires_at)
+            self._bytes += size
+            while self._over_budget():
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "items": len(self._data),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _over_budget(self) -> bool:
+        if self.max_items is not None and len(self._data) > self.max_items:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+
+class CacheBackend(ABC):
+    """
+    Interface for the CRUD read-through cache (see `CRUDBase`).
+
+    Keys are strings such as ``"board:id:3"``; values are plain dicts of
+    column values (ints, strings, datetimes) or ids, so an external backend
+    (Redis, memcached, ...) only needs to serialize them, e.g. with pickle.
+    Backends must be safe to call from several threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expiry."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Counters used to size the cache (hits, misses, evictions, ...)."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process backend: an `LRUCache` bounded by item count and TTL."""
+
+    def __init__(self, *, max_items: int, ttl: Optional[float]):
+        self._lru = LRUCache(max_items=max_items, ttl=ttl)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._lru.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self._lru.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self._lru.delete(key)
+
+    def clear(self) -> None:
+        self._lru.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", **self._lru.stats()}
+
+
+def build_cache_backend(name: str, *, max_items: int, ttl: Optional[float]) -> Optional[CacheBackend]:
+    """
+    Create the backend selected by `name`:
+
+    * ``"memory"``: `InMemoryCacheBackend`
+    * ``"none"`` / ``""``: caching disabled (returns None)
+    * ``"package.module:ClassName"``: an external `CacheBackend` subclass,
+      constructed with the same ``max_items`` / ``ttl`` keyword arguments
+    """
+    if not name or name == "none":
+        return None
+    if name == "memory":
+        return InMemoryCacheBackend(max_items=max_items, ttl=ttl)
+    module_name, _, class_name = name.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown cache backend: {name!r}")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(backend_class, type) and issubclass(backend_class, CacheBackend)):
+        raise TypeError(f"{name!r} is not a CacheBackend subclass")
+    return backend_class(max_items=max_items, ttl=ttl)
@@ -14,6 +14,19 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 2  # 2시간 (기본값)
     ADMIN_SESSION_TIMEOUT_MINUTES: int = 30  # 관리자 세션 타임아웃 (30분)
+    # 인증 캐시: 검증된 토큰과 사용자 정보를 짧게 캐시하여 인증마다 JWT 검증/DB 조회를 반복하지 않습니다.
+    # 만료(exp)는 캐시 히트 때도 매번 확인하며, 사용자 정보는 CRUDUser.update 시 즉시 무효화됩니다.
+    AUTH_CACHE_TTL: float = 60  # 초
+    AUTH_CACHE_MAX_ITEMS: int = 1024
+
+    # Argon2 비밀번호 해시 비용 (값을 바꾸면 새로 만드는 해시에만 적용, 기존 해시는 그대로 검증됨)
+    ARGON2_TIME_COST: int = 3  # 반복 횟수
+    ARGON2_MEMORY_COST: int = 64 * 1024  # KiB 단위 (64 MiB). 해시 1회에 이만큼 메모리를 사용합니다.
+    ARGON2_PARALLELISM: int = 4
+    # 비밀번호 해시/검증 전용 스레드 풀 (요청 처리용 스레드 풀과 분리)
+    # 동시 메모리 사용량 = PASSWORD_HASH_WORKERS x ARGON2_MEMORY_COST
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32  # 대기+처리 중 작업이 이 수를 넘으면 503으로 즉시 거절
     # 개발 편의용: 애플리케이션 시작 시 DB를 자동으로 생성/초기화할지 여부
     # 프로덕션에서는 반드시 false로 두고 Alembic 마이그레이션을 사용하세요.
     INIT_DB: bool = False
@@ -39,10 +52,105 @@ class Settings(BaseSettings):
             f"{values.get('POSTGRES_SERVER')}/{values.get('POSTGRES_DB')}"
         )
 
+    # 비동기 엔진(asyncpg)용 접속 주소. 지정하지 않으면 DATABASE_URI의 드라이버만 asyncpg로 바꿔 사용합니다.
+    ASYNC_DATABASE_URI: Optional[str] = None
+
+    @field_validator("ASYNC_DATABASE_URI", mode='before')
+    @classmethod
+    def assemble_async_db_connection(cls, v: Optional[str], info) -> Any:
+        if isinstance(v, str):
+            return v
+
+        database_uri = info.data.get("DATABASE_URI") or ""
+        scheme, sep, rest = database_uri.partition("://")
+        return f"postgresql+asyncpg{sep}{rest}" if sep else database_uri
+
+    # DB 커넥션 풀 설정 (동기/비동기 엔진에 각각 적용)
+    # 동시에 DB를 사용할 수 있는 요청 수 = POOL_SIZE + MAX_OVERFLOW (엔진별). PostgreSQL max_connections보다 작게 유지하세요.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # 풀이 가득 찼을 때 연결을 기다리는 최대 시간 (초), 초과 시 TimeoutError
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(초)보다 오래된 연결은 재연결 (방화벽/프록시의 유휴 연결 끊김 대비)
+    DB_POOL_PRE_PING: bool = True  # checkout 시 연결이 살아 있는지 확인
+    # checkout 대기가 이 시간(초)을 넘으면 경고 로그를 남깁니다.
+    DB_POOL_SLOW_CHECKOUT_SECONDS: float = 0.5
+
+    # SQL 프로파일러 (개발/테스트용, 기본 꺼짐)
+    # 요청별로 쿼리(정규화 문장, 실행 시간, 호출 위치)를 기록하고 N+1 후보/느린 쿼리/쿼리 예산 초과를 로그로 남깁니다.
+    SQL_PROFILER_ENABLED: bool = False
+    SQL_SLOW_QUERY_SECONDS: float = 0.2  # 이 시간(초) 이상 걸린 쿼리는 느린 쿼리 로그(app.sql.slow)에 기록
+    SQL_SLOW_QUERY_LOG_FILE: Optional[str] = None  # 지정하면 느린 쿼리 로그를 이 파일에도 기록
+    SQL_N_PLUS_ONE_THRESHOLD: int = 3  # 한 요청에서 같은 문장이 이 횟수 이상 실행되면 N+1 후보로 경고
+    SQL_QUERY_BUDGET: int = 0  # 요청당 최대 쿼리 수 (0이면 사용 안 함)
+    SQL_QUERY_BUDGET_RAISE: bool = False  # 예산 초과 시 로그 대신 예외 발생 (테스트에서 사용)
+
+    # 사이트 공개 주소 (sitemap 등 절대 URL 생성에 사용)
+    SITE_URL: str = "https://portfolio.ywsung.ai.kr"
+    # sitemap 파일 하나에 담을 최대 URL 수 (프로토콜 한도 50,000). 넘으면 sitemap index + 분할 파일로 제공합니다.
+    SITEMAP_MAX_URLS: int = 50_000
+    # 렌더링된 sitemap 메모리 캐시 한도 (게시글이 바뀌면 버전이 달라져 자동으로 새로 생성)
+    SITEMAP_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # 게시글 검색 방식
+    # - "fulltext": PostgreSQL 전문 검색(tsvector + GIN 인덱스, ts_rank 정렬, ts_headline 스니펫)
+    # - "ilike": 제목/내용 부분 문자열 일치 (인덱스를 사용하지 못함, PostgreSQL 외 DB용)
+    BOARD_SEARCH_MODE: str = "fulltext"
+    # 게시글/목록/태그 응답의 Cache-Control max-age (초)
+    # 이 시간 동안은 nginx/브라우저 캐시가 바로 응답하고, 이후에는 ETag로 재검증(304)합니다.
+    BOARD_CACHE_MAX_AGE: int = 30
+    # 게시글 조회 응답의 직렬화 결과(JSON 바이트) 메모리 캐시 한도
+    # (게시글 ID + 수정 시각별로 저장하여, 바뀌지 않은 글은 스키마 검증과 JSON 인코딩을 건너뜀)
+    BOARD_JSON_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # 게시글 목록 API의 limit 최대값 (한 번에 너무 많은 글을 읽고 직렬화하지 않도록 제한)
+    BOARD_PAGE_MAX_LIMIT: int = 500
+
+    # 관리자 일괄 생성/수정/삭제 API의 요청당 최대 항목 수 (한 트랜잭션으로 처리)
+    BOARD_BULK_MAX_ITEMS: int = 500
+
+    # CRUD 조회 캐시 (게시글 ID/slug 조회 결과를 캐시하고, 생성/수정/삭제 시 자동으로 무효화)
+    # - "memory": 프로세스 내 LRU 캐시 (워커가 하나일 때 적합)
+    # - "none": 캐시 사용 안 함
+    # - "패키지.모듈:클래스명": CacheBackend를 구현한 외부 캐시 (Redis 등, 워커 간 공유)
+    #   사용자 인증 캐시(AUTH_CACHE_*)도 같은 백엔드를 사용합니다. 사용자 행은 hashed_password를 빼고 저장하지만
+    #   사용자 이름과 관리자 여부는 캐시에 남으므로, 외부 캐시는 DB와 같은 수준으로 접근을 제한해야 합니다.
+    CRUD_CACHE_BACKEND: str = "memory"
+    CRUD_CACHE_MAX_ITEMS: int = 1024
+    CRUD_CACHE_TTL: float = 300  # 5분 (다른 프로세스에서 DB를 직접 수정한 경우의 최대 지연)
+
     # ✅ 수정: CORS 설정을 모든 주소('*')에서 오는 요청을 허용하도록 변경
     # 실제 프로덕션 환경에서는 보안을 위해 특정 도메인 주소만 명시하는 것이 좋습니다.
     BACKEND_CORS_ORIGINS: List[str] = ["*"]
 
+    # PDF 생성용 Chromium 브라우저 풀 설정
+    # 풀 크기 = 동시에 렌더링할 수 있는 PDF 수 (브라우저 1개당 수백 MB 메모리 사용)
+    PDF_BROWSER_POOL_SIZE: int = 2
+    # 브라우저 하나가 이 횟수만큼 렌더링하면 재시작하여 메모리 누수를 방지합니다.
+    PDF_BROWSER_MAX_RENDERS: int = 50
+    # 모든 브라우저가 사용 중일 때 대기할 최대 시간 (초)
+    PDF_BROWSER_ACQUIRE_TIMEOUT: float = 30.0
+
+    # 렌더링된 PDF 디스크 캐시 (동일한 HTML/옵션이면 Playwright 없이 바로 반환)
+    PDF_CACHE_DIR: str = "/tmp/portfolio_pdf_cache"
+    PDF_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # 512 MB
+
+    # PDF에 인라인할 원격 이미지 다운로드 설정
+    PDF_IMAGE_FETCH_CONCURRENCY: int = 8  # 동시 다운로드 수 (= 커넥션 풀 크기)
+    PDF_IMAGE_FETCH_TIMEOUT: float = 10.0  # URL 하나당 최대 대기 시간 (초)
+    PDF_IMAGE_MAX_BYTES: int = 10 * 1024 * 1024  # 이미지 1개 최대 크기
+    PDF_IMAGE_FETCH_MAX_TOTAL_BYTES: int = 50 * 1024 * 1024  # 요청 1건당 총 다운로드 한도
+    PDF_IMAGE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 리사이즈된 이미지 메모리 캐시 한도
+    PDF_IMAGE_CACHE_TTL: float = 60 * 60  # 1시간
+    # /static 이미지를 data URI로 변환한 결과의 메모리 캐시 한도
+    PDF_STATIC_IMAGE_CACHE_MAX_BYTES: int = 128 * 1024 * 1024
+
+    # 업로드 이미지 변환(WebP) 전용 프로세스 풀 설정
+    UPLOAD_IMAGE_WORKERS: int = 2  # 동시에 변환할 수 있는 이미지 수 (CPU 코어 수 이하 권장)
+    UPLOAD_IMAGE_MAX_PENDING: int = 16  # 대기+처리 중 작업이 이 수를 넘으면 503으로 즉시 거절
+    # 업로드 파일 최대 크기 (nginx의 client_max_body_size와 맞춰 주세요)
+    UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+    # 디코딩을 허용하는 최대 픽셀 수 (압축 폭탄 방지, 약 64MP)
+    UPLOAD_MAX_IMAGE_PIXELS: int = 64_000_000
+
     class Config:
         case_sensitive = True
         env_file = ".env"
@@ -0,0 +1,98 @@
+"""
+HTTP conditional request helpers (ETag / Last-Modified / 304 Not Modified).
+
+Endpoints compute a cheap version for the resource (a row timestamp or a
+collection version) *before* loading and serializing the body, so a
+revalidation from a repeat visitor, crawler or nginx costs one small query.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the given version parts (order matters)."""
+    digest = hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match는 약한 비교(W/ 접두어 무시)를 사용합니다. (RFC 9110 13.1.2)
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP 날짜는 초 단위이므로 마이크로초를 버리고 비교합니다.
+    return last_modified.replace(microsecond=0) <= since
+
+
+def cache_headers(
+    etag: str, last_modified: Optional[datetime] = None, max_age: Optional[int] = None
+) -> dict:
+    """ETag / Last-Modified / Cache-Control response headers for a public resource."""
+    if max_age is None:
+        max_age = settings.BOARD_CACHE_MAX_AGE
+    headers = {
+        "ETag": etag,
+        # max-age 동안은 nginx/브라우저가 바로 응답하고, 이후에는 ETag로 재검증합니다.
+        "Cache-Control": f"public, max-age={max_age}, must-revalidate",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = _http_date(last_modified)
+    return headers
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    *,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    use_last_modified: bool = True,
+    max_age: Optional[int] = None,
+) -> Optional[Response]:
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current version.
+
+    Returns a 304 response when the client's copy is still fresh; otherwise
+    sets the caching headers on `response` and returns None so the endpoint
+    goes on to build the body. If-None-Match takes precedence over
+    If-Modified-Since. Pass `use_last_modified=False` when the timestamp
+    cannot see every change (e.g. deletions from a collection); the header
+    is still sent, but only the ETag decides freshness.
+    """
+    headers = cache_headers(etag, last_modified, max_age)
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    elif if_modified_since and last_modified is not None and use_last_modified:
+        fresh = _not_modified_since(if_modified_since, last_modified)
+    else:
+        fresh = False
+    if fresh:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,145 @@
+import asyncio
+import base64
+import logging
+import re
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import httpx
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ImageTransform = Callable[[bytes], Tuple[bytes, str]]
+
+
+class _ByteBudget:
+    """Total number of bytes a single `fetch_many` call may download."""
+
+    def __init__(self, limit: int):
+        self.remaining = limit
+
+    def take(self, size: int) -> bool:
+        if size > self.remaining:
+            self.remaining = 0
+            return False
+        self.remaining -= size
+        return True
+
+
+class RemoteImageFetcher:
+    """
+    Download remote images concurrently over a shared, pooled HTTP client and
+    turn them into `data:` URIs.
+
+    * at most `max_concurrency` downloads run at once
+    * each URL gets `timeout` seconds in total (connect + body)
+    * a single image may not exceed `max_image_bytes`, and one batch may not
+      download more than `max_total_bytes`
+    * transformed results are cached across requests (`cache_bytes`, `cache_ttl`)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        timeout: float,
+        max_image_bytes: int,
+        max_total_bytes: int,
+        cache_bytes: int,
+        cache_ttl: float,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.max_image_bytes = max_image_bytes
+        self.max_total_bytes = max_total_bytes
+        self.cache = LRUCache(max_bytes=cache_bytes, ttl=cache_ttl)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch_many(self, urls: Iterable[str], transform: ImageTransform) -> Dict[str, str]:
+        """
+        Fetch every http(s) URL and return `{url: data_uri}` for the ones that succeeded.
+        `transform(data) -> (data, mime)` runs in a worker thread (e.g. resizing).
+        """
+        unique_urls = []
+        for url in dict.fromkeys(urls):
+            if not re.match(r'^https?://', url):
+                logger.warning('Skipping non-http url for remote fetch: %s', url)
+                continue
+            unique_urls.append(url)
+
+        results: Dict[str, str] = {}
+        pending = []
+        for url in unique_urls:
+            cached = self.cache.get(url)
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append(url)
+        if not pending:
+            return results
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        budget = _ByteBudget(self.max_total_bytes)
+
+        async def _one(url: str) -> None:
+            async with semaphore:
+                try:
+                    data = await asyncio.wait_for(self._download(url, budget), timeout=self.timeout)
+                    data, mime = await asyncio.to_thread(transform, data)
+                except Exception as e:
+                    logger.warning('Failed to fetch remote image %s: %s', url, e)
+                    return
+            data_uri = f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+            self.cache.set(url, data_uri)
+            results[url] = data_uri
+            logger.info('Inlined remote image %s (%d bytes)', url, len(data))
+
+        await asyncio.gather(*(_one(url) for url in pending))
+        return results
+
+    async def _download(self, url: str, budget: _ByteBudget) -> bytes:
+        client = self._get_client()
+        async with client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            declared = resp.headers.get("content-length")
+            if declared and declared.isdigit() and int(declared) > self.max_image_bytes:
+                raise ValueError(f"image too large ({declared} bytes)")
+            chunks = []
+            size = 0
+            async for chunk in resp.aiter_bytes():
+                size += len(chunk)
+                if size > self.max_image_bytes:
+                    raise ValueError(f"image exceeds {self.max_image_bytes} bytes")
+                if not budget.take(len(chunk)):
+                    raise ValueError("total remote image budget exhausted")
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+
+remote_image_fetcher = RemoteImageFetcher(
+    max_concurrency=settings.PDF_IMAGE_FETCH_CONCURRENCY,
+    timeout=settings.PDF_IMAGE_FETCH_TIMEOUT,
+    max_image_bytes=settings.PDF_IMAGE_MAX_BYTES,
+    max_total_bytes=settings.PDF_IMAGE_FETCH_MAX_TOTAL_BYTES,
+    cache_bytes=settings.PDF_IMAGE_CACHE_MAX_BYTES,
+    cache_ttl=settings.PDF_IMAGE_CACHE_TTL,
+)
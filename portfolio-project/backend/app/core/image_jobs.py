@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import multiprocessing
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFull(Exception):
+    """Raised when too many image jobs are already queued or running."""
+
+
+class ImageJob:
+    """Handle for one image transform submitted to the worker processes."""
+
+    def __init__(self, future: "asyncio.Future[Any]", context: Dict[str, Any]):
+        self.id = uuid.uuid4().hex
+        self.future = future
+        self.context = context
+
+    @property
+    def status(self) -> str:
+        if not self.future.done():
+            return "pending"
+        if self.future.cancelled() or self.future.exception() is not None:
+            return "failed"
+        return "done"
+
+    @property
+    def error(self) -> Optional[str]:
+        if self.future.done() and not self.future.cancelled() and self.future.exception() is not None:
+            return str(self.future.exception())
+        return None
+
+    async def wait(self) -> Any:
+        # shield: 클라이언트 연결이 끊겨도 이미 시작한 변환 작업은 끝까지 수행합니다.
+        return await asyncio.shield(self.future)
+
+
+class ImageJobQueue:
+    """
+    Bounded process pool for CPU-heavy image work.
+
+    At most `max_workers` transforms run in parallel on other cores and at
+    most `max_pending` may be queued or running at once; beyond that
+    `submit` fails fast with `JobQueueFull`. The last `keep_finished` jobs
+    stay addressable by id so clients can poll for their result.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, keep_finished: int = 256):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.keep_finished = keep_finished
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs: "OrderedDict[str, ImageJob]" = OrderedDict()
+        self._pending = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # fork는 이벤트 루프/스레드 상태까지 복제하므로 spawn으로 깨끗한 워커를 띄웁니다.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **context: Any) -> ImageJob:
+        if self._pending >= self.max_pending:
+            raise JobQueueFull("Too many image jobs in progress")
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), fn, *args)
+        job = ImageJob(future, context)
+        self._pending += 1
+        future.add_done_callback(self._on_done)
+
+        self._jobs[job.id] = job
+        while len(self._jobs) > self.keep_finished:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if not oldest.future.done():
+                break
+            del self._jobs[oldest_id]
+        return job
+
+    def get(self, job_id: str) -> Optional[ImageJob]:
+        return self._jobs.get(job_id)
+
+    def _on_done(self, future: "asyncio.Future[Any]") -> None:
+        self._pending -= 1
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning("Image job failed: %s", future.exception())
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+image_jobs = ImageJobQueue(
+    max_workers=settings.UPLOAD_IMAGE_WORKERS,
+    max_pending=settings.UPLOAD_IMAGE_MAX_PENDING,
+)
@@ -0,0 +1,57 @@
+"""
+CPU-heavy image transforms executed in worker processes.
+
+Keep this module free of app settings/DB imports: it is imported by every
+process-pool worker and should stay cheap to load.
+"""
+import math
+import os
+import uuid
+from typing import Tuple
+
+from PIL import Image
+
+
+def convert_to_webp(
+    source_path: str, destination: str, max_width: int, quality: int, max_pixels: int
+) -> Tuple[int, int]:
+    """
+    Decode the image at `source_path`, shrink it to `max_width` (keeping the
+    aspect ratio) and write it to `destination` as WebP. The file is written
+    to a temporary name in the same directory and renamed, so readers never
+    see a partial image. Returns the final (width, height).
+
+    Images above `max_pixels` are rejected before any pixel data is decoded,
+    and JPEGs are decoded directly at a reduced scale (1/2, 1/4, 1/8) when
+    they are much wider than `max_width`, which keeps peak memory bounded.
+    """
+    # 압축 폭탄 방지: PIL은 MAX_IMAGE_PIXELS의 2배를 넘을 때만 에러를 내므로 직접 검사합니다.
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    with Image.open(source_path) as img:
+        if img.width * img.height > max_pixels:
+            raise Image.DecompressionBombError(
+                f"Image size ({img.width}x{img.height}) exceeds limit of {max_pixels} pixels"
+            )
+
+        if img.width > max_width:
+            # JPEG는 DCT 스케일링으로 목표 크기에 가까운 해상도로만 디코딩합니다 (그 외 포맷은 무시됨).
+            img.draft(img.mode, (max_width, math.ceil(max_width * img.height / img.width)))
+
+        # 리사이즈 로직 (가로 최대 max_width px, 비율 유지)
+        if img.width > max_width:
+            aspect_ratio = img.height / float(img.width)
+            target_height = int(max_width * aspect_ratio)
+            result = img.resize((max_width, target_height), Image.Resampling.LANCZOS)
+        else:
+            img.load()
+            result = img
+
+        tmp_path = f"{destination}.{uuid.uuid4().hex}.tmp"
+        try:
+            result.save(tmp_path, "WEBP", quality=quality)
+            os.replace(tmp_path, destination)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return result.size
@@ -0,0 +1,280 @@
+"""
+In-process request metrics exposed in the Prometheus text format.
+
+`MetricsMiddleware` records per-route latency histograms, status counts and
+in-flight requests. `instrument_queries()` hooks an engine's cursor events
+so the queries and DB time spent by the current request are counted
+through a context variable (sync endpoints run in the thread pool with a
+copy of the request context, and `AsyncSession.run_sync` stays in the
+request task, so both engines report to the right request).
+"""
+import bisect
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# 라우트에 매칭되지 않은 요청(404 스캐너 등)은 경로별로 나누지 않습니다. (레이블 폭증 방지)
+UNMATCHED_ROUTE = "<unmatched>"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+class _RequestStats:
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+_current_request: ContextVar[Optional[_RequestStats]] = ContextVar("metrics_request", default=None)
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        # 레이블 값 -> (버킷별 개수, 합계, 전체 개수)
+        self._series: Dict[LabelValues, List] = {}
+
+    def observe(self, label_values: LabelValues, value: float) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * len(self.buckets), 0.0, 0]
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series[0][index] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for label_values, (counts, total, count) in sorted(self._series.items()):
+            labels = _format_labels(self.labels, label_values)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{_with_le(labels, _format_value(bound))} {cumulative}')
+            lines.append(f'{self.name}_bucket{_with_le(labels, "+Inf")} {count}')
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, label_values: LabelValues, amount: float = 1) -> None:
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}")
+        return lines
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: LabelValues) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _with_le(labels: str, bound: str) -> str:
+    le = f'le="{bound}"'
+    return "{" + le + "}" if not labels else labels[:-1] + "," + le + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """All request metrics. Updates and rendering are serialized by one lock."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.request_duration = Histogram(
+            "http_request_duration_seconds",
+            "Request latency by route, from the first ASGI event to the end of the response body.",
+            ("method", "route", "group"),
+            LATENCY_BUCKETS,
+        )
+        self.requests = Counter(
+            "http_requests_total", "Requests by route and response status.",
+            ("method", "route", "group", "status"),
+        )
+        self.db_queries = Histogram(
+            "http_request_db_queries",
+            "SQL statements executed per request.",
+            ("method", "route", "group"),
+            QUERY_COUNT_BUCKETS,
+        )
+        self.db_duration = Counter(
+            "http_request_db_duration_seconds_total",
+            "Time spent executing SQL statements, summed per route.",
+            ("method", "route", "group"),
+        )
+        self.untracked_queries = Counter(
+            "db_queries_outside_request_total",
+            "SQL statements executed outside an HTTP request (startup, background streams).",
+            (),
+        )
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(
+        self, labels: LabelValues, status: int, seconds: float, stats: _RequestStats
+    ) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.request_duration.observe(labels, seconds)
+            self.requests.inc(labels + (str(status),))
+            self.db_queries.observe(labels, stats.queries)
+            self.db_duration.inc(labels, stats.db_seconds)
+
+    def query_outside_request(self) -> None:
+        with self._lock:
+            self.untracked_queries.inc(())
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [
+                "# HELP http_requests_in_flight Requests currently being processed.",
+                "# TYPE http_requests_in_flight gauge",
+                f"http_requests_in_flight {self.in_flight}",
+            ]
+            for metric in (
+                self.request_duration, self.requests, self.db_queries,
+                self.db_duration, self.untracked_queries,
+            ):
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+def _route_group(route: str, query_string: bytes) -> str:
+    """PDF/업로드/검색 요청을 별도로 집계하기 위한 그룹 레이블"""
+    if "/pdf/" in route:
+        return "pdf"
+    if "/upload/" in route:
+        return "upload"
+    # 검색은 게시글 목록 API에 search 파라미터를 붙인 요청입니다.
+    if "/board/" in route and (query_string.startswith(b"search=") or b"&search=" in query_string):
+        return "search"
+    if route.startswith("/static"):
+        return "static"
+    return "api"
+
+
+_PATH_PARAM = re.compile(r"{([^}:]+)(?::[^}]+)?}")
+
+
+def _route_template(scope, initial_root_path: str) -> str:
+    """
+    매칭된 라우트의 전체 경로 템플릿(/api/v1/board/{post_id})을 구합니다. ID별로 레이블이 나뉘지 않게 합니다.
+    include_router로 포함된 라우트는 자신의 경로(/{post_id})만 알고 있으므로,
+    실제 요청 경로에서 그 부분을 떼어 낸 나머지를 접두어로 붙입니다.
+    """
+    route = scope.get("route")
+    route_path = getattr(route, "path", None)
+    if route_path is None:
+        # Mount(/static 등)는 route를 남기지 않고 root_path에 매칭된 접두어를 더합니다.
+        mounted = scope.get("root_path", "")[len(initial_root_path):]
+        return mounted or UNMATCHED_ROUTE
+
+    path_params = scope.get("path_params", {})
+    concrete = _PATH_PARAM.sub(lambda m: str(path_params.get(m.group(1), m.group(0))), route_path)
+    request_path = scope["path"]
+    if request_path.endswith(concrete):
+        return request_path[: len(request_path) - len(concrete)] + route_path
+    return route_path
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware) so streaming responses are
+    timed until their last body chunk and are not buffered.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        initial_root_path = scope.get("root_path", "")
+        stats = _RequestStats()
+        token = _current_request.set(stats)
+        status_code = 500
+        started = time.perf_counter()
+        self.registry.request_started()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _current_request.reset(token)
+            route_path = _route_template(scope, initial_root_path)
+            group = _route_group(route_path, scope.get("query_string", b""))
+            self.registry.request_finished(
+                (scope["method"], route_path, group), status_code, elapsed, stats
+            )
+
+
+def instrument_queries(engine: Engine, registry: MetricsRegistry = metrics) -> None:
+    """엔진의 cursor 실행 이벤트로 현재 요청의 쿼리 수와 DB 시간을 집계합니다."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["metrics_query_start"].pop()
+        stats = _current_request.get()
+        if stats is None:
+            registry.query_outside_request()
+            return
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리합니다.
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("metrics_query_start"):
+            conn.info["metrics_query_start"].pop()
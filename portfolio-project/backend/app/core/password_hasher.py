@@ -0,0 +1,112 @@
+import asyncio
+import secrets
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password hash/verify jobs are already queued or running."""
+
+
+class PasswordHasher:
+    """
+    Bounded thread pool for Argon2 hashing and verification.
+
+    argon2-cffi releases the GIL while hashing, so a few dedicated threads
+    run hashes in parallel without touching the shared request thread pool.
+    At most `max_pending` jobs may be queued or running at once; beyond that
+    calls fail fast with `PasswordHasherBusy` instead of queueing a login
+    burst in front of every other request.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._dummy_hash: Optional[str] = None
+        self._lock = threading.Lock()
+        # _pending은 작업 스레드의 완료 콜백에서도 줄어듭니다.
+        self._pending_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    def _release(self, _future: Optional[Future] = None) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._pending_lock:
+            if self._pending >= self.max_pending:
+                raise PasswordHasherBusy("Too many password checks in progress")
+            self._pending += 1
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        # 요청이 취소(클라이언트 연결 끊김, 타임아웃)되어도 이미 시작된 해시는 스레드에서 계속 실행되므로,
+        # 대기 중인 코루틴이 아니라 작업이 실제로 끝날 때(또는 시작 전에 취소될 때) 카운터를 줄입니다.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _get_dummy_hash(self) -> str:
+        # 현재 Argon2 설정으로 만든 해시여야 실제 검증과 소요 시간이 같아집니다.
+        with self._lock:
+            if self._dummy_hash is None:
+                self._dummy_hash = get_password_hash(secrets.token_urlsafe(32))
+            return self._dummy_hash
+
+    def _verify_dummy(self, password: str) -> bool:
+        verify_password(password, self._get_dummy_hash())
+        return False
+
+    async def warm_up(self) -> None:
+        """더미 해시를 미리 만들어, 첫 번째 '없는 사용자' 로그인만 두 배로 느려지는 일을 막습니다."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._get_executor(), self._get_dummy_hash)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: Optional[str]) -> bool:
+        """
+        비밀번호를 검증합니다. `hashed_password`가 None(존재하지 않는 사용자)이어도
+        더미 해시로 같은 비용의 검증을 수행하고 False를 반환하여, 응답 시간으로 사용자 존재 여부를 알 수 없게 합니다.
+        """
+        if hashed_password is None:
+            return await self._run(self._verify_dummy, password)
+        return await self._run(verify_password, password, hashed_password)
+
+    def verify_sync(self, password: str, hashed_password: Optional[str]) -> bool:
+        """스크립트 등 동기 코드용. 호출한 스레드에서 바로 검증합니다."""
+        if hashed_password is None:
+            return self._verify_dummy(password)
+        return verify_password(password, hashed_password)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
@@ -0,0 +1,146 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_html(html: str) -> str:
+    """Normalize insignificant differences (line endings, outer whitespace) before hashing."""
+    return html.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+class PdfRenderCache:
+    """
+    Content-addressed on-disk cache for rendered PDFs.
+
+    Files are stored as `<sha256>.pdf` under `directory`. The LRU order is kept
+    in memory and seeded from file mtimes at startup, so the cache survives
+    restarts. When the total size exceeds `max_bytes`, least recently used
+    files are deleted. Concurrent renders of the same key are coalesced: only
+    the first caller renders, the others await its result.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def make_key(*, html: Optional[str], url: Optional[str], options: Dict[str, Any]) -> str:
+        # 렌더링과 같은 규칙: url이 있으면 url을 열고, 없을 때만 html을 사용합니다.
+        source = {"url": url.strip()} if url else {"html": normalize_html(html or "")}
+        raw = json.dumps({"source": source, "options": options}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pdf"
+
+    def _load_index(self) -> None:
+        if self._loaded:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for path in self.directory.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        self._loaded = True
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            self._load_index()
+            if key not in self._index:
+                return None
+            self._index.move_to_end(key)
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            # mtime을 갱신해 재시작 후에도 LRU 순서가 유지되도록 합니다.
+            os.utime(path)
+            return data
+        except OSError:
+            with self._lock:
+                self._total_bytes -= self._index.pop(key, 0)
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        with self._lock:
+            self._load_index()
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            self._total_bytes += len(data) - self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logger.warning("Could not evict cached PDF %s", key)
+
+    async def get_or_render(self, key: str, render: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Return cached bytes for `key`, or render once and share the result with concurrent callers."""
+        data = await asyncio.to_thread(self.get, key)
+        if data is not None:
+            return data
+
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 먼저 렌더링하던 요청이 취소된 경우에만 직접 렌더링을 이어받습니다.
+                if not inflight.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await render()
+            # 디스크에 저장한 뒤에 in-flight 항목을 지웁니다. 그 사이에 온 같은 요청은 이 결과를 기다리므로
+            # 캐시와 in-flight를 모두 놓쳐 다시 렌더링하는 구간이 없습니다.
+            try:
+                await asyncio.to_thread(self.put, key, data)
+            except OSError:
+                logger.warning("Could not store rendered PDF in cache", exc_info=True)
+            future.set_result(data)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # 대기 중인 요청이 없으면 "exception was never retrieved" 경고를 막습니다.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        return data
+
+
+pdf_cache = PdfRenderCache(settings.PDF_CACHE_DIR, settings.PDF_CACHE_MAX_BYTES)
@@ -12,7 +12,14 @@ from app.core.config import settings
 # 1. 새로운 기본 알고리즘으로 argon2를 지정합니다.
 # 2. bcrypt는 기존 비밀번호 검증을 위해 남겨둡니다 (deprecated="auto").
 #    이렇게 하면 passlib이 알아서 기존 bcrypt 해시를 인식하고 검증해줍니다.
-pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
+# 3. Argon2 비용 파라미터는 Settings에서 조정합니다.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
 
 # --- [수정된 부분 끝] ---
 
@@ -0,0 +1,69 @@
+"""
+Cached JSON serialization for ORM rows returned by read endpoints.
+
+FastAPI validates every returned object against the response model
+(`from_attributes`) and then encodes it, on every request. For list pages
+with long post bodies that dominates CPU time. `SerializedModelCache` keeps
+the JSON bytes of each row per (schema, id, revision), where the revision is
+`updated_at` (or `created_at` for rows that were never updated), so an
+unchanged post is validated and encoded once and later responses only join
+cached bytes.
+
+Rows carrying per-request data (a search `snippet`) are serialized but
+never cached.
+"""
+from datetime import datetime
+from typing import Any, Hashable, Iterable, Optional, Type
+
+from pydantic import BaseModel
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+
+def _revision(obj: Any) -> Optional[datetime]:
+    return getattr(obj, "updated_at", None) or getattr(obj, "created_at", None)
+
+
+class SerializedModelCache:
+    """JSON bytes of ORM rows keyed by (schema, id, revision), bounded by total size."""
+
+    def __init__(self, *, max_bytes: int, ttl: Optional[float]):
+        self.cache = LRUCache(max_bytes=max_bytes, ttl=ttl)
+
+    def _key(self, obj: Any, schema: Type[BaseModel]) -> Optional[Hashable]:
+        # 검색 결과처럼 요청마다 달라지는 값이 있거나 버전을 알 수 없는 행은 캐시하지 않습니다.
+        if getattr(obj, "snippet", None) is not None:
+            return None
+        revision = _revision(obj)
+        if revision is None:
+            return None
+        return (schema.__name__, obj.id, revision)
+
+    def dumps(self, obj: Any, schema: Type[BaseModel]) -> bytes:
+        """객체 하나를 schema 형식의 JSON으로 직렬화합니다. (같은 버전이면 캐시된 바이트를 그대로 반환)"""
+        key = self._key(obj, schema)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        data = schema.model_validate(obj).model_dump_json().encode()
+        if key is not None:
+            self.cache.set(key, data)
+        return data
+
+    def dumps_list(self, objs: Iterable[Any], schema: Type[BaseModel]) -> bytes:
+        return b"[" + b",".join(self.dumps(obj, schema) for obj in objs) + b"]"
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self):
+        return self.cache.stats()
+
+
+# 게시글 조회 응답 캐시. 수정되면 updated_at이 바뀌어 새 키로 저장되고, 이전 버전은 LRU로 밀려납니다.
+# DB를 직접 수정해 updated_at이 바뀌지 않은 경우에도 TTL이 지나면 다시 직렬화합니다.
+post_json_cache = SerializedModelCache(
+    max_bytes=settings.BOARD_JSON_CACHE_MAX_BYTES, ttl=settings.CRUD_CACHE_TTL
+)
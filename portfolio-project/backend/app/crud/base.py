@@ -1,26 +1,92 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from collections import defaultdict
+from typing import Any, Dict, Generic, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import column, delete, insert, inspect, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from app.core.cache import CacheBackend, build_cache_backend
+from app.core.config import settings
 from app.db.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# CRUD 클래스들이 공유하는 조회 캐시 (CRUD_CACHE_BACKEND="none"이면 None)
+crud_cache = build_cache_backend(
+    settings.CRUD_CACHE_BACKEND,
+    max_items=settings.CRUD_CACHE_MAX_ITEMS,
+    ttl=settings.CRUD_CACHE_TTL,
+)
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
-    def __init__(self, model: Type[ModelType]):
+    # 조회 캐시에 저장하지 않을 컬럼 (외부 캐시 백엔드에 남으면 안 되는 값). 캐시 히트 후 접근하면 지연 로딩됩니다.
+    cache_exclude: Tuple[str, ...] = ()
+
+    def __init__(self, model: Type[ModelType], cache: Optional[CacheBackend] = None):
         """
         CRUD object with default methods to Create, Read, Update, Delete (CRUD).
         **Parameters**
         * `model`: A SQLAlchemy model class
+        * `cache`: Optional read-through cache for `get` (and subclass lookups).
+          Entries are invalidated by `create`, `update` and `remove`.
         """
         self.model = model
+        self.cache = cache
+
+    # --- 조회 캐시 ---
+    # 캐시에는 ORM 객체 대신 컬럼 값 dict를 저장하고, 히트 시 세션에 다시 붙여(merge) 반환합니다.
+    # 외부 캐시 백엔드도 직렬화만 하면 되며, 반환된 객체는 DB에서 읽은 것과 똑같이 수정/삭제할 수 있습니다.
+
+    def _cache_key(self, *parts: Any) -> str:
+        return ":".join([self.model.__tablename__, *map(str, parts)])
+
+    def _cache_keys(self, obj: ModelType) -> List[str]:
+        """객체가 바뀌거나 삭제될 때 무효화할 키 목록 (하위 클래스에서 조회 조건별 키를 추가)"""
+        return [self._cache_key("id", obj.id)]
+
+    def _cache_get(self, db: Session, key: str) -> Optional[ModelType]:
+        if self.cache is None:
+            return None
+        data = self.cache.get(key)
+        if data is None:
+            return None
+        obj = self.model(**data)
+        # 방금 DB에서 읽은 것처럼 깨끗한 상태로 만든 뒤, 조회 쿼리 없이 세션에 연결합니다.
+        make_transient_to_detached(obj)
+        return db.merge(obj, load=False)
+
+    def _cache_set(self, key: str, obj: ModelType) -> None:
+        if self.cache is None:
+            return
+        # deferred 컬럼(예: search_vector)은 읽지 않으며, 필요하면 히트 후 지연 로딩됩니다.
+        mapper = inspect(obj).mapper
+        data = {
+            attr.key: getattr(obj, attr.key)
+            for attr in mapper.column_attrs
+            if not attr.deferred and attr.key not in self.cache_exclude
+        }
+        self.cache.set(key, data)
+
+    def _cache_invalidate(self, keys: Iterable[str]) -> None:
+        if self.cache is None:
+            return
+        for key in set(keys):
+            self.cache.delete(key)
 
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
-        return db.query(self.model).filter(self.model.id == id).first()
+        key = self._cache_key("id", id)
+        cached = self._cache_get(db, key)
+        if cached is not None:
+            return cached
+        obj = db.query(self.model).filter(self.model.id == id).first()
+        if obj is not None:
+            self._cache_set(key, obj)
+        return obj
 
     def get_multi(
         self, db: Session, *, skip: int = 0, limit: int = 100
@@ -33,6 +99,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        self._cache_invalidate(self._cache_keys(db_obj))
         return db_obj
 
     def update(
@@ -42,22 +109,156 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
-        obj_data = jsonable_encoder(db_obj)
+        # 변경 전 키(예: 이전 slug)도 무효화해야 하므로 먼저 기록합니다.
+        stale_keys = self._cache_keys(db_obj)
+        # 컬럼 속성만 갱신 대상으로 봅니다. (로드된 관계까지 직렬화하면 양방향 관계에서 순환이 생김)
+        obj_fields = [attr.key for attr in inspect(db_obj).mapper.column_attrs]
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
-        for field in obj_data:
+        for field in obj_fields:
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        self._cache_invalidate(stale_keys + self._cache_keys(db_obj))
         return db_obj
 
     def remove(self, db: Session, *, id: int) -> Optional[ModelType]:
-        obj = db.query(self.model).filter(self.model.id == id).first()
+        # 방금 조회해 세션에 있는 객체면 다시 SELECT하지 않습니다. (get_by_id_or_slug 후 remove)
+        obj = db.get(self.model, id)
         if obj:
             db.delete(obj)
             db.commit()
+            self._cache_invalidate(self._cache_keys(obj))
         return obj
+
+    # --- 일괄 처리 ---
+    # 여러 객체를 한 트랜잭션(커밋 1회)에서 INSERT/UPDATE/DELETE ... RETURNING으로 처리합니다.
+    # RETURNING으로 최신 값을 받으므로 객체별 refresh SELECT가 없습니다.
+
+    def _commit_keep_loaded(self, db: Session) -> None:
+        """커밋 후 객체를 만료시키지 않습니다. (만료되면 객체마다 refresh SELECT가 발생)"""
+        expire_on_commit = db.expire_on_commit
+        db.expire_on_commit = False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = expire_on_commit
+
+    def _insert_rows(self, db: Session, rows: List[Dict[str, Any]]) -> List[ModelType]:
+        if not rows:
+            return []
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        return list(db.scalars(stmt, rows).all())
+
+    def _update_rows(self, db: Session, rows: List[Dict[str, Any]]) -> List[ModelType]:
+        """
+        `{"id": ..., 컬럼: 값}` 목록을 갱신합니다. 바꾸는 컬럼 조합이 같은 행끼리 묶어
+        `UPDATE ... FROM (VALUES ...) WHERE id = data.id RETURNING *` 한 번으로 처리합니다.
+        """
+        table = self.model.__table__
+        groups: Dict[tuple, List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            groups[tuple(sorted(key for key in row if key != "id"))].append(row)
+
+        updated: Dict[Any, ModelType] = {}
+        for fields, group in groups.items():
+            if not fields:
+                continue
+            names = ("id", *fields)
+            data = values(*(column(name, table.c[name].type) for name in names), name="data").data(
+                [tuple(row[name] for name in names) for row in group]
+            )
+            stmt = (
+                update(self.model)
+                .where(self.model.id == data.c.id)
+                .values({name: data.c[name] for name in fields})
+                .returning(self.model)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            for obj in db.scalars(stmt):
+                updated[obj.id] = obj
+
+        # 바꿀 값이 없는 항목도 결과에 포함합니다.
+        unchanged = [row["id"] for row in rows if row["id"] not in updated]
+        if unchanged:
+            for obj in db.query(self.model).filter(self.model.id.in_(unchanged)):
+                updated[obj.id] = obj
+        return [updated[row["id"]] for row in rows if row["id"] in updated]
+
+    def _delete_rows(self, db: Session, ids: Sequence[Any]) -> List[ModelType]:
+        if not ids:
+            return []
+        stmt = (
+            delete(self.model)
+            .where(self.model.id.in_(ids))
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        order = {id: index for index, id in enumerate(ids)}
+        return sorted(db.scalars(stmt).all(), key=lambda obj: order[obj.id])
+
+    def _update_data(self, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> Dict[str, Any]:
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        columns = self.model.__table__.c
+        return {key: value for key, value in update_data.items() if key in columns and key != "id"}
+
+    def create_multi(self, db: Session, *, objs_in: Sequence[CreateSchemaType]) -> List[ModelType]:
+        db_objs = self._insert_rows(db, [jsonable_encoder(obj_in) for obj_in in objs_in])
+        self._commit_keep_loaded(db)
+        self._cache_invalidate(key for obj in db_objs for key in self._cache_keys(obj))
+        return db_objs
+
+    def update_multi(
+        self, db: Session, *, objs_in: Mapping[Any, Union[UpdateSchemaType, Dict[str, Any]]]
+    ) -> List[ModelType]:
+        """`{id: 변경 내용}`을 한 트랜잭션으로 갱신하고, 존재하는 객체만 입력 순서대로 반환합니다."""
+        rows = [{"id": id, **self._update_data(obj_in)} for id, obj_in in objs_in.items()]
+        db_objs = self._update_rows(db, rows)
+        self._commit_keep_loaded(db)
+        self._cache_invalidate(key for obj in db_objs for key in self._cache_keys(obj))
+        return db_objs
+
+    def remove_multi(self, db: Session, *, ids: Sequence[Any]) -> List[ModelType]:
+        """한 번의 DELETE ... RETURNING으로 삭제하고, 실제로 삭제된 객체(세션에서 분리됨)를 반환합니다."""
+        db_objs = self._delete_rows(db, list(ids))
+        self._commit_keep_loaded(db)
+        for obj in db_objs:
+            db.expunge(obj)
+        self._cache_invalidate(key for obj in db_objs for key in self._cache_keys(obj))
+        return db_objs
+
+    # --- 비동기 버전 ---
+    # AsyncSession.run_sync로 위의 동기 메서드를 그대로 실행합니다. run_sync 안의 DB I/O는 asyncpg를 통해
+    # 이벤트 루프에서 처리되므로 스레드를 점유하지 않으며, 캐시/무효화 등 동기 경로와 동작이 같습니다.
+
+    async def aget(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        return await db.run_sync(self.get, id)
+
+    async def aget_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> List[ModelType]:
+        return await db.run_sync(lambda session: self.get_multi(session, skip=skip, limit=limit))
+
+    async def acreate(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        return await db.run_sync(lambda session: self.create(session, obj_in=obj_in))
+
+    async def aupdate(
+        self, db: AsyncSession, *, db_obj: ModelType, obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        return await db.run_sync(lambda session: self.update(session, db_obj=db_obj, obj_in=obj_in))
+
+    async def aremove(self, db: AsyncSession, *, id: int) -> Optional[ModelType]:
+        return await db.run_sync(lambda session: self.remove(session, id=id))
+
+    async def acreate_multi(self, db: AsyncSession, *, objs_in: Sequence[CreateSchemaType]) -> List[ModelType]:
+        return await db.run_sync(lambda session: self.create_multi(session, objs_in=objs_in))
+
+    async def aupdate_multi(
+        self, db: AsyncSession, *, objs_in: Mapping[Any, Union[UpdateSchemaType, Dict[str, Any]]]
+    ) -> List[ModelType]:
+        return await db.run_sync(lambda session: self.update_multi(session, objs_in=objs_in))
+
+    async def aremove_multi(self, db: AsyncSession, *, ids: Sequence[Any]) -> List[ModelType]:
+        return await db.run_sync(lambda session: self.remove_multi(session, ids=ids))
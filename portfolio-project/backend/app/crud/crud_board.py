@@ -1,84 +1,732 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import List, Union, Optional
+import base64
+import binascii
+import html
+import json
+import re
+from collections import Counter
+from datetime import datetime
 
-from app.crud.base import CRUDBase
-from app.models.board import Board
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session, load_only
+from sqlalchemy import Integer, column, delete, func, insert, or_, select, text, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple, Union, Optional
+
+from app.core.config import settings
+from app.core.serialization import post_json_cache
+from app.crud.base import CRUDBase, crud_cache
+from app.models.board import SEARCH_TS_CONFIG, Board, BoardVersion
+from app.models.tag import Tag, board_tag
 from app.schemas.board import BoardCreate, BoardUpdate
+from app.utils.content import find_cover_image, make_excerpt
+
+# 목록(요약) 조회 시 읽는 컬럼. 본문(content)과 search_vector는 SQL 단계에서 제외됩니다.
+SUMMARY_COLUMNS = (
+    Board.id, Board.title, Board.tags, Board.slug, Board.owner_id,
+    Board.created_at, Board.updated_at, Board.excerpt, Board.cover_image,
+)
+
+# ts_headline 스니펫 옵션
+# ts_headline의 결과는 HTML로 안전하지 않으므로, 강조 구간을 사용자 입력에 나올 수 없는 문자(Private Use Area)로
+# 표시한 뒤 render_headline에서 전체를 이스케이프하고 그 표시만 <mark>로 바꿉니다.
+HEADLINE_START = "\ue000"
+HEADLINE_STOP = "\ue001"
+HEADLINE_OPTIONS = (
+    f"StartSel={HEADLINE_START}, StopSel={HEADLINE_STOP}, MaxFragments=2, MaxWords=30, MinWords=10"
+)
+
+
+def headline_source(content):
+    """스니펫을 만들 본문: 태그를 공백으로 바꾸고(잘린 태그 조각 방지) 강조 표시 문자를 제거한 텍스트 (SQL 식)"""
+    without_tags = func.regexp_replace(content, "<[^>]*>", " ", "g")
+    return func.translate(without_tags, HEADLINE_START + HEADLINE_STOP, "")
+
+
+def render_headline(headline: Optional[str]) -> Optional[str]:
+    """ts_headline 결과를 HTML 이스케이프하고, 검색어 강조 구간만 <mark>로 감쌉니다."""
+    if headline is None:
+        return None
+    text = html.escape(html.unescape(headline), quote=False)
+    return text.replace(HEADLINE_START, "<mark>").replace(HEADLINE_STOP, "</mark>")
+
+
+def build_prefix_tsquery(search: str) -> Optional[str]:
+    """
+    검색어를 to_tsquery용 문자열로 변환합니다. 각 단어는 접두어 매칭(:*)되며 AND(&)로 연결됩니다.
+    예: "파이썬 웹" -> "파이썬:* & 웹:*"  (tsquery 특수문자는 제거)
+    """
+    terms = re.findall(r"\w+", search)
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def split_tags(tags: Optional[str]) -> List[str]:
+    """쉼표로 구분된 태그 문자열을 공백 제거/중복 제거된 태그 목록으로 변환합니다. (입력 순서 유지)"""
+    if not tags:
+        return []
+    return list(dict.fromkeys(tag.strip() for tag in tags.split(',') if tag.strip()))
+
+
+def summarize_content(content: Optional[str]) -> Dict[str, Any]:
+    """본문으로부터 저장용 요약 컬럼(excerpt, cover_image) 값을 계산합니다."""
+    return {"excerpt": make_excerpt(content), "cover_image": find_cover_image(content)}
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """페이지 위치를 클라이언트에게 넘겨줄 불투명한(opaque) 커서 문자열로 인코딩합니다."""
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """encode_cursor로 만든 커서를 복원합니다. 형식이 잘못되었으면 ValueError를 발생시킵니다."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(data, dict):
+        raise ValueError("Invalid cursor")
+    return data
+
 
 class CRUDBoard(CRUDBase[Board, BoardCreate, BoardUpdate]):
+    def _cache_keys(self, obj: Board) -> List[str]:
+        keys = super()._cache_keys(obj)
+        if obj.slug:
+            keys.append(self._cache_key("slug", obj.slug))
+        return keys
+
+    def _get_or_create_tags(self, db: Session, names: List[str]) -> List[Tag]:
+        """이름 목록에 해당하는 Tag 객체를 조회하고, 없는 태그는 새로 만듭니다."""
+        if not names:
+            return []
+        existing = {tag.name: tag for tag in db.query(Tag).filter(Tag.name.in_(names)).all()}
+        tags = []
+        for name in names:
+            tag = existing.get(name)
+            if tag is None:
+                tag = Tag(name=name)
+                db.add(tag)
+                existing[name] = tag
+            tags.append(tag)
+        return tags
+
+    def _tag_filter(self, tags: List[str], match_all: bool = False):
+        """
+        정규화된 태그 테이블로 정확히 일치하는 태그를 가진 게시글을 찾는 조건입니다.
+        match_all=False이면 하나라도 일치(OR), True이면 모든 태그를 가진 게시글(AND)만 찾습니다.
+        tag.name 유니크 인덱스와 board_tag(tag_id, board_id) 인덱스를 사용합니다.
+        """
+        names = list(dict.fromkeys(tag for tag in tags if tag))
+        board_ids = (
+            select(board_tag.c.board_id)
+            .join(Tag, Tag.id == board_tag.c.tag_id)
+            .where(Tag.name.in_(names))
+        )
+        if match_all:
+            board_ids = board_ids.group_by(board_tag.c.board_id).having(func.count() == len(names))
+        return self.model.id.in_(board_ids)
+
+    def _counted_tag_ids(self, post: Board, slug: Optional[str]) -> set:
+        """태그 개수에 반영되는 태그 ID 집합 (고정 페이지는 개수에 포함하지 않음)"""
+        if slug is not None:
+            return set()
+        return {tag.id for tag in post.tag_items}
+
+    def _adjust_tag_counts(self, db: Session, tag_ids: set, delta: int) -> None:
+        """tag.post_count를 SQL에서 원자적으로 증감합니다. (동시 요청에도 값이 유실되지 않음)"""
+        if not tag_ids:
+            return
+        db.query(Tag).filter(Tag.id.in_(tag_ids)).update(
+            {Tag.post_count: Tag.post_count + delta}, synchronize_session=False
+        )
+
+    def recount_tags(self, db: Session) -> None:
+        """board_tag 연결로부터 모든 태그의 post_count를 다시 계산합니다. (데이터 보정용)"""
+        counts = (
+            select(func.count())
+            .select_from(board_tag.join(Board, Board.id == board_tag.c.board_id))
+            .where(board_tag.c.tag_id == Tag.id, Board.slug.is_(None))
+            .scalar_subquery()
+        )
+        db.query(Tag).update({Tag.post_count: counts}, synchronize_session=False)
+        db.commit()
+
+    def _bump_version(self, db: Session) -> None:
+        """게시글 전체 버전(board_version)을 올립니다. 호출한 쪽의 트랜잭션과 함께 커밋됩니다."""
+        db.execute(
+            pg_insert(BoardVersion)
+            .values(id=1, version=1, last_modified=func.now())
+            .on_conflict_do_update(
+                index_elements=[BoardVersion.id],
+                set_={"version": BoardVersion.version + 1, "last_modified": func.now()},
+            )
+        )
+
+    def touch_collection(self, db: Session) -> None:
+        """CRUD를 거치지 않고 DB를 직접 수정한 뒤 목록 ETag와 sitemap을 갱신합니다. (데이터 보정용)"""
+        self._bump_version(db)
+        db.commit()
+
     def create_with_owner(self, db: Session, *, obj_in: BoardCreate, owner_id: int) -> Board:
         obj_in_data = obj_in.model_dump()
+        obj_in_data.update(summarize_content(obj_in_data.get("content")))
         db_obj = self.model(**obj_in_data, owner_id=owner_id)
+        db_obj.tag_items = self._get_or_create_tags(db, split_tags(db_obj.tags))
         db.add(db_obj)
+        db.flush()
+        self._adjust_tag_counts(db, self._counted_tag_ids(db_obj, db_obj.slug), +1)
+        self._bump_version(db)
         db.commit()
         db.refresh(db_obj)
+        self._cache_invalidate(self._cache_keys(db_obj))
         return db_obj
 
-    def get_multi_by_tags(self, db: Session, *, tags: List[str], skip: int = 0, limit: int = 100) -> List[Board]:
-        filters = [self.model.tags.ilike(f"%{tag}%") for tag in tags]
-        return db.query(self.model).filter(or_(*filters)).offset(skip).limit(limit).all()
+    def update(
+        self, db: Session, *, db_obj: Board, obj_in: Union[BoardUpdate, Dict[str, Any]]
+    ) -> Board:
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        if update_data.get("content") is not None:
+            update_data = {**update_data, **summarize_content(update_data["content"])}
+        if "tags" in update_data or "slug" in update_data:
+            old_ids = self._counted_tag_ids(db_obj, db_obj.slug)
+            if "tags" in update_data:
+                # 태그 문자열이 바뀌면 정규화된 태그 연결도 같은 트랜잭션에서 갱신합니다.
+                db_obj.tag_items = self._get_or_create_tags(db, split_tags(update_data["tags"]))
+                db.flush()
+            new_ids = self._counted_tag_ids(db_obj, update_data.get("slug", db_obj.slug))
+            self._adjust_tag_counts(db, new_ids - old_ids, +1)
+            self._adjust_tag_counts(db, old_ids - new_ids, -1)
+        self._bump_version(db)
+        return super().update(db, db_obj=db_obj, obj_in=update_data)
+
+    def remove(self, db: Session, *, id: int) -> Optional[Board]:
+        # 방금 조회해 세션에 있는 객체면 다시 SELECT하지 않습니다. (get_by_id_or_slug 후 remove)
+        obj = db.get(self.model, id)
+        if obj:
+            self._adjust_tag_counts(db, self._counted_tag_ids(obj, obj.slug), -1)
+            self._bump_version(db)
+            db.delete(obj)
+            db.commit()
+            self._cache_invalidate(self._cache_keys(obj))
+        return obj
+
+    # --- 일괄 처리 ---
+    # 태그 연결(board_tag)과 태그 개수도 행 단위가 아니라 묶음 단위 SQL로 같은 트랜잭션에서 갱신합니다.
+
+    def _tag_ids_by_name(self, db: Session, names: Sequence[str]) -> Dict[str, int]:
+        """태그 이름 -> ID. 없는 태그는 한 번의 INSERT로 만듭니다. (동시에 만들어져도 충돌 없이 재조회)"""
+        names = list(dict.fromkeys(names))
+        if not names:
+            return {}
+        ids = dict(db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(names))).all())
+        missing = [name for name in names if name not in ids]
+        if missing:
+            db.execute(
+                pg_insert(Tag)
+                .values([{"name": name, "post_count": 0} for name in missing])
+                .on_conflict_do_nothing(index_elements=[Tag.name])
+            )
+            ids.update(db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(missing))).all())
+        return ids
+
+    def _linked_tag_ids(self, db: Session, board_ids: Sequence[int]) -> Dict[int, set]:
+        links: Dict[int, set] = {board_id: set() for board_id in board_ids}
+        if board_ids:
+            rows = db.execute(
+                select(board_tag.c.board_id, board_tag.c.tag_id).where(board_tag.c.board_id.in_(board_ids))
+            )
+            for board_id, tag_id in rows:
+                links[board_id].add(tag_id)
+        return links
+
+    def _replace_tag_links(self, db: Session, tag_ids: Mapping[int, set], *, new: bool = False) -> None:
+        """주어진 게시글들의 태그 연결을 새 목록으로 교체합니다. (DELETE 1회 + INSERT 1회, 새 글이면 INSERT만)"""
+        if not tag_ids:
+            return
+        if not new:
+            db.execute(delete(board_tag).where(board_tag.c.board_id.in_(list(tag_ids))))
+        rows = [{"board_id": board_id, "tag_id": tag_id} for board_id, ids in tag_ids.items() for tag_id in ids]
+        if rows:
+            db.execute(insert(board_tag), rows)
+
+    def _apply_tag_deltas(self, db: Session, deltas: Counter) -> None:
+        """태그별 증감량을 UPDATE ... FROM (VALUES (tag_id, delta), ...) 한 번으로 반영합니다."""
+        rows = [(tag_id, delta) for tag_id, delta in deltas.items() if delta]
+        if not rows:
+            return
+        data = values(
+            column("tag_id", Integer), column("delta", Integer), name="tag_delta"
+        ).data(rows)
+        db.execute(
+            update(Tag)
+            .where(Tag.id == data.c.tag_id)
+            .values(post_count=Tag.post_count + data.c.delta)
+            .execution_options(synchronize_session=False)
+        )
+
+    def create_multi_with_owner(
+        self, db: Session, *, objs_in: Sequence[BoardCreate], owner_id: int
+    ) -> List[Board]:
+        """여러 게시글을 한 트랜잭션에서 생성합니다. (INSERT ... RETURNING 1회, 객체별 refresh 없음)"""
+        rows = []
+        for obj_in in objs_in:
+            data = obj_in.model_dump()
+            data.update(summarize_content(data.get("content")))
+            rows.append({**data, "owner_id": owner_id})
+        tag_names = [split_tags(row["tags"]) for row in rows]
+        tag_ids = self._tag_ids_by_name(db, [name for names in tag_names for name in names])
+
+        db_objs = self._insert_rows(db, rows)
+        links = {obj.id: {tag_ids[name] for name in names} for obj, names in zip(db_objs, tag_names)}
+        self._replace_tag_links(db, {board_id: ids for board_id, ids in links.items() if ids}, new=True)
+        self._apply_tag_deltas(
+            db, Counter(tag_id for obj in db_objs if obj.slug is None for tag_id in links[obj.id])
+        )
+        if db_objs:
+            self._bump_version(db)
+        self._commit_keep_loaded(db)
+        self._cache_invalidate(key for obj in db_objs for key in self._cache_keys(obj))
+        return db_objs
+
+    def update_multi(
+        self, db: Session, *, objs_in: Mapping[int, Union[BoardUpdate, Dict[str, Any]]]
+    ) -> List[Board]:
+        """
+        `{id: 변경 내용}`을 한 트랜잭션에서 갱신하고, 존재하는 게시글만 입력 순서대로 반환합니다.
+        update와 같이 본문 요약, 태그 연결, 태그 개수, 이전 slug 캐시까지 함께 처리합니다.
+        """
+        current = {
+            row.id: row
+            for row in db.execute(select(Board.id, Board.slug).where(Board.id.in_(list(objs_in))))
+        }
+        rows = []
+        new_tag_names: Dict[int, List[str]] = {}
+        for board_id, obj_in in objs_in.items():
+            if board_id not in current:
+                continue
+            update_data = self._update_data(obj_in)
+            if update_data.get("content") is not None:
+                update_data.update(summarize_content(update_data["content"]))
+            if "tags" in update_data:
+                new_tag_names[board_id] = split_tags(update_data["tags"])
+            rows.append({"id": board_id, **update_data})
+
+        # 태그나 slug(고정 페이지 여부)가 바뀌는 글만 태그 개수를 다시 계산합니다.
+        affected = [row["id"] for row in rows if "tags" in row or "slug" in row]
+        old_links = self._linked_tag_ids(db, affected)
+        tag_ids = self._tag_ids_by_name(db, [name for names in new_tag_names.values() for name in names])
+        new_links = {
+            board_id: {tag_ids[name] for name in names} for board_id, names in new_tag_names.items()
+        }
+        deltas: Counter = Counter()
+        for row in rows:
+            if row["id"] not in old_links:
+                continue
+            old_slug = current[row["id"]].slug
+            new_slug = row.get("slug", old_slug)
+            old_counted = old_links[row["id"]] if old_slug is None else set()
+            new_counted = new_links.get(row["id"], old_links[row["id"]]) if new_slug is None else set()
+            deltas.update(new_counted - old_counted)
+            deltas.subtract(old_counted - new_counted)
+        self._replace_tag_links(db, new_links)
+
+        db_objs = self._update_rows(db, rows)
+        self._apply_tag_deltas(db, deltas)
+        if db_objs:
+            self._bump_version(db)
+        self._commit_keep_loaded(db)
+        for obj in db_objs:
+            if obj.id in new_links:
+                # 태그 연결을 SQL로 교체했으므로 이미 로드된 관계가 있다면 다음 접근 시 다시 읽게 합니다.
+                db.expire(obj, ["tag_items"])
+        stale_keys = [key for row in current.values() for key in self._cache_keys(row)]
+        self._cache_invalidate(stale_keys + [key for obj in db_objs for key in self._cache_keys(obj)])
+        return db_objs
+
+    def remove_multi(self, db: Session, *, ids: Sequence[int]) -> List[Board]:
+        """한 번의 DELETE ... RETURNING으로 삭제하고 태그 개수를 함께 줄입니다. (태그 연결은 FK CASCADE)"""
+        ids = list(ids)
+        counted = db.execute(
+            select(board_tag.c.board_id, board_tag.c.tag_id)
+            .join(Board, Board.id == board_tag.c.board_id)
+            .where(board_tag.c.board_id.in_(ids), Board.slug.is_(None))
+        ).all()
+        db_objs = self._delete_rows(db, ids)
+        # 동시에 다른 요청이 먼저 삭제한 글은 RETURNING에 없으므로 개수를 중복으로 줄이지 않습니다.
+        deleted_ids = {obj.id for obj in db_objs}
+        deltas: Counter = Counter()
+        for board_id, tag_id in counted:
+            if board_id in deleted_ids:
+                deltas[tag_id] -= 1
+        self._apply_tag_deltas(db, deltas)
+        if db_objs:
+            self._bump_version(db)
+        self._commit_keep_loaded(db)
+        for obj in db_objs:
+            db.expunge(obj)
+        self._cache_invalidate(key for obj in db_objs for key in self._cache_keys(obj))
+        return db_objs
+
+    def _ordered(self, query: Query) -> Query:
+        """모든 목록 조회의 정렬 기준: 최신 글 먼저, 같은 시각이면 id 역순 (페이지 간 순서가 흔들리지 않음)"""
+        return query.order_by(self.model.created_at.desc(), self.model.id.desc())
+
+    def _posts_query(
+        self, db: Session, *, tags: Optional[List[str]] = None, match_all: bool = False, summary: bool = False
+    ) -> Query:
+        """
+        고정 페이지를 제외한 일반 게시글 조회 쿼리 (태그가 있으면 태그 조건 포함)
+        summary=True이면 SUMMARY_COLUMNS만 SELECT 하여 본문을 DB에서 읽지 않습니다.
+        """
+        query = db.query(self.model).filter(self.model.slug.is_(None))
+        if summary:
+            query = query.options(load_only(*SUMMARY_COLUMNS))
+        if tags:
+            query = query.filter(self._tag_filter(tags, match_all))
+        return query
+
+    def _keyset_page(
+        self, query: Query, *, skip: int, limit: int, cursor: Optional[str]
+    ) -> Tuple[List[Board], Optional[str]]:
+        """
+        (created_at, id) 기준 키셋 페이지네이션.
+        커서가 있으면 OFFSET 없이 `(created_at, id) < 커서 값` 조건으로 다음 페이지를 찾으므로
+        ix_board_posts_created_at_id 부분 인덱스를 따라 페이지 깊이와 무관하게 일정한 속도로 조회됩니다.
+        커서가 없으면 기존 클라이언트를 위해 skip(OFFSET)을 사용합니다.
+        """
+        query = self._ordered(query)
+        if cursor:
+            data = decode_cursor(cursor)
+            try:
+                created_at, post_id = datetime.fromisoformat(data["created_at"]), int(data["id"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("Invalid cursor")
+            query = query.filter(tuple_(self.model.created_at, self.model.id) < tuple_(created_at, post_id))
+        elif skip:
+            query = query.offset(skip)
+        # 다음 페이지가 있는지 확인하기 위해 한 건 더 조회합니다.
+        posts = query.limit(limit + 1).all()
+        if len(posts) <= limit:
+            return posts, None
+        last = posts[limit - 1]
+        return posts[:limit], encode_cursor({"created_at": last.created_at.isoformat(), "id": last.id})
+
+    def _ranked_page(
+        self, query: Query, *, search: str, skip: int, limit: int, cursor: Optional[str]
+    ) -> Tuple[List[Board], Optional[str]]:
+        """
+        전문 검색 결과 페이지. 관련도(ts_rank) 순서에는 키셋으로 쓸 수 있는 인덱스가 없으므로
+        커서에 다음 OFFSET을 담습니다. (검색 결과는 보통 몇 페이지를 넘지 않습니다)
+        """
+        if cursor:
+            try:
+                skip = int(decode_cursor(cursor)["offset"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("Invalid cursor")
+            if skip < 0:
+                raise ValueError("Invalid cursor")
+        posts = self._fulltext_search(query, search=search, skip=skip, limit=limit + 1)
+        if len(posts) <= limit:
+            return posts, None
+        return posts[:limit], encode_cursor({"offset": skip + limit})
+
+    def get_posts_page(
+        self,
+        db: Session,
+        *,
+        tags: Optional[List[str]] = None,
+        match_all: bool = False,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        summary: bool = False,
+    ) -> Tuple[List[Board], Optional[str]]:
+        """
+        일반 게시글(고정 페이지 제외)을 태그/검색어로 필터링하여 한 페이지 조회합니다.
+        (게시글 목록, 다음 페이지 커서)를 반환하며, 마지막 페이지이면 커서는 None입니다.
+        summary=True이면 본문(content)을 읽지 않으므로 schemas.BoardSummary로만 응답해야 합니다.
+        잘못된 커서는 ValueError를 발생시킵니다.
+        """
+        query = self._posts_query(db, tags=tags, match_all=match_all, summary=summary)
+        if search:
+            if settings.BOARD_SEARCH_MODE == "fulltext":
+                return self._ranked_page(query, search=search, skip=skip, limit=limit, cursor=cursor)
+            query = query.filter(self._search_filter(search))
+        return self._keyset_page(query, skip=skip, limit=limit, cursor=cursor)
+
+    def get_multi_by_tags(self, db: Session, *, tags: List[str], match_all: bool = False, skip: int = 0, limit: int = 100) -> List[Board]:
+        query = db.query(self.model).filter(self._tag_filter(tags, match_all))
+        return self._ordered(query).offset(skip).limit(limit).all()
 
     def get_multi_posts_only(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[Board]:
         """고정 페이지(slug가 있는 게시글)를 제외하고 일반 포트폴리오 게시글만 조회합니다."""
-        return db.query(self.model).filter(self.model.slug.is_(None)).offset(skip).limit(limit).all()
+        return self.get_posts_page(db, skip=skip, limit=limit)[0]
 
-    def get_multi_by_tags_posts_only(self, db: Session, *, tags: List[str], skip: int = 0, limit: int = 100) -> List[Board]:
+    def get_multi_by_tags_posts_only(self, db: Session, *, tags: List[str], match_all: bool = False, skip: int = 0, limit: int = 100) -> List[Board]:
         """태그별 필터링하되, 고정 페이지는 제외하고 일반 포트폴리오 게시글만 조회합니다."""
-        filters = [self.model.tags.ilike(f"%{tag}%") for tag in tags]
-        return db.query(self.model).filter(or_(*filters)).filter(self.model.slug.is_(None)).offset(skip).limit(limit).all()
+        return self.get_posts_page(db, tags=tags, match_all=match_all, skip=skip, limit=limit)[0]
 
-    def get_multi_by_search(self, db: Session, *, search: str, skip: int = 0, limit: int = 100) -> List[Board]:
-        """제목 또는 내용으로 검색하여 게시글을 조회합니다. (고정 페이지 제외)"""
-        search_filter = or_(
+    def _search_filter(self, search: str):
+        """ilike 모드의 제목/내용 부분 일치 조건"""
+        return or_(
             self.model.title.ilike(f"%{search}%"),
             self.model.content.ilike(f"%{search}%")
         )
-        return db.query(self.model).filter(search_filter).filter(self.model.slug.is_(None)).offset(skip).limit(limit).all()
 
-    def get_multi_by_tags_and_search(self, db: Session, *, tags: List[str], search: str, skip: int = 0, limit: int = 100) -> List[Board]:
-        """태그와 검색어를 함께 적용하여 게시글을 조회합니다. (고정 페이지 제외)"""
-        tag_filters = [self.model.tags.ilike(f"%{tag}%") for tag in tags]
-        search_filter = or_(
-            self.model.title.ilike(f"%{search}%"),
-            self.model.content.ilike(f"%{search}%")
+    def _fulltext_search(self, query, *, search: str, skip: int, limit: int) -> List[Board]:
+        """
+        GIN 인덱스가 걸린 search_vector로 검색하고 ts_rank 순으로 정렬합니다.
+        각 결과에는 검색어 주변 본문을 강조한 `snippet`(ts_headline)이 붙습니다.
+        ts_headline은 LIMIT 이후의 행에만 계산됩니다.
+        """
+        tsquery_text = build_prefix_tsquery(search)
+        if tsquery_text is None:
+            return []
+        ts_query = func.to_tsquery(SEARCH_TS_CONFIG, tsquery_text)
+        rank = func.ts_rank(self.model.search_vector, ts_query)
+        snippet = func.ts_headline(SEARCH_TS_CONFIG, headline_source(self.model.content), ts_query, HEADLINE_OPTIONS)
+        rows = (
+            query.add_columns(snippet)
+            .filter(self.model.search_vector.op("@@")(ts_query))
+            .order_by(rank.desc(), self.model.created_at.desc(), self.model.id.desc())
+            .offset(skip).limit(limit).all()
         )
-        return db.query(self.model).filter(or_(*tag_filters)).filter(search_filter).filter(self.model.slug.is_(None)).offset(skip).limit(limit).all()
+        posts = []
+        for post, post_snippet in rows:
+            post.snippet = render_headline(post_snippet)
+            posts.append(post)
+        return posts
+
+    def get_multi_by_search(self, db: Session, *, search: str, skip: int = 0, limit: int = 100) -> List[Board]:
+        """제목 또는 내용으로 검색하여 게시글을 조회합니다. (고정 페이지 제외)"""
+        return self.get_posts_page(db, search=search, skip=skip, limit=limit)[0]
+
+    def get_multi_by_tags_and_search(self, db: Session, *, tags: List[str], search: str, match_all: bool = False, skip: int = 0, limit: int = 100) -> List[Board]:
+        """태그와 검색어를 함께 적용하여 게시글을 조회합니다. (고정 페이지 제외)"""
+        return self.get_posts_page(db, tags=tags, match_all=match_all, search=search, skip=skip, limit=limit)[0]
 
     def get_all_tags(self, db: Session) -> List[str]:
-        # 고정 페이지를 제외하고 태그를 수집합니다.
-        all_tags_tuples = db.query(self.model.tags).filter(
-            self.model.tags.isnot(None),
-            self.model.slug.is_(None)  # slug가 없는 일반 게시글만
-        ).all()
-        unique_tags = set()
-        for tags_tuple in all_tags_tuples:
-            tags_str = tags_tuple[0]
-            if tags_str:
-                tags_list = [tag.strip() for tag in tags_str.split(',')]
-                unique_tags.update(tags_list)
-        return sorted(list(unique_tags))
+        """일반 게시글(고정 페이지 제외)에 사용 중인 태그 이름을 정렬하여 반환합니다."""
+        rows = db.query(Tag.name).filter(Tag.post_count > 0).order_by(Tag.name).all()
+        return [name for (name,) in rows]
 
     def get_tags_with_count(self, db: Session) -> dict:
-        """태그별 포스팅 개수를 반환합니다."""
-        # 고정 페이지를 제외하고 태그를 수집합니다.
-        all_tags_tuples = db.query(self.model.tags).filter(
-            self.model.tags.isnot(None),
-            self.model.slug.is_(None)  # slug가 없는 일반 게시글만
-        ).all()
-        
-        tag_counts = {}
-        for tags_tuple in all_tags_tuples:
-            tags_str = tags_tuple[0]
-            if tags_str:
-                tags_list = [tag.strip() for tag in tags_str.split(',')]
-                for tag in tags_list:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        return tag_counts
-
-    def get_by_slug(self, db: Session, *, slug: str) -> Optional[Board]:
-        return db.query(Board).filter(Board.slug == slug).first()
+        """태그별 포스팅 개수를 반환합니다. (tag.post_count를 읽으므로 게시글 수와 무관하게 태그 수에 비례)"""
+        rows = db.query(Tag.name, Tag.post_count).filter(Tag.post_count > 0).order_by(Tag.name).all()
+        return {name: count for name, count in rows}
+
+    def count_posts_only(self, db: Session) -> int:
+        """일반 게시글(고정 페이지 제외) 수"""
+        return db.query(func.count(self.model.id)).filter(self.model.slug.is_(None)).scalar()
+
+    # --- 가져오기/내보내기 (app.portfolio_archive) ---
+
+    ARCHIVE_COLUMNS = (
+        "id", "title", "content", "slug", "tags", "excerpt", "cover_image", "created_at", "updated_at",
+    )
+
+    def iter_archive_rows(self, db: Session, *, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """모든 게시글(고정 페이지 포함)을 id 순으로 스트리밍합니다. (서버 사이드 커서, 메모리 일정)"""
+        stmt = select(*(self.model.__table__.c[name] for name in self.ARCHIVE_COLUMNS)).order_by(self.model.id)
+        result = db.execute(stmt.execution_options(yield_per=batch_size))
+        for row in result.mappings():
+            yield dict(row)
+
+    def _archive_upsert(self, conflict: str, columns: Sequence[str]):
+        """
+        가져오기용 upsert 문 (컬럼 구성이 같으면 같은 문장이라 컴파일 캐시를 재사용하고, executemany로 실행됩니다)
+        기존 글을 덮어쓸 때는 updated_at을 현재 시각으로 올립니다. 원본의 (더 오래된) 시각을 그대로 쓰면
+        목록/게시글 ETag(최대 수정 시각)가 바뀌지 않아 클라이언트와 nginx 캐시가 계속 이전 내용으로 304를 받습니다.
+        """
+        table = self.model.__table__
+        stmt = pg_insert(table)
+        set_ = {name: stmt.excluded[name] for name in columns if name not in ("id", "slug", "updated_at")}
+        set_["updated_at"] = func.now()
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c[conflict]],
+            set_=set_,
+            # 같은 ID가 대상 DB에서 고정 페이지이면 덮어쓰지 않습니다.
+            where=table.c.slug.is_(None) if conflict == "id" else None,
+        ).returning(table.c.id, table.c.tags)
+
+    def _drop_unchanged(self, db: Session, batch: List[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+        """
+        대상 DB에 내용이 같은 글이 이미 있으면 묶음에서 뺍니다. (updated_at은 비교하지 않음)
+        ON CONFLICT로 넘기면 갱신하지 않더라도 search_vector(to_tsvector)를 행마다 계산하므로, 다시 가져올 때 가장 큰 비용입니다.
+        """
+        table = self.model.__table__
+        columns = [name for name in batch[0] if name != "updated_at"]
+        existing = {
+            row[key]: row
+            for row in db.execute(
+                select(*(table.c[name] for name in columns)).where(table.c[key].in_([data[key] for data in batch]))
+            ).mappings()
+        }
+        return [
+            data for data in batch
+            if data[key] not in existing or any(existing[data[key]][name] != data[name] for name in columns)
+        ]
+
+    def upsert_archive_batch(self, db: Session, *, rows: List[Dict[str, Any]], owner_id: int) -> Dict[str, int]:
+        """
+        내보낸 게시글 묶음을 한 트랜잭션으로 저장합니다. 태그 개수는 호출한 쪽에서 마지막에 recount_tags로 맞춥니다.
+        - slug가 있는 글(고정 페이지): slug 기준 upsert (ID는 대상 DB에서 새로 부여)
+        - 일반 글: ID 기준 upsert. 같은 ID가 대상 DB에서 고정 페이지이면 덮어쓰지 않고 건너뜁니다.
+        - 대상 DB의 글과 내용이 같으면 쓰지 않고 건너뜁니다. (skipped에 포함)
+        - 아카이브에 없는 컬럼(created_at 등)은 넣지 않아 DB 기본값을 사용합니다.
+        """
+        # (기준 컬럼, 컬럼 구성)별로 나눕니다. executemany의 행들은 같은 컬럼을 가져야 합니다.
+        groups: Dict[Tuple[str, Tuple[str, ...]], List[Dict[str, Any]]] = {}
+        for row in rows:
+            data = {name: row[name] for name in self.ARCHIVE_COLUMNS if name in row}
+            if "excerpt" not in row or "cover_image" not in row:
+                data.update(summarize_content(data["content"]))
+            data["owner_id"] = owner_id
+            if data.get("slug"):
+                data.pop("id", None)
+                conflict = "slug"
+            else:
+                data["slug"] = None
+                conflict = "id"
+            groups.setdefault((conflict, tuple(data)), []).append(data)
+
+        saved: Dict[int, Optional[str]] = {}
+        sequence_synced = False
+        # ID를 지정하는 일반 글을 먼저 넣습니다.
+        for (conflict, columns), batch in sorted(groups.items(), key=lambda item: item[0][0] != "id"):
+            batch = self._drop_unchanged(db, batch, conflict)
+            if not batch:
+                continue
+            if conflict == "slug" and not sequence_synced:
+                # 앞에서 ID를 지정해 넣었을 수 있으므로, 새 ID를 받는 고정 페이지가 그 ID와 겹치지 않게 시퀀스를 먼저 맞춥니다.
+                self._sync_id_sequence(db)
+                sequence_synced = True
+            for post_id, tags in db.execute(self._archive_upsert(conflict, columns), batch):
+                saved[post_id] = tags
+
+        tag_names = {post_id: split_tags(tags) for post_id, tags in saved.items()}
+        tag_ids = self._tag_ids_by_name(db, [name for names in tag_names.values() for name in names])
+        self._replace_tag_links(
+            db, {post_id: {tag_ids[name] for name in names} for post_id, names in tag_names.items()}
+        )
+        if saved:
+            self._bump_version(db)
+        db.commit()
+        return {"saved": len(saved), "skipped": len(rows) - len(saved)}
+
+    def _sync_id_sequence(self, db: Session) -> None:
+        db.execute(text(
+            "SELECT setval(pg_get_serial_sequence('board', 'id'), coalesce(max(id), 0) + 1, false) FROM board"
+        ))
+
+    def finish_archive_import(self, db: Session) -> None:
+        """ID를 지정해 넣었으므로 시퀀스를 최대 ID로 맞추고, 태그 개수와 캐시를 정리합니다."""
+        self._sync_id_sequence(db)
+        db.commit()
+        self.recount_tags(db)
+        if self.cache is not None:
+            self.cache.clear()
+        # 새로 들어온 글은 원본의 updated_at을 그대로 쓰므로, 같은 키로 캐시된 이전 직렬화 결과를 버립니다.
+        # (이 프로세스의 캐시만 비웁니다. CLI로 가져온 경우 API 서버의 캐시는 README 참고)
+        post_json_cache.clear()
+
+    def iter_post_last_modified(
+        self, db: Session, *, skip: int = 0, limit: Optional[int] = None, batch_size: int = 1000
+    ) -> Iterator[Tuple[int, datetime]]:
+        """
+        일반 게시글의 (id, 마지막 수정 시각)을 id 순으로 스트리밍합니다.
+        yield_per로 서버 사이드 커서에서 batch_size씩 읽으므로 게시글 수와 무관하게 메모리가 일정합니다.
+        """
+        query = (
+            db.query(self.model.id, func.coalesce(self.model.updated_at, self.model.created_at))
+            .filter(self.model.slug.is_(None))
+            .order_by(self.model.id)
+            .offset(skip)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        for post_id, last_modified in query.yield_per(batch_size):
+            yield post_id, last_modified
+
+    def get_collection_version(self, db: Session) -> Tuple[int, Optional[datetime]]:
+        """
+        게시글 전체의 버전: (버전 번호, 마지막으로 게시글이 바뀐 시각). 목록/태그 응답의 ETag로 사용합니다.
+        생성/수정/삭제 시 함께 갱신되는 board_version 행 하나만 읽으므로 게시글 수와 무관하게 일정합니다.
+        """
+        row = db.query(BoardVersion.version, BoardVersion.last_modified).filter(BoardVersion.id == 1).first()
+        if row is None:
+            return 0, None
+        return row.version, row.last_modified
+
+    def get_last_modified(
+        self, db: Session, *, id: Optional[int] = None, slug: Optional[str] = None
+    ) -> Tuple[bool, Optional[datetime]]:
+        """
+        게시글 하나의 (존재 여부, 마지막 수정 시각)을 본문을 읽지 않고 조회합니다.
+        조건부 요청(If-None-Match)을 본문 조회 전에 판단하는 데 사용합니다.
+        """
+        query = db.query(self.model.id, func.coalesce(self.model.updated_at, self.model.created_at))
+        if id is not None:
+            query = query.filter(self.model.id == id)
+        else:
+            query = query.filter(self.model.slug == slug)
+        row = query.first()
+        if row is None:
+            return False, None
+        return True, row[1]
+
+    def _at_revision(self, db: Session, post: Board, last_modified: Optional[datetime]) -> Optional[Board]:
+        """
+        캐시에서 꺼낸 글이 get_last_modified로 확인한 버전보다 오래되었으면 DB에서 다시 읽습니다.
+        (다른 프로세스가 수정한 경우 ETag는 새 버전인데 본문은 이전 버전이 나가는 것을 막음)
+        """
+        if last_modified is None or (post.updated_at or post.created_at) == last_modified:
+            return post
+        self._cache_invalidate(self._cache_keys(post))
+        # 캐시 항목이 이미 세션에 붙어 있으므로 populate_existing으로 DB 값을 덮어씁니다.
+        fresh = db.query(Board).filter(Board.id == post.id).populate_existing().first()
+        if fresh is not None:
+            self._cache_set(self._cache_key("id", fresh.id), fresh)
+        return fresh
+
+    def get(self, db: Session, id: Any, *, last_modified: Optional[datetime] = None) -> Optional[Board]:
+        """last_modified를 주면 그 버전 이상인 글만 반환합니다. (캐시 항목이 오래되었으면 다시 조회)"""
+        post = super().get(db, id)
+        if post is None:
+            return None
+        return self._at_revision(db, post, last_modified)
+
+    def get_by_slug(
+        self, db: Session, *, slug: str, last_modified: Optional[datetime] = None
+    ) -> Optional[Board]:
+        # slug 키에는 게시글 ID만 저장하고, 내용은 ID 키의 캐시 항목을 함께 사용합니다.
+        key = self._cache_key("slug", slug)
+        if self.cache is not None:
+            post_id = self.cache.get(key)
+            if post_id is not None:
+                post = self.get(db, id=post_id, last_modified=last_modified)
+                if post is not None and post.slug == slug:
+                    return post
+        post = db.query(Board).filter(Board.slug == slug).first()
+        if post is not None and self.cache is not None:
+            self.cache.set(key, post.id)
+            self._cache_set(self._cache_key("id", post.id), post)
+        return post
+
+    def get_slug_owners(self, db: Session, *, slugs: Sequence[str]) -> Dict[str, int]:
+        """slug -> 그 slug를 사용 중인 게시글 ID (일괄 처리 전 중복 검사용)"""
+        if not slugs:
+            return {}
+        return dict(db.execute(select(Board.slug, Board.id).where(Board.slug.in_(list(slugs)))).all())
+
+    def get_existing_ids(self, db: Session, *, ids: Sequence[int]) -> set:
+        if not ids:
+            return set()
+        return set(db.scalars(select(Board.id).where(Board.id.in_(list(ids)))))
 
     def get_by_id_or_slug(self, db: Session, *, post_id: Union[int, str]) -> Optional[Board]:
         """
@@ -89,9 +737,69 @@ class CRUDBoard(CRUDBase[Board, BoardCreate, BoardUpdate]):
         # post_id가 숫자로만 이루어진 문자열인지 확인합니다.
         if str(post_id).isdigit():
             # 숫자이면, 정수(int)로 변환하여 id로 조회합니다.
-            return db.query(self.model).filter(self.model.id == int(post_id)).first()
+            return self.get(db, id=int(post_id))
         else:
             # 숫자가 아니면, slug로 조회합니다.
-            return db.query(self.model).filter(self.model.slug == str(post_id)).first()
+            return self.get_by_slug(db, slug=str(post_id))
+
+    # --- 비동기 버전 (CRUDBase와 같이 run_sync로 동기 메서드를 실행) ---
+
+    async def acreate_with_owner(self, db: AsyncSession, *, obj_in: BoardCreate, owner_id: int) -> Board:
+        return await db.run_sync(lambda session: self.create_with_owner(session, obj_in=obj_in, owner_id=owner_id))
+
+    async def aget_posts_page(
+        self,
+        db: AsyncSession,
+        *,
+        tags: Optional[List[str]] = None,
+        match_all: bool = False,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        summary: bool = False,
+    ) -> Tuple[List[Board], Optional[str]]:
+        return await db.run_sync(lambda session: self.get_posts_page(
+            session, tags=tags, match_all=match_all, search=search,
+            skip=skip, limit=limit, cursor=cursor, summary=summary,
+        ))
+
+    async def aget_all_tags(self, db: AsyncSession) -> List[str]:
+        return await db.run_sync(self.get_all_tags)
+
+    async def aget_tags_with_count(self, db: AsyncSession) -> dict:
+        return await db.run_sync(self.get_tags_with_count)
+
+    async def aget_collection_version(self, db: AsyncSession) -> Tuple[int, Optional[datetime]]:
+        return await db.run_sync(self.get_collection_version)
+
+    async def aget_last_modified(
+        self, db: AsyncSession, *, id: Optional[int] = None, slug: Optional[str] = None
+    ) -> Tuple[bool, Optional[datetime]]:
+        return await db.run_sync(lambda session: self.get_last_modified(session, id=id, slug=slug))
+
+    async def aget(self, db: AsyncSession, id: Any, *, last_modified: Optional[datetime] = None) -> Optional[Board]:
+        return await db.run_sync(lambda session: self.get(session, id, last_modified=last_modified))
+
+    async def aget_by_slug(
+        self, db: AsyncSession, *, slug: str, last_modified: Optional[datetime] = None
+    ) -> Optional[Board]:
+        return await db.run_sync(lambda session: self.get_by_slug(session, slug=slug, last_modified=last_modified))
+
+    async def acreate_multi_with_owner(
+        self, db: AsyncSession, *, objs_in: Sequence[BoardCreate], owner_id: int
+    ) -> List[Board]:
+        return await db.run_sync(
+            lambda session: self.create_multi_with_owner(session, objs_in=objs_in, owner_id=owner_id)
+        )
+
+    async def aget_slug_owners(self, db: AsyncSession, *, slugs: Sequence[str]) -> Dict[str, int]:
+        return await db.run_sync(lambda session: self.get_slug_owners(session, slugs=slugs))
+
+    async def aget_existing_ids(self, db: AsyncSession, *, ids: Sequence[int]) -> set:
+        return await db.run_sync(lambda session: self.get_existing_ids(session, ids=ids))
+
+    async def aget_by_id_or_slug(self, db: AsyncSession, *, post_id: Union[int, str]) -> Optional[Board]:
+        return await db.run_sync(lambda session: self.get_by_id_or_slug(session, post_id=post_id))
 
-board = CRUDBoard(Board)
\ No newline at end of file
+board = CRUDBoard(Board, cache=crud_cache)
@@ -1,21 +1,32 @@
 from typing import Any, Dict, Optional, Union
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.cache import build_cache_backend
+from app.core.config import settings
+from app.core.password_hasher import password_hasher
+from app.core.security import get_password_hash
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
+    # 비밀번호 해시는 캐시(외부 백엔드일 수 있음)에 저장하지 않습니다.
+    # 인증(authenticate)은 get_by_username으로 항상 DB에서 읽으므로 캐시된 사용자에는 필요 없습니다.
+    cache_exclude = ("hashed_password",)
+
     def get_by_username(self, db: Session, *, username: str) -> Optional[User]:
         return db.query(User).filter(User.username == username).first()
 
     def create(self, db: Session, *, obj_in: UserCreate) -> User:
+        return self._create_hashed(db, obj_in=obj_in, hashed_password=get_password_hash(obj_in.password))
+
+    def _create_hashed(self, db: Session, *, obj_in: UserCreate, hashed_password: str) -> User:
         db_obj = User(
             username=obj_in.username,
-            hashed_password=get_password_hash(obj_in.password),
+            hashed_password=hashed_password,
             is_admin=obj_in.is_admin,
         )
         db.add(db_obj)
@@ -42,11 +53,51 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         self, db: Session, *, username: str, password: str
     ) -> Optional[User]:
         user = self.get_by_username(db, username=username)
-        if not user:
+        # 존재하지 않는 사용자도 더미 해시로 검증하여 응답 시간을 같게 유지합니다.
+        if not password_hasher.verify_sync(password, user.hashed_password if user else None):
             return None
-        if not verify_password(password, user.hashed_password):
+        return user
+
+    # 비동기 생성/수정은 CRUDBase처럼 동기 메서드를 run_sync로 실행하되, 비밀번호 해시(Argon2)는
+    # 이벤트 루프 스레드가 아니라 password_hasher 스레드 풀에서 미리 계산합니다. (혼잡하면 PasswordHasherBusy)
+
+    async def acreate(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
+        hashed_password = await password_hasher.hash(obj_in.password)
+        return await db.run_sync(
+            lambda session: self._create_hashed(session, obj_in=obj_in, hashed_password=hashed_password)
+        )
+
+    async def aupdate(
+        self, db: AsyncSession, *, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]]
+    ) -> User:
+        update_data = dict(obj_in) if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        password = update_data.pop("password", None)
+        if password:
+            update_data["hashed_password"] = await password_hasher.hash(password)
+        return await db.run_sync(lambda session: self.update(session, db_obj=db_obj, obj_in=update_data))
+
+    async def aget_by_username(self, db: AsyncSession, *, username: str) -> Optional[User]:
+        return await db.run_sync(lambda session: self.get_by_username(session, username=username))
+
+    async def aauthenticate(
+        self, db: AsyncSession, *, username: str, password: str
+    ) -> Optional[User]:
+        """
+        authenticate의 비동기 버전. 비밀번호 검증(Argon2)은 전용 스레드 풀(password_hasher)에서 실행하며,
+        대기 중인 검증이 너무 많으면 PasswordHasherBusy를 발생시킵니다.
+        """
+        user = await self.aget_by_username(db, username=username)
+        if not await password_hasher.verify(password, user.hashed_password if user else None):
             return None
         return user
 
 
-user = CRUDUser(User)
+# 인증(get_current_user)마다 조회되므로 짧은 TTL의 별도 캐시를 사용합니다. (update/remove 시 자동 무효화)
+user = CRUDUser(
+    User,
+    cache=build_cache_backend(
+        settings.CRUD_CACHE_BACKEND,
+        max_items=settings.AUTH_CACHE_MAX_ITEMS,
+        ttl=settings.AUTH_CACHE_TTL,
+    ),
+)
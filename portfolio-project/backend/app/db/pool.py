@@ -0,0 +1,165 @@
+"""
+Connection pool instrumentation.
+
+`InstrumentedQueuePool` / `InstrumentedAsyncQueuePool` time every checkout
+(how long a request waited for a connection, including pre-ping) and pool
+event listeners track connects, invalidations and peak usage. `snapshot()`
+combines these counters with the pool's live state for the admin endpoint.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(sorted_values, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class PoolMonitor:
+    """Counters for one engine's pool. Safe to update from several threads."""
+
+    def __init__(self, name: str, window: int = 1000):
+        self.name = name
+        self._lock = threading.Lock()
+        # 최근 checkout 대기 시간 (백분위 계산용)
+        self._recent_waits: Deque[float] = deque(maxlen=window)
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+
+    def record_checkout(self, wait: float, pool: Pool) -> None:
+        checked_out, overflow = _pool_usage(pool)
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_total += wait
+            self.checkout_wait_max = max(self.checkout_wait_max, wait)
+            self._recent_waits.append(wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+            if wait >= settings.DB_POOL_SLOW_CHECKOUT_SECONDS:
+                self.slow_checkouts += 1
+        if wait >= settings.DB_POOL_SLOW_CHECKOUT_SECONDS:
+            logger.warning(
+                "Slow DB connection checkout (%s): waited %.3fs, %s",
+                self.name, wait, pool.status(),
+            )
+
+    def record_timeout(self, wait: float, pool: Pool) -> None:
+        with self._lock:
+            self.timeouts += 1
+        logger.error(
+            "DB connection pool exhausted (%s): gave up after %.3fs, %s",
+            self.name, wait, pool.status(),
+        )
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_invalidate(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        checked_out, overflow = _pool_usage(pool)
+        with self._lock:
+            waits = sorted(self._recent_waits)
+            return {
+                "pool": {
+                    "size": pool.size() if isinstance(pool, QueuePool) else None,
+                    "checked_in": pool.checkedin() if isinstance(pool, QueuePool) else None,
+                    "checked_out": checked_out,
+                    "overflow": overflow,
+                    "max_overflow": getattr(pool, "_max_overflow", None),
+                    "timeout": pool.timeout() if isinstance(pool, QueuePool) else None,
+                    "status": pool.status(),
+                },
+                "checkouts": self.checkouts,
+                "checkout_wait_seconds": {
+                    "avg": self.checkout_wait_total / self.checkouts if self.checkouts else 0.0,
+                    "max": self.checkout_wait_max,
+                    "p50": _percentile(waits, 0.50),
+                    "p95": _percentile(waits, 0.95),
+                    "p99": _percentile(waits, 0.99),
+                },
+                "slow_checkouts": self.slow_checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+            }
+
+
+def _pool_usage(pool: Pool):
+    if isinstance(pool, QueuePool):
+        # overflow()는 pool_size를 넘어 추가로 연 연결 수 (음수면 아직 열지 않은 여유분)
+        return pool.checkedout(), max(pool.overflow(), 0)
+    return 0, 0
+
+
+sync_pool_monitor = PoolMonitor("sync")
+async_pool_monitor = PoolMonitor("async")
+
+
+class _InstrumentedPoolMixin:
+    """Times `Pool.connect()`, i.e. how long a caller waited for a connection."""
+
+    monitor: PoolMonitor
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.monitor.record_timeout(time.perf_counter() - started, self)
+            raise
+        self.monitor.record_checkout(time.perf_counter() - started, self)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    monitor = sync_pool_monitor
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    monitor = async_pool_monitor
+
+
+def pool_options() -> Dict[str, Any]:
+    """create_engine / create_async_engine에 공통으로 넘기는 풀 설정"""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def instrument_engine(engine: Engine, monitor: PoolMonitor) -> None:
+    """풀 이벤트 리스너를 등록합니다. (새 연결 생성, 연결 무효화)"""
+    event.listen(engine, "connect", lambda dbapi_connection, connection_record: monitor.record_connect())
+    event.listen(
+        engine, "invalidate",
+        lambda dbapi_connection, connection_record, exception: monitor.record_invalidate(),
+    )
@@ -0,0 +1,251 @@
+"""
+Opt-in per-request SQL profiler.
+
+When `SQL_PROFILER_ENABLED` is set, every statement executed on the
+instrumented engines is recorded for the current request with its
+normalized text, duration and the application call site that issued it.
+`profile_queries()` blocks record (and enforce their budget) regardless of
+the flag, so tests do not depend on the deployment setting; requests made
+inside such a block report to it instead of opening their own profile.
+At the end of the request:
+
+- statements repeated `SQL_N_PLUS_ONE_THRESHOLD` times or more are logged
+  as N+1 candidates, with the call sites that issued them;
+- statements slower than `SQL_SLOW_QUERY_SECONDS` have already been
+  written to the `app.sql.slow` logger (optionally its own file);
+- exceeding `SQL_QUERY_BUDGET` is logged, or raises `QueryBudgetExceeded`
+  at the offending statement when `SQL_QUERY_BUDGET_RAISE` is on (for
+  tests, so a regression fails loudly with a traceback at the call site).
+"""
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.sql")
+slow_query_logger = logging.getLogger("app.sql.slow")
+
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_THIS_FILE = os.path.abspath(__file__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+# IN (...) 목록 길이가 달라도 같은 문장으로 묶습니다.
+_IN_LIST = re.compile(r"\bIN \((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a profiled block runs more statements than its budget allows."""
+
+
+def normalize_statement(statement: str) -> str:
+    """리터럴(문자열/숫자)과 IN 목록을 ?로 바꾸고 공백을 정리하여 같은 모양의 쿼리를 하나로 묶습니다."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return _IN_LIST.sub("IN (?)", normalized)
+
+
+def _call_site() -> str:
+    """쿼리를 실행한 애플리케이션 코드 위치 (SQLAlchemy/프로파일러 내부 프레임은 건너뜀)"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(_APP_DIR) and filename != _THIS_FILE:
+            return f"{os.path.relpath(filename, os.path.dirname(_APP_DIR))}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<outside app>"
+
+
+class QueryProfile:
+    """Statements recorded for one request or `profile_queries()` block."""
+
+    def __init__(self, label: str, budget: Optional[int] = None, raise_on_budget: bool = False):
+        self.label = label
+        self.budget = budget
+        self.raise_on_budget = raise_on_budget
+        self.statements: List[Dict[str, Any]] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(entry["seconds"] for entry in self.statements)
+
+    def record(self, statement: str, seconds: float, call_site: str) -> None:
+        self.statements.append(
+            {"statement": normalize_statement(statement), "seconds": seconds, "call_site": call_site}
+        )
+
+    def check_budget(self, call_site: str) -> None:
+        # 실행 직전에 확인하므로 예외 traceback이 예산을 넘긴 바로 그 쿼리를 가리킵니다.
+        if self.raise_on_budget and self.budget is not None and self.count >= self.budget:
+            raise QueryBudgetExceeded(
+                f"{self.label}: query budget of {self.budget} exceeded by a statement from {call_site}"
+            )
+
+    def repeated(self, threshold: Optional[int] = None) -> List[Dict[str, Any]]:
+        """같은 정규화 문장이 threshold번 이상 실행된 경우 (N+1 후보)"""
+        threshold = threshold or settings.SQL_N_PLUS_ONE_THRESHOLD
+        counts = Counter(entry["statement"] for entry in self.statements)
+        candidates = []
+        for statement, count in counts.most_common():
+            if count < threshold:
+                break
+            call_sites = Counter(
+                entry["call_site"] for entry in self.statements if entry["statement"] == statement
+            )
+            candidates.append(
+                {"statement": statement, "count": count, "call_sites": dict(call_sites.most_common())}
+            )
+        return candidates
+
+    def summary(self) -> Dict[str, Any]:
+        by_statement: Dict[str, Dict[str, Any]] = {}
+        for entry in self.statements:
+            item = by_statement.setdefault(entry["statement"], {"count": 0, "seconds": 0.0})
+            item["count"] += 1
+            item["seconds"] += entry["seconds"]
+        return {
+            "label": self.label,
+            "queries": self.count,
+            "total_seconds": self.total_seconds,
+            "budget": self.budget,
+            "statements": [
+                {"statement": statement, **stats}
+                for statement, stats in sorted(by_statement.items(), key=lambda kv: -kv[1]["seconds"])
+            ],
+            "n_plus_one": self.repeated(),
+        }
+
+
+_current_profile: ContextVar[Optional[QueryProfile]] = ContextVar("sql_profile", default=None)
+# 최근 요청 프로파일 (관리자 API에서 조회)
+recent_profiles: Deque[Dict[str, Any]] = deque(maxlen=50)
+_recent_lock = threading.Lock()
+
+
+@contextmanager
+def profile_queries(
+    label: str = "block", *, budget: Optional[int] = None, raise_on_budget: bool = True
+) -> Iterator[QueryProfile]:
+    """
+    블록 안에서 실행된 쿼리를 기록합니다. 테스트에서 쿼리 수 회귀를 잡을 때 사용합니다.
+
+        with profile_queries("read post", budget=2) as profile:
+            client.get("/api/v1/board/1")
+    """
+    profile = QueryProfile(label, budget=budget, raise_on_budget=raise_on_budget)
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+def report(profile: QueryProfile) -> None:
+    """요청이 끝났을 때 N+1 후보와 예산 초과를 로그로 남기고 최근 프로파일 목록에 추가합니다."""
+    for candidate in profile.repeated():
+        logger.warning(
+            "Possible N+1 in %s: %d x %s (from %s)",
+            profile.label, candidate["count"], candidate["statement"],
+            ", ".join(f"{site} x{count}" for site, count in candidate["call_sites"].items()),
+        )
+    if profile.budget is not None and profile.count > profile.budget:
+        logger.warning(
+            "Query budget exceeded in %s: %d queries (budget %d)",
+            profile.label, profile.count, profile.budget,
+        )
+    with _recent_lock:
+        recent_profiles.append(profile.summary())
+
+
+class SQLProfilerMiddleware:
+    """Creates a QueryProfile per HTTP request and reports it when the response is done."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if _current_profile.get() is not None:
+            # 테스트의 profile_queries() 블록 안에서 보낸 요청: 바깥 프로파일에 기록하고 그 예산을 적용합니다.
+            await self.app(scope, receive, send)
+            return
+        budget = settings.SQL_QUERY_BUDGET or None
+        with profile_queries(
+            f"{scope['method']} {scope['path']}",
+            budget=budget,
+            raise_on_budget=settings.SQL_QUERY_BUDGET_RAISE,
+        ) as profile:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                report(profile)
+
+
+def _configure_slow_query_log() -> None:
+    if settings.SQL_SLOW_QUERY_LOG_FILE and not slow_query_logger.handlers:
+        handler = logging.FileHandler(settings.SQL_SLOW_QUERY_LOG_FILE)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        slow_query_logger.addHandler(handler)
+
+
+def instrument_profiler(engine: Engine) -> None:
+    """
+    엔진에 프로파일러를 연결합니다.
+    SQL_PROFILER_ENABLED가 꺼져 있으면 profile_queries() 블록 안의 쿼리만 기록합니다. (그 밖에는 contextvar 조회만 하고 끝남)
+    """
+    if settings.SQL_PROFILER_ENABLED:
+        _configure_slow_query_log()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.setdefault("profiler_query_start", [])
+        profile = _current_profile.get()
+        if profile is None and not settings.SQL_PROFILER_ENABLED:
+            stack.append(None)
+            return
+        call_site = _call_site()
+        if profile is not None:
+            profile.check_budget(call_site)
+        stack.append((time.perf_counter(), call_site))
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        entry = conn.info["profiler_query_start"].pop()
+        if entry is None:
+            return
+        started, call_site = entry
+        elapsed = time.perf_counter() - started
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(statement, elapsed, call_site)
+        if settings.SQL_PROFILER_ENABLED and elapsed >= settings.SQL_SLOW_QUERY_SECONDS:
+            slow_query_logger.warning(
+                "Slow query (%.3fs) in %s from %s: %s",
+                elapsed, profile.label if profile else "<no request>", call_site,
+                normalize_statement(statement),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("profiler_query_start"):
+            conn.info["profiler_query_start"].pop()
@@ -1,20 +1,52 @@
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.metrics import instrument_queries
+from app.db.profiler import instrument_profiler
+from app.db.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    async_pool_monitor,
+    instrument_engine,
+    pool_options,
+    sync_pool_monitor,
+)
 
 # 데이터베이스 URL 생성
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URI
 
 # SQLAlchemy 엔진 생성
-# pool_pre_ping=True 설정은 커넥션 풀에서 연결을 가져올 때마다
-# 간단한 쿼리를 실행하여 연결이 활성 상태인지 확인합니다.
-# 이를 통해 DB 연결이 끊어진 경우 발생하는 오류를 방지할 수 있습니다.
-engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
+# 풀 크기/overflow/timeout/recycle/pre_ping은 Settings(DB_POOL_*)에서 설정합니다.
+# pool_pre_ping은 커넥션 풀에서 연결을 가져올 때마다 간단한 쿼리로 연결이 살아 있는지 확인하여
+# DB 연결이 끊어진 경우 발생하는 오류를 방지합니다.
+# 계측용 풀 클래스가 checkout 대기 시간/사용 중/overflow 수를 기록합니다. (/api/v1/admin/db-pool)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, poolclass=InstrumentedQueuePool, **pool_options())
+instrument_engine(engine, sync_pool_monitor)
+# 요청별 쿼리 수/DB 시간 집계 (/metrics), SQL 프로파일러 (SQL_PROFILER_ENABLED일 때만)
+instrument_queries(engine)
+instrument_profiler(engine)
 
 # 데이터베이스 세션 생성을 위한 SessionLocal 클래스 정의
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# 비동기 엔진 (asyncpg)
+# API 엔드포인트는 이 엔진을 사용하여 스레드 풀을 거치지 않고 이벤트 루프에서 DB를 기다립니다.
+# 동기 엔진(engine/SessionLocal)은 initial_data, 마이그레이션, 스크립트와 스트리밍 응답에서 계속 사용합니다.
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URI, poolclass=InstrumentedAsyncQueuePool, **pool_options()
+)
+instrument_engine(async_engine.sync_engine, async_pool_monitor)
+instrument_queries(async_engine.sync_engine)
+instrument_profiler(async_engine.sync_engine)
+
+# expire_on_commit=False: 커밋 후 응답을 직렬화할 때 속성 접근이 추가 쿼리(지연 로딩)를 일으키지 않도록 합니다.
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
 # API 엔드포인트에 DB 세션을 제공하는 의존성 함수
 def get_db():
     """
@@ -27,3 +59,11 @@ def get_db():
     finally:
         db.close()
 
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    비동기 엔드포인트용 의존성 함수로, 요청마다 AsyncSession을 생성하고 요청이 끝나면 닫아줍니다.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
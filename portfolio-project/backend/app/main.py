@@ -1,11 +1,19 @@
 from fastapi import FastAPI
+from fastapi.responses import Response
 from starlette.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles # ✅ StaticFiles import 추가
+import asyncio
 import logging
 
 from app.api.v1.api_router import api_router
 from app.core.config import settings
-from app.db.session import engine, SessionLocal
+from app.core.browser_pool import browser_pool
+from app.core.image_fetcher import remote_image_fetcher
+from app.core.image_jobs import image_jobs
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, MetricsMiddleware, metrics
+from app.core.password_hasher import password_hasher
+from app.db.profiler import SQLProfilerMiddleware
+from app.db.session import async_engine, engine, SessionLocal
 from app.db import base
 from app.initial_data import init_db
 
@@ -38,6 +46,32 @@ def on_startup():
         db.close()
     logger.info("초기 데이터 확인 및 생성이 완료되었습니다.")
 
+
+@app.on_event("startup")
+async def start_browser_pool():
+    # PDF 생성용 Chromium을 미리 띄워 첫 요청의 브라우저 기동 지연을 없앱니다.
+    try:
+        await browser_pool.start()
+    except Exception:
+        # Playwright/Chromium이 없는 환경에서도 API 서버는 정상 기동되어야 합니다.
+        logger.exception("PDF 브라우저 풀을 시작하지 못했습니다. 첫 PDF 요청 시 다시 시도합니다.")
+
+
+@app.on_event("startup")
+async def warm_up_password_hasher():
+    await password_hasher.warm_up()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    # 장기 실행 리소스(브라우저, HTTP 커넥션 풀, 이미지/비밀번호 해시 워커, DB 커넥션 풀)를 정리합니다.
+    await browser_pool.close()
+    await remote_image_fetcher.close()
+    # 워커 풀 종료는 실행 중인 작업이 끝날 때까지 기다리므로, 이벤트 루프를 막지 않도록 별도 스레드에서 실행합니다.
+    await asyncio.to_thread(image_jobs.shutdown)
+    await asyncio.to_thread(password_hasher.shutdown)
+    await async_engine.dispose()
+
 # CORS 미들웨어 설정
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
@@ -46,8 +80,27 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # 브라우저의 fetch에서 읽을 수 있도록 커스텀 응답 헤더를 노출합니다.
+        expose_headers=["X-Next-Cursor"],
     )
 
+# SQL 프로파일러 (개발/테스트용 옵션)
+if settings.SQL_PROFILER_ENABLED:
+    app.add_middleware(SQLProfilerMiddleware)
+
+# 요청 지표 수집 미들웨어 (가장 바깥에 두어 CORS 등 다른 미들웨어 시간까지 포함)
+app.add_middleware(MetricsMiddleware)
+
 # API 라우터 포함
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics() -> Response:
+    """
+    라우트별 응답 시간 히스토그램, 상태 코드별 요청 수, 처리 중 요청 수, 요청당 쿼리 수/DB 시간을
+    Prometheus 텍스트 형식으로 반환합니다.
+    nginx는 /api/ 경로만 백엔드로 전달하므로 외부에는 노출되지 않습니다. (내부 네트워크에서 수집)
+    """
+    return Response(content=metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
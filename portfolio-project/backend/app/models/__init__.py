@@ -1,3 +1,4 @@
 from .user import User
-from .board import Board
+from .board import Board, BoardVersion
+from .tag import Tag, board_tag
 
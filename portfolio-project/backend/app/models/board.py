@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import BigInteger, Column, Computed, Integer, String, Text, ForeignKey, DateTime, Index, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 # 프로젝트의 Base 클래스 경로에 맞게 import 합니다.
 # 이전 컨텍스트에 따라 app.db.base_class.py 로 가정합니다.
 from app.db.base import Base
 
+# 전문 검색(Full-Text Search)에 사용하는 텍스트 검색 설정
+# 한국어 형태소 분석기가 기본 제공되지 않으므로 언어 규칙이 없는 'simple'을 사용하고,
+# 검색 시 접두어 매칭(:*)으로 조사가 붙은 단어도 찾을 수 있게 합니다.
+SEARCH_TS_CONFIG = "simple"
 
 class Board(Base):
     id = Column(Integer, primary_key=True, index=True)
@@ -16,7 +21,14 @@ class Board(Base):
     slug = Column(String(50), unique=True, index=True, nullable=True)
 
     # --- 태그 및 소유자 정보 ---
+    # 쉼표로 구분된 태그 문자열 (API 응답 호환용 표시 값)
+    # 필터링은 정규화된 tag / board_tag 테이블(tag_items)을 사용하며, CRUD에서 함께 갱신됩니다.
     tags = Column(String(255), nullable=True)
+
+    # --- 목록 화면용 요약 (본문 저장 시 app.utils.content로 계산) ---
+    # 목록 조회는 이 컬럼들만 읽고, 본문(content)은 상세 조회에서만 읽습니다.
+    excerpt = Column(String(300), nullable=True)
+    cover_image = Column(String(500), nullable=True)
     # 모든 게시글은 소유자가 있어야 하므로 nullable=False를 유지하는 것이 좋습니다.
     owner_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     
@@ -25,7 +37,42 @@ class Board(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # --- 전문 검색용 tsvector (제목 가중치 A, 본문 가중치 B) ---
+    # PostgreSQL 생성 컬럼(STORED)이라 INSERT/UPDATE 시 자동으로 갱신되며, GIN 인덱스로 검색합니다.
+    # 본문 전체 크기에 비례하므로 deferred로 지정해 일반 조회 시에는 읽지 않습니다.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_TS_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_TS_CONFIG}', coalesce(content, '')), 'B')",
+            persisted=True,
+        ),
+    ))
+
+    __table_args__ = (
+        Index("ix_board_search_vector", "search_vector", postgresql_using="gin"),
+        # 게시글 목록의 정렬/키셋 페이지네이션용 부분 인덱스 (고정 페이지 제외)
+        Index(
+            "ix_board_posts_created_at_id", "created_at", "id",
+            postgresql_where=text("slug IS NULL"),
+        ),
+    )
+
     # --- 관계 설정 ---
     # User 모델과의 양방향 관계를 위해 back_populates를 명시하는 것이 표준적입니다.
     owner = relationship("User", back_populates="posts")
+    tag_items = relationship("Tag", secondary="board_tag", back_populates="posts")
+
+
+class BoardVersion(Base):
+    """
+    게시글 전체의 버전 (id=1인 행 하나). 목록/태그/sitemap 응답의 ETag와 캐시 키로 사용합니다.
+    게시글 생성/수정/삭제 시 CRUD 계층에서 같은 트랜잭션으로 올리므로, 매 요청마다 board 전체를 집계하지 않습니다.
+    """
+    __tablename__ = "board_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    # 마지막으로 게시글이 바뀐 시각 (sitemap lastmod)
+    last_modified = Column(DateTime(timezone=True), nullable=True)
 
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Table
+from sqlalchemy.orm import relationship
+
+from app.db.base import Base
+
+# 게시글-태그 다대다 연결 테이블
+# 기본키(board_id, tag_id)는 게시글 -> 태그 방향을, 보조 인덱스(tag_id, board_id)는
+# 태그 -> 게시글 방향(태그 필터링) 조회를 인덱스만으로 처리합니다.
+board_tag = Table(
+    "board_tag",
+    Base.metadata,
+    Column("board_id", Integer, ForeignKey("board.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tag.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_board_tag_tag_id_board_id", "tag_id", "board_id"),
+)
+
+
+class Tag(Base):
+    """정규화된 태그. 이름은 대소문자까지 정확히 일치해야 같은 태그입니다."""
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), unique=True, index=True, nullable=False)
+    # 이 태그가 달린 일반 게시글(고정 페이지 제외) 수
+    # 게시글 생성/수정/삭제 시 같은 트랜잭션에서 증감되며, CRUDBoard.recount_tags로 재계산할 수 있습니다.
+    post_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    posts = relationship("Board", secondary=board_tag, back_populates="tag_items")
@@ -0,0 +1,284 @@
+"""
+Portfolio export / import.
+
+An archive is a gzip-compressed tar stream:
+
+    manifest.json             format name/version and export time
+    posts/000001.ndjson       one JSON object per line, POSTS_PER_FILE posts per file
+    posts/000002.ndjson
+    ...
+    images/<file name>        every /static/images file referenced by a post
+
+Export streams rows from a server-side cursor and writes each NDJSON chunk
+and image as soon as it is ready, so memory stays flat regardless of the
+number of posts. Import reads the archive as a stream as well and upserts
+posts in batches (one transaction and a handful of statements per batch),
+then fixes the id sequence and tag counts once at the end.
+
+    python -m app.portfolio_archive export portfolio.tar.gz
+    python -m app.portfolio_archive import portfolio.tar.gz [--owner admin]
+"""
+import argparse
+import gzip
+import io
+import json
+import logging
+import re
+import shutil
+import tarfile
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMAT = "portfolio-archive"
+ARCHIVE_VERSION = 1
+POSTS_PER_FILE = 1000
+IMAGE_DIRECTORY = Path("app/static/images")
+# 본문에서 참조하는 업로드 이미지 (/static/images/<파일명>)
+IMAGE_REFERENCE = re.compile(r"/static/images/([A-Za-z0-9][A-Za-z0-9._-]*)")
+SAFE_IMAGE_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,254}$")
+
+
+class ArchiveError(ValueError):
+    """Raised when an archive is malformed or uses an unsupported format."""
+
+
+# --- 내보내기 ---
+
+class _ChunkSink(io.RawIOBase):
+    """gzip/tar가 쓴 바이트를 모아 두었다가 스트리밍 응답에 넘겨주는 버퍼"""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _add_member(tar: tarfile.TarFile, name: str, data: bytes, mtime: float) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = mtime
+    tar.addfile(info, io.BytesIO(data))
+
+
+def iter_export(db: Session, *, compresslevel: int = 6) -> Iterator[bytes]:
+    """아카이브를 압축된 바이트 조각으로 생성합니다. (HTTP 스트리밍 응답과 파일 저장에 공통 사용)"""
+    from app.crud import crud_board
+
+    sink = _ChunkSink()
+    gz = gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=compresslevel)
+    # 스트림 모드("w|")는 되감기(seek) 없이 순서대로만 기록합니다.
+    tar = tarfile.open(fileobj=gz, mode="w|")
+    now = time.time()
+
+    manifest = {
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "posts_per_file": POSTS_PER_FILE,
+    }
+    _add_member(tar, "manifest.json", json.dumps(manifest).encode(), now)
+
+    images = set()
+    lines: List[bytes] = []
+    file_number = 0
+    for row in crud_board.board.iter_archive_rows(db, batch_size=POSTS_PER_FILE):
+        images.update(IMAGE_REFERENCE.findall(row["content"] or ""))
+        lines.append(json.dumps(row, ensure_ascii=False, default=_json_default).encode() + b"\n")
+        if len(lines) >= POSTS_PER_FILE:
+            file_number += 1
+            _add_member(tar, f"posts/{file_number:06d}.ndjson", b"".join(lines), now)
+            lines = []
+            yield sink.drain()
+    if lines:
+        file_number += 1
+        _add_member(tar, f"posts/{file_number:06d}.ndjson", b"".join(lines), now)
+        yield sink.drain()
+
+    missing = 0
+    for name in sorted(images):
+        path = IMAGE_DIRECTORY / name
+        if not path.is_file():
+            missing += 1
+            continue
+        # 이미지 파일은 메모리에 올리지 않고 파일에서 바로 tar로 복사합니다.
+        tar.add(str(path), arcname=f"images/{name}", recursive=False)
+        yield sink.drain()
+
+    if missing:
+        logger.warning("%d referenced images were not found in %s and were not exported", missing, IMAGE_DIRECTORY)
+
+    tar.close()
+    gz.close()
+    yield sink.drain()
+
+
+def export_to_file(db: Session, path: Path) -> None:
+    with open(path, "wb") as out:
+        for chunk in iter_export(db):
+            out.write(chunk)
+
+
+# --- 가져오기 ---
+
+def _parse_row(line: bytes) -> Dict[str, Any]:
+    try:
+        row = json.loads(line)
+    except ValueError as exc:
+        raise ArchiveError(f"Invalid NDJSON line: {exc}") from exc
+    if not isinstance(row, dict) or not row.get("title") or row.get("content") is None:
+        raise ArchiveError("Post rows need at least 'title' and 'content'")
+    for key in ("created_at", "updated_at"):
+        if row.get(key):
+            try:
+                row[key] = datetime.fromisoformat(row[key])
+            except (TypeError, ValueError) as exc:
+                raise ArchiveError(f"Invalid {key}: {exc}") from exc
+    if not row.get("created_at"):
+        row.pop("created_at", None)
+    if not row.get("slug") and not isinstance(row.get("id"), int):
+        raise ArchiveError("Posts without a slug need an integer 'id'")
+    return row
+
+
+def _extract_image(tar: tarfile.TarFile, member: tarfile.TarInfo, name: str) -> bool:
+    """
+    이미지 하나를 업로드 디렉터리에 저장합니다. 경로 조작(../, 절대 경로, 링크)과 과대 파일은 거부합니다.
+    같은 이름의 파일이 이미 있으면 그대로 둡니다. (업로드 파일명은 UUID라 내용이 같음)
+    """
+    if not member.isfile() or not SAFE_IMAGE_NAME.match(name) or member.size > settings.UPLOAD_MAX_BYTES:
+        logger.warning("Skipping unsafe archive member: %s", member.name)
+        return False
+    target = IMAGE_DIRECTORY / name
+    if target.exists():
+        return False
+    source = tar.extractfile(member)
+    IMAGE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    # 임시 파일에 쓴 뒤 이름을 바꿔, 중간에 실패해도 반쯤 쓰인 이미지가 남지 않게 합니다.
+    with tempfile.NamedTemporaryFile(dir=IMAGE_DIRECTORY, prefix=".import-", delete=False) as tmp:
+        shutil.copyfileobj(source, tmp)
+    Path(tmp.name).replace(target)
+    return True
+
+
+def import_archive(
+    db: Session, fileobj: IO[bytes], *, owner_id: int, batch_size: int = POSTS_PER_FILE
+) -> Dict[str, Any]:
+    """
+    아카이브를 스트림으로 읽어 batch_size개씩 upsert합니다.
+    slug가 있는 글은 slug 기준, 나머지는 id 기준으로 덮어쓰며, 끝나면 ID 시퀀스와 태그 개수를 맞춥니다.
+    """
+    from app.crud import crud_board
+
+    stats = {"posts": 0, "saved": 0, "skipped": 0, "images": 0, "seconds": 0.0}
+    started = time.perf_counter()
+    batch: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        if batch:
+            result = crud_board.board.upsert_archive_batch(db, rows=batch, owner_id=owner_id)
+            stats["saved"] += result["saved"]
+            stats["skipped"] += result["skipped"]
+            batch.clear()
+
+    try:
+        with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+            for member in tar:
+                if member.name == "manifest.json":
+                    try:
+                        manifest = json.load(tar.extractfile(member))
+                    except ValueError as exc:
+                        raise ArchiveError(f"Invalid manifest: {exc}") from exc
+                    if not isinstance(manifest, dict) or manifest.get("format") != ARCHIVE_FORMAT or manifest.get("version") != ARCHIVE_VERSION:
+                        raise ArchiveError(f"Unsupported archive format: {manifest.get('format')} v{manifest.get('version')}")
+                elif member.name.startswith("posts/") and member.name.endswith(".ndjson") and member.isfile():
+                    for line in tar.extractfile(member):
+                        if not line.strip():
+                            continue
+                        batch.append(_parse_row(line))
+                        stats["posts"] += 1
+                        if len(batch) >= batch_size:
+                            flush()
+                elif member.name.startswith("images/"):
+                    if _extract_image(tar, member, member.name[len("images/"):]):
+                        stats["images"] += 1
+                else:
+                    logger.warning("Ignoring unknown archive member: %s", member.name)
+            flush()
+    except (tarfile.TarError, EOFError, OSError) as exc:
+        db.rollback()
+        raise ArchiveError(f"Could not read archive: {exc}") from exc
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        # 일부 묶음만 저장된 경우에도 시퀀스와 태그 개수는 실제 데이터와 맞춰 둡니다.
+        if stats["saved"]:
+            crud_board.board.finish_archive_import(db)
+
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from app import models  # noqa: F401 - 모든 모델을 매퍼에 등록
+    from app.crud import crud_user
+    from app.db.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Export or import portfolio posts and images.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="write an archive")
+    export_parser.add_argument("path", type=Path)
+    import_parser = subparsers.add_parser("import", help="load an archive")
+    import_parser.add_argument("path", type=Path)
+    import_parser.add_argument("--owner", default=settings.FIRST_ADMIN_USERNAME, help="username to own imported posts")
+    import_parser.add_argument("--batch-size", type=int, default=POSTS_PER_FILE)
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        if args.command == "export":
+            started = time.perf_counter()
+            export_to_file(db, args.path)
+            print(f"Exported to {args.path} ({args.path.stat().st_size} bytes) in {time.perf_counter() - started:.1f}s")
+        else:
+            owner = crud_user.user.get_by_username(db, username=args.owner)
+            if owner is None:
+                raise SystemExit(f"User '{args.owner}' not found")
+            with open(args.path, "rb") as archive:
+                stats = import_archive(db, archive, owner_id=owner.id, batch_size=args.batch_size)
+            rate = stats["posts"] / stats["seconds"] if stats["seconds"] else 0
+            print(
+                f"Imported {stats['posts']} posts ({stats['saved']} saved, {stats['skipped']} skipped), "
+                f"{stats['images']} images in {stats['seconds']:.1f}s ({rate:.0f} posts/s)"
+            )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
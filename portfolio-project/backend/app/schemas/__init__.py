@@ -1,6 +1,8 @@
 # 이 파일을 통해 다른 모듈에서 'from app.schemas import Board, User, Token' 와 같이
 # 각 스키마 클래스를 쉽게 import할 수 있습니다.
 
-from .board import Board, BoardCreate, BoardUpdate
+from .board import (
+    Board, BoardBulkDelete, BoardBulkResult, BoardBulkUpdateItem, BoardCreate, BoardSummary, BoardUpdate,
+)
 from .user import User, UserCreate, UserUpdate
 from .token import Token, TokenPayload
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 # --- 게시글 데이터의 기본 형태 ---
@@ -33,6 +33,41 @@ class Board(BaseModel):
     owner_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
+    # 전문 검색 결과일 때만 채워지는, 검색어가 <mark>로 강조된 본문 발췌
+    snippet: Optional[str] = None
 
     class Config:
         from_attributes = True # SQLAlchemy 모델 객체를 Pydantic 모델로 변환 가능하게 함
+
+# --- 목록 화면(카드)용 요약 응답 스키마 ---
+# 본문(content) 대신 저장된 발췌문과 대표 이미지만 내려주어 응답 크기를 줄입니다.
+class BoardSummary(BaseModel):
+    id: int
+    title: str
+    tags: Optional[str] = None
+    owner_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    excerpt: Optional[str] = None
+    cover_image: Optional[str] = None
+    # 전문 검색 결과일 때만 채워지는, 검색어가 <mark>로 강조된 본문 발췌
+    snippet: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+# --- 일괄 처리(관리자 API)용 스키마 ---
+class BoardBulkUpdateItem(BoardUpdate):
+    id: int
+
+class BoardBulkDelete(BaseModel):
+    ids: List[int]
+
+# 일괄 처리 결과는 입력 순서(index)대로 항목별 성공/실패를 담습니다.
+# status: created / updated / deleted / not_found / invalid
+class BoardBulkResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    status: str
+    detail: Optional[str] = None
+    post: Optional[Board] = None
@@ -0,0 +1,61 @@
+"""
+게시글 본문(TipTap HTML 또는 마크다운)에서 목록 화면용 요약 정보를 추출합니다.
+결과는 게시글 저장 시 board.excerpt / board.cover_image 컬럼에 저장되므로
+목록 조회에서는 본문 전체를 읽지 않아도 됩니다.
+"""
+import html
+import re
+from typing import Optional
+
+# 목록 카드에 보여줄 발췌문 최대 길이 (글자 수)
+EXCERPT_LENGTH = 200
+# cover_image 컬럼 크기
+COVER_IMAGE_MAX_LENGTH = 500
+
+_HTML_IMG_RE = re.compile(r"""<img[^>]+src=["']([^"'>]+)["']""", re.IGNORECASE)
+_MD_IMG_RE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)")
+
+_BLOCK_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_MD_CODE_FENCE_RE = re.compile(r"^\s*(```|~~~).*$", re.MULTILINE)
+_MD_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_MD_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_MD_LINE_PREFIX_RE = re.compile(r"^\s{0,3}(#{1,6}\s+|>\s?|[-*+]\s+|\d+\.\s+)", re.MULTILINE)
+_MD_EMPHASIS_RE = re.compile(r"(\*\*|__|\*|~~|`)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def find_cover_image(content: Optional[str]) -> Optional[str]:
+    """본문의 첫 번째 이미지 경로를 반환합니다. (HTML <img> 우선, 없으면 마크다운 이미지)"""
+    if not content:
+        return None
+    match = _HTML_IMG_RE.search(content) or _MD_IMG_RE.search(content)
+    if not match:
+        return None
+    src = html.unescape(match.group(1)).strip()
+    # data URI 등 컬럼 크기를 넘는 값은 저장하지 않습니다.
+    if not src or len(src) > COVER_IMAGE_MAX_LENGTH:
+        return None
+    return src
+
+
+def make_excerpt(content: Optional[str], length: int = EXCERPT_LENGTH) -> str:
+    """HTML 태그와 마크다운 문법을 제거한 본문 앞부분을 단어 경계에서 잘라 반환합니다."""
+    if not content:
+        return ""
+    text = _BLOCK_RE.sub(" ", content)
+    text = _TAG_RE.sub(" ", text)
+    text = _MD_CODE_FENCE_RE.sub(" ", text)
+    text = _MD_IMAGE_RE.sub(" ", text)
+    text = _MD_LINK_RE.sub(r"\1", text)
+    text = _MD_LINE_PREFIX_RE.sub("", text)
+    text = _MD_EMPHASIS_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", html.unescape(text)).strip()
+    if len(text) <= length:
+        return text
+    cut = text[:length]
+    # 단어 중간에서 자르지 않도록 마지막 공백까지 되돌립니다. (공백이 너무 앞이면 그대로 자름)
+    space = cut.rfind(" ")
+    if space > length * 0.6:
+        cut = cut[:space]
+    return cut.rstrip() + "…"
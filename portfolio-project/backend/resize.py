@@ -1,4 +1,11 @@
+import argparse
+import hashlib
+import json
+import os
 import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from PIL import Image
 
@@ -22,75 +29,222 @@ TARGET_WIDTH = 1024
 # 처리할 이미지 확장자
 SUPPORTED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
 
+# 처리 결과를 기록하는 매니페스트 파일 (다음 실행 시 변경된 파일만 다시 처리)
+MANIFEST_NAME = ".resize_manifest.json"
+MANIFEST_VERSION = 1
+
 # --- 스크립트 본문 ---
 
-def resize_existing_images():
+
+def _variant(target_width: int) -> str:
+    """매니페스트에 기록되는 변환 규칙 식별자. 규칙이 바뀌면 모든 파일을 다시 검사합니다."""
+    return f"max-w{target_width}"
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") == MANIFEST_VERSION:
+            return data.get("files", {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def save_manifest(path: Path, files: dict) -> None:
+    """임시 파일에 쓴 뒤 rename 하여 매니페스트를 원자적으로 교체합니다."""
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(
+        json.dumps({"version": MANIFEST_VERSION, "files": files}, ensure_ascii=False, indent=2, sort_keys=True),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, path)
+
+
+def process_image(file_path: str, target_width: int, known_sha256: str, dry_run: bool) -> dict:
     """
-    UPLOAD_DIRECTORY 내의 모든 이미지를 TARGET_WIDTH (512px)로 리사이즈합니다.
-    비율은 유지하며, 원본 파일을 덮어씁니다.
+    이미지 하나를 검사하고, 가로가 target_width보다 크면 비율을 유지해 축소합니다.
+    원본은 임시 파일에 저장한 뒤 rename 으로 교체되므로 중간에 중단되어도 손상되지 않습니다.
+    (프로세스 풀 워커에서 실행됩니다.)
+    """
+    path = Path(file_path)
+    result = {"name": path.name, "bytes_in": path.stat().st_size}
+    sha256 = _sha256(path)
+
+    if sha256 == known_sha256:
+        # 수정 시간만 바뀌고 내용은 그대로인 파일
+        result.update(status="unchanged", sha256=sha256)
+        return result
+
+    with Image.open(path) as img:
+        original_width, original_height = img.size
+        image_format = img.format
+
+        # 이미 목표 가로 크기 이하인 경우 (확대하지 않음)
+        if original_width <= target_width:
+            result.update(status="skip", sha256=sha256, width=original_width, height=original_height)
+            return result
+
+        # 리사이즈 로직 (API 스크립트와 동일)
+        aspect_ratio = original_height / float(original_width)
+        target_height = int(target_width * aspect_ratio)
+
+        if dry_run:
+            result.update(status="would-resize", width=original_width, height=original_height,
+                          new_width=target_width, new_height=target_height)
+            return result
+
+        # 고품질 Lanczos 필터 사용
+        img_resized = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+
+    # 저장 옵션 준비 (API 스크립트와 동일)
+    save_kwargs = {}
+    file_extension = path.suffix.lower()
+
+    if file_extension in [".jpg", ".jpeg"]:
+        save_kwargs['quality'] = 90
+        if img_resized.mode in ("RGBA", "P", "LA"):
+            img_resized = img_resized.convert("RGB")
+    elif file_extension == ".png":
+        save_kwargs['optimize'] = True
+
+    # 원본 파일을 원자적으로 교체 (임시 파일 저장 후 rename)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        img_resized.save(tmp_path, format=image_format, **save_kwargs)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    result.update(status="ok", sha256=_sha256(path), width=original_width, height=original_height,
+                  new_width=target_width, new_height=target_height)
+    return result
+
+
+def resize_existing_images(workers=None, dry_run=False, force=False):
+    """
+    UPLOAD_DIRECTORY 내의 이미지 중 가로가 TARGET_WIDTH (1024px)보다 큰 것만 리사이즈합니다.
+    비율은 유지하며, 원본 파일을 원자적으로 덮어씁니다.
+
+    - 여러 프로세스에서 병렬로 처리합니다 (workers, 기본값: CPU 코어 수)
+    - 매니페스트(해시/크기/변환 규칙)를 저장하여 재실행 시 변경된 파일만 처리합니다 (force로 무시)
+    - dry_run이면 파일과 매니페스트를 변경하지 않고 처리 대상만 보고합니다.
     """
     if not UPLOAD_DIRECTORY.exists():
         print(f"오류: 디렉터리를 찾을 수 없습니다: {UPLOAD_DIRECTORY}")
         print("스크립트가 프로젝트 루트 디렉터리에 있는지 확인하세요.")
         sys.exit(1)
 
-    print(f"이미지 일괄 리사이즈 작업을 시작합니다...")
+    workers = workers or os.cpu_count() or 1
+    variant = _variant(TARGET_WIDTH)
+    manifest_path = UPLOAD_DIRECTORY / MANIFEST_NAME
+    manifest = {} if force else load_manifest(manifest_path)
+
+    print(f"이미지 일괄 리사이즈 작업을 시작합니다...{' (dry-run)' if dry_run else ''}")
     print(f"대상 디렉터리: {UPLOAD_DIRECTORY}")
-    print(f"목표 가로 크기: {TARGET_WIDTH}px (비율 유지)")
+    print(f"목표 가로 크기: {TARGET_WIDTH}px (비율 유지), 워커: {workers}")
     print("-" * 40)
 
-    processed_count = 0
-    skipped_count = 0
-    failed_count = 0
+    started = time.perf_counter()
+    counts = {"ok": 0, "would-resize": 0, "skip": 0, "unchanged": 0, "fail": 0}
+    bytes_in = 0
+    new_manifest = {}
+    candidates = []
 
-    # 디렉터리 내의 모든 파일 순회
-    for file_path in UPLOAD_DIRECTORY.glob('*'):
+    # 디렉터리 내의 모든 파일 순회: 매니페스트와 크기/수정 시간이 같으면 열어보지도 않고 건너뜀
+    for file_path in sorted(UPLOAD_DIRECTORY.glob('*')):
         # 파일이 아니거나 지원하는 확장자가 아니면 건너뜀
         if not file_path.is_file() or file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
             continue
+        stat = file_path.stat()
+        entry = manifest.get(file_path.name)
+        if (entry and entry.get("variant") == variant
+                and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns):
+            new_manifest[file_path.name] = entry
+            counts["unchanged"] += 1
+            continue
+        known_sha256 = entry.get("sha256") if entry and entry.get("variant") == variant else None
+        candidates.append((file_path, known_sha256, entry))
+
+    print(f"검사 대상: {len(candidates)}개 (변경 없음: {counts['unchanged']}개)")
+
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(process_image, str(path), TARGET_WIDTH, known_sha256, dry_run): (path, entry)
+            for path, known_sha256, entry in candidates
+        }
+        for future in as_completed(futures):
+            path, entry = futures[future]
+            done += 1
+            progress = f"[{done}/{len(candidates)}]"
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"{progress} [FAIL] {path.name} 처리 중 오류 발생: {e}")
+                counts["fail"] += 1
+                if entry:
+                    new_manifest[path.name] = entry
+                continue
+
+            status = result["status"]
+            counts[status] += 1
+            bytes_in += result["bytes_in"]
+            if status == "ok":
+                print(f"{progress} [OK] {path.name} ({result['width']}px -> {result['new_width']}px)")
+            elif status == "would-resize":
+                print(f"{progress} [DRY-RUN] {path.name} ({result['width']}px -> {result['new_width']}px)")
+            elif status == "skip":
+                print(f"{progress} [SKIP] {path.name} (이미 {TARGET_WIDTH}px 이하입니다: {result['width']}px)")
+
+            if status == "would-resize":
+                if entry:
+                    new_manifest[path.name] = entry
+                continue
+            stat = path.stat()
+            record = dict(entry or {})
+            record.update(variant=variant, sha256=result["sha256"], size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            if "new_width" in result:
+                record.update(width=result["new_width"], height=result["new_height"])
+            elif "width" in result:
+                record.update(width=result["width"], height=result["height"])
+            new_manifest[path.name] = record
 
-        try:
-            # 이미지 열기
-            with Image.open(file_path) as img:
-                original_width, original_height = img.size
-                
-                # 이미 목표 가로 크기와 같은 경우
-                if original_width == TARGET_WIDTH:
-                    print(f"[SKIP] {file_path.name} (이미 {TARGET_WIDTH}px 입니다)")
-                    skipped_count += 1
-                    continue
-                
-                # 리사이즈 로직 (API 스크립트와 동일)
-                aspect_ratio = original_height / float(original_width)
-                target_height = int(TARGET_WIDTH * aspect_ratio)
-                
-                # 고품질 Lanczos 필터 사용
-                img_resized = img.resize((TARGET_WIDTH, target_height), Image.Resampling.LANCZOS)
-                
-                # 저장 옵션 준비 (API 스크립트와 동일)
-                save_kwargs = {}
-                file_extension = file_path.suffix.lower()
-                
-                if file_extension in [".jpg", ".jpeg"]:
-                    save_kwargs['quality'] = 90
-                    if img_resized.mode in ("RGBA", "P", "LA"):
-                        img_resized = img_resized.convert("RGB")
-                elif file_extension == ".png":
-                    save_kwargs['optimize'] = True
-                
-                # 원본 파일 덮어쓰기
-                img_resized.save(file_path, **save_kwargs)
-                
-                print(f"[OK] {file_path.name} ({original_width}px -> {TARGET_WIDTH}px)")
-                processed_count += 1
-
-        except Exception as e:
-            print(f"[FAIL] {file_path.name} 처리 중 오류 발생: {e}")
-            failed_count += 1
+    if not dry_run:
+        save_manifest(manifest_path, new_manifest)
 
+    elapsed = time.perf_counter() - started
+    checked = len(candidates)
     print("-" * 40)
     print("작업 완료.")
-    print(f"요약: 성공={processed_count}, 스킵={skipped_count}, 실패={failed_count}")
+    print(
+        f"요약: 성공={counts['ok']}, 스킵={counts['skip']}, 변경 없음={counts['unchanged']}, "
+        f"실패={counts['fail']}" + (f", 리사이즈 예정={counts['would-resize']}" if dry_run else "")
+    )
+    print(
+        f"처리량: {checked}개 / {elapsed:.2f}초 "
+        f"({checked / elapsed if elapsed else 0:.1f} files/s, "
+        f"{bytes_in / (1024 * 1024) / elapsed if elapsed else 0:.1f} MB/s)"
+    )
+    return counts
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=f"app/static/images 의 이미지를 가로 {TARGET_WIDTH}px 이하로 일괄 축소합니다.")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 처리 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 변경하지 않고 처리 대상만 출력")
+    parser.add_argument("--force", action="store_true", help="매니페스트를 무시하고 모든 파일을 다시 검사")
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
     # Pillow 라이브러리가 설치되어 있는지 확인
@@ -100,5 +254,6 @@ if __name__ == "__main__":
         print("오류: 'Pillow' 라이브러리가 설치되지 않았습니다.")
         print("스크립트를 실행하기 전에 'pip install Pillow'를 실행해주세요.")
         sys.exit(1)
-        
-    resize_existing_images()
+
+    args = parse_args()
+    resize_existing_images(workers=args.workers, dry_run=args.dry_run, force=args.force)
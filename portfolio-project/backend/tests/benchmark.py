@@ -0,0 +1,500 @@
+"""
+Backend benchmark suite.
+
+Seeds a dataset of posts through the CRUD layer, then drives the hot
+endpoints in-process (ASGI, no network) and reports throughput,
+p50/p95/p99 latency and peak RSS per scenario. Results can be saved as a
+JSON baseline and compared against a later run.
+
+The seed writes to the database it is pointed at, so use a dedicated one:
+
+    cd backend
+    python -m tests.benchmark --database-uri postgresql+psycopg2://.../portfolio_bench \\
+        --posts 10000 --save tests/baselines/10k.json
+    python -m tests.benchmark --database-uri ... --posts 10000 --compare tests/baselines/10k.json
+
+Seeding is deterministic (`--seed`) and incremental: posts are identified by
+a `[bench]` title prefix and only the missing ones are created, so the 1k,
+10k and 100k datasets can be grown in place and reused between runs.
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BENCH_TITLE_PREFIX = "[bench] "
+BENCH_PAGE_SLUG_PREFIX = "bench-page-"
+BENCH_PAGE_COUNT = 20
+SEARCH_TERMS = ["kubernetes", "transformer", "latency", "포트폴리오", "database"]
+# 시나리오별 최대 RSS 측정 (Linux /proc, 10ms 간격)
+PROC_STATM = Path("/proc/self/statm")
+RSS_SAMPLE_INTERVAL = 0.01
+
+# 실제 게시글과 비슷한 분포: 소수의 태그가 대부분의 글에 붙습니다. (Zipf 가중치)
+TAG_POOL = [
+    "AI", "ML", "Python", "FastAPI", "React", "PostgreSQL", "Docker", "Kubernetes", "NLP", "LLM",
+    "Vision", "Data", "DevOps", "Frontend", "Backend", "Research", "Paper", "Project", "Career", "Life",
+    "Rust", "Go", "TypeScript", "AWS", "GCP", "Security", "Testing", "Performance", "Design", "Math",
+]
+TAG_WEIGHTS = [1 / (rank + 1) for rank in range(len(TAG_POOL))]
+WORDS = (
+    "model data training latency throughput database index query cache request response "
+    "server client kubernetes transformer attention embedding vector search ranking "
+    "portfolio project experiment result analysis pipeline deploy monitor 학습 모델 데이터 "
+    "서버 성능 최적화 실험 결과 분석 프로젝트 포트폴리오 배포 검색"
+).split()
+
+
+# --- 데이터셋 ---
+
+def _make_content(rng: random.Random) -> str:
+    # 본문 크기는 로그정규 분포 (중앙값 약 3KB, 최대 60KB), 일부 글에는 이미지 포함
+    target = min(int(rng.lognormvariate(8.0, 0.8)), 60_000)
+    paragraphs = []
+    size = 0
+    while size < target:
+        sentence = " ".join(rng.choices(WORDS, k=rng.randint(40, 120)))
+        paragraph = f"<p>{sentence}.</p>"
+        if rng.random() < 0.15:
+            paragraph += f'<p><img src="/static/images/bench-{rng.randint(1, 500)}.webp" alt=""></p>'
+        paragraphs.append(paragraph)
+        size += len(paragraph)
+    return "".join(paragraphs)
+
+
+def _make_tags(rng: random.Random) -> str:
+    count = rng.choices([1, 2, 3, 4], weights=[3, 4, 2, 1])[0]
+    tags: List[str] = []
+    while len(tags) < count:
+        tag = rng.choices(TAG_POOL, weights=TAG_WEIGHTS)[0]
+        if tag not in tags:
+            tags.append(tag)
+    return ",".join(tags)
+
+
+def seed(db, *, posts: int, seed_value: int) -> Dict[str, Any]:
+    """`[bench]` 게시글이 `posts`개가 되도록 CRUD 계층(create_with_owner)으로 부족한 만큼 생성합니다."""
+    from app import schemas
+    from app.core.config import settings
+    from app.crud import crud_board, crud_user
+    from app.models.board import Board
+
+    admin = crud_user.user.get_by_username(db, username=settings.FIRST_ADMIN_USERNAME)
+    if admin is None:
+        raise SystemExit("Admin user not found; run the app once (or app.initial_data) first.")
+
+    existing = (
+        db.query(Board).filter(Board.slug.is_(None), Board.title.startswith(BENCH_TITLE_PREFIX)).count()
+    )
+    started = time.perf_counter()
+    for index in range(existing, posts):
+        # 글 번호별로 난수 시드를 고정하여, 몇 번에 나눠 생성해도 같은 데이터셋이 만들어집니다.
+        rng = random.Random(seed_value * 1_000_003 + index)
+        title = f"{BENCH_TITLE_PREFIX}{index:06d} " + " ".join(rng.choices(WORDS, k=rng.randint(3, 8)))
+        crud_board.board.create_with_owner(
+            db,
+            obj_in=schemas.BoardCreate(title=title, content=_make_content(rng), tags=_make_tags(rng)),
+            owner_id=admin.id,
+        )
+        done = index + 1 - existing
+        if done % 1000 == 0:
+            print(f"  seeded {index + 1}/{posts} posts ({done / (time.perf_counter() - started):.0f}/s)")
+
+    for page in range(BENCH_PAGE_COUNT):
+        slug = f"{BENCH_PAGE_SLUG_PREFIX}{page}"
+        if crud_board.board.get_by_slug(db, slug=slug) is None:
+            rng = random.Random(seed_value * 7919 + page)
+            crud_board.board.create_with_owner(
+                db,
+                obj_in=schemas.BoardCreate(
+                    title=f"{BENCH_TITLE_PREFIX}page {page}", content=_make_content(rng), slug=slug
+                ),
+                owner_id=admin.id,
+            )
+    return {"posts": posts, "created": max(posts - existing, 0), "admin_id": admin.id}
+
+
+def drop(db) -> int:
+    """벤치마크용 게시글을 모두 삭제하고 태그 개수를 다시 계산합니다."""
+    from app.crud import crud_board
+    from app.models.board import Board
+
+    deleted = (
+        db.query(Board)
+        .filter(Board.title.startswith(BENCH_TITLE_PREFIX))
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    crud_board.board.recount_tags(db)
+    crud_board.board.touch_collection(db)
+    if crud_board.board.cache is not None:
+        crud_board.board.cache.clear()
+    return deleted
+
+
+# --- 측정 ---
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _rss_bytes(pid: str) -> int:
+    # statm의 두 번째 값이 상주 페이지 수입니다.
+    try:
+        return int(Path(f"/proc/{pid}/statm").read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0  # 그 사이에 종료된 프로세스
+
+
+def _descendant_pids(pid: str) -> List[str]:
+    """pid의 모든 하위 프로세스 (브라우저처럼 자식의 자식까지 포함)"""
+    pids: List[str] = []
+    stack = [pid]
+    while stack:
+        parent = stack.pop()
+        try:
+            tasks = os.listdir(f"/proc/{parent}/task")
+        except OSError:
+            continue
+        for task in tasks:
+            try:
+                children = Path(f"/proc/{parent}/task/{task}/children").read_text().split()
+            except OSError:
+                continue
+            pids.extend(children)
+            stack.extend(children)
+    return pids
+
+
+class PeakRSS:
+    """
+    시나리오 실행 중 RSS를 주기적으로 읽어 그 구간의 최고값을 기록합니다.
+    ru_maxrss는 프로세스 전체 수명의 최고값이라 앞 시나리오(예: 이미지 업로드)의 메모리가 뒤 시나리오에 남습니다.
+    self는 이 프로세스, children은 현재 살아 있는 모든 하위 프로세스(이미지 변환 워커, 브라우저 등)의 합계입니다.
+    /proc이 없는 플랫폼에서는 ru_maxrss(프로세스 전체 최고값)로 대신합니다.
+    """
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = {"self": 0, "children": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        pid = str(os.getpid())
+        self.peak["self"] = max(self.peak["self"], _rss_bytes(pid))
+        children = sum(_rss_bytes(child) for child in _descendant_pids(pid))
+        self.peak["children"] = max(self.peak["children"], children)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "PeakRSS":
+        if PROC_STATM.exists():
+            self._sample()
+            self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+
+    def result_mb(self) -> Dict[str, float]:
+        if self._thread is None:
+            # Linux 외에는 ru_maxrss가 바이트(macOS) 단위이며, children은 종료된 자식 프로세스 기준입니다.
+            scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+            return {
+                "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+                "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale,
+            }
+        return {key: value / (1024 * 1024) for key, value in self.peak.items()}
+
+
+async def _run_scenario(
+    name: str, make_request: Callable[[int], Any], *, requests: int, concurrency: int, warmup: int,
+) -> Dict[str, Any]:
+    with PeakRSS() as rss:
+        result = await _timed_requests(make_request, requests=requests, concurrency=concurrency, warmup=warmup)
+    result["peak_rss_mb"] = rss.result_mb()
+    print(
+        f"  {name:<22} {result['throughput_rps']:>8.1f} req/s  "
+        f"p50 {result['latency_ms']['p50']:>8.2f} ms  p95 {result['latency_ms']['p95']:>8.2f} ms  "
+        f"p99 {result['latency_ms']['p99']:>8.2f} ms  errors {result['errors']}  "
+        f"rss {result['peak_rss_mb']['self']:.0f} MB"
+    )
+    return result
+
+
+async def _timed_requests(
+    make_request: Callable[[int], Any], *, requests: int, concurrency: int, warmup: int
+) -> Dict[str, Any]:
+    for index in range(warmup):
+        await make_request(-index - 1)
+
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await make_request(index)
+            latencies.append(time.perf_counter() - started)
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(count for code, count in statuses.items() if not code.startswith("2"))
+    result = {
+        "requests": requests,
+        "errors": errors,
+        "statuses": statuses,
+        "throughput_rps": requests / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "mean": statistics.fmean(latencies) * 1000,
+            "p50": _percentile(latencies, 0.50) * 1000,
+            "p95": _percentile(latencies, 0.95) * 1000,
+            "p99": _percentile(latencies, 0.99) * 1000,
+            "max": latencies[-1] * 1000,
+        },
+    }
+    return result
+
+
+def _sample_image() -> bytes:
+    from PIL import Image
+
+    # 실제 사진처럼 압축이 잘 되지 않는 1600x1200 노이즈 이미지
+    image = Image.frombytes("RGB", (1600, 1200), random.Random(0).randbytes(1600 * 1200 * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def _pdf_html(index: int) -> str:
+    # 요청마다 HTML을 바꿔 PDF 캐시 대신 실제 렌더링을 측정합니다.
+    body = "".join(f"<p>{' '.join(WORDS[:60])} {index}-{row}</p>" for row in range(40))
+    return f"<html><body><h1>Benchmark {index}</h1>{body}</body></html>"
+
+
+async def run_benchmarks(args) -> Dict[str, Any]:
+    import httpx
+
+    from app.core import security
+    from app.db.session import SessionLocal
+    from app.main import app as fastapi_app
+
+    db = SessionLocal()
+    try:
+        seed_info = seed(db, posts=args.posts, seed_value=args.seed)
+    finally:
+        db.close()
+
+    token = security.create_access_token(seed_info["admin_id"])
+    admin_headers = {"Authorization": f"Bearer {token}"}
+    image_bytes = _sample_image()
+    uploaded: List[str] = []
+    popular_tag, second_tag = TAG_POOL[0], TAG_POOL[1]
+
+    scenarios: Dict[str, Callable[..., Any]] = {}
+
+    def scenario(name: str):
+        def register(fn):
+            scenarios[name] = fn
+            return fn
+        return register
+
+    transport = httpx.ASGITransport(app=fastapi_app)
+    results: Dict[str, Any] = {}
+    async with fastapi_app.router.lifespan_context(fastapi_app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            @scenario("read_posts")
+            def _(i):
+                return client.get("/api/v1/board/", params={"limit": 10})
+
+            @scenario("read_posts_tags")
+            def _(i):
+                return client.get("/api/v1/board/", params={"limit": 10, "tags": f"{popular_tag},{second_tag}"})
+
+            @scenario("read_posts_search")
+            def _(i):
+                return client.get("/api/v1/board/", params={"limit": 10, "search": SEARCH_TERMS[i % len(SEARCH_TERMS)]})
+
+            @scenario("read_posts_tags_search")
+            def _(i):
+                return client.get(
+                    "/api/v1/board/",
+                    params={"limit": 10, "tags": popular_tag, "search": SEARCH_TERMS[i % len(SEARCH_TERMS)]},
+                )
+
+            @scenario("tags_count")
+            def _(i):
+                return client.get("/api/v1/board/tags/count")
+
+            @scenario("read_post_by_slug")
+            def _(i):
+                return client.get(f"/api/v1/board/slug/{BENCH_PAGE_SLUG_PREFIX}{i % BENCH_PAGE_COUNT}")
+
+            @scenario("sitemap")
+            def _(i):
+                return client.get("/api/v1/sitemap.xml")
+
+            @scenario("upload_image")
+            async def _(i):
+                response = await client.post(
+                    "/api/v1/upload/",
+                    files={"file": ("bench.jpg", image_bytes, "image/jpeg")},
+                    headers=admin_headers,
+                )
+                if response.status_code == 200:
+                    uploaded.append(response.json().get("file_path", ""))
+                return response
+
+            @scenario("generate_pdf")
+            def _(i):
+                return client.post("/api/v1/pdf/generate", json={"html": _pdf_html(i + args.seed * 100_000)})
+
+            selected = args.scenarios or list(scenarios)
+            print(f"Running {len(selected)} scenarios on {args.posts} posts "
+                  f"({args.requests} requests, concurrency {args.concurrency})")
+            for name in selected:
+                # 업로드/PDF는 요청 하나가 무거우므로 횟수를 줄입니다.
+                heavy = name in ("upload_image", "generate_pdf")
+                requests = max(1, args.requests // 10) if heavy else args.requests
+                try:
+                    results[name] = await _run_scenario(
+                        name, scenarios[name],
+                        requests=requests, concurrency=args.concurrency, warmup=1 if heavy else args.warmup,
+                    )
+                except Exception as exc:  # noqa: BLE001 - Chromium 미설치 등 환경 문제는 건너뛰고 기록
+                    print(f"  {name:<22} skipped: {exc!r}")
+                    results[name] = {"skipped": repr(exc)}
+
+    _remove_uploads(uploaded)
+    return {"meta": _run_metadata(args), "scenarios": results}
+
+
+def _remove_uploads(public_paths: List[str]) -> None:
+    from app.api.v1.endpoints.upload import UPLOAD_DIRECTORY
+
+    for public_path in public_paths:
+        if public_path:
+            (UPLOAD_DIRECTORY / Path(public_path).name).unlink(missing_ok=True)
+
+
+def _run_metadata(args) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=False
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "posts": args.posts,
+        "seed": args.seed,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+# --- 기준값 비교 ---
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> bool:
+    """p95 지연 또는 처리량이 기준값보다 max_regression 비율 이상 나빠지거나 오류가 늘어난 시나리오가 없으면 True"""
+    if baseline.get("meta", {}).get("posts") != current["meta"]["posts"]:
+        print(f"Warning: baseline was recorded with {baseline['meta'].get('posts')} posts")
+    ok = True
+    print(f"\nCompared with baseline ({baseline['meta'].get('git_commit')}, {baseline['meta'].get('timestamp')}):")
+    for name, result in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or "skipped" in base or "skipped" in result:
+            print(f"  {name:<22} (no comparison)")
+            continue
+        p95_change = result["latency_ms"]["p95"] / base["latency_ms"]["p95"] - 1 if base["latency_ms"]["p95"] else 0.0
+        rps_change = result["throughput_rps"] / base["throughput_rps"] - 1 if base["throughput_rps"] else 0.0
+        more_errors = result["errors"] > base["errors"]
+        regressed = p95_change > max_regression or rps_change < -max_regression or more_errors
+        ok = ok and not regressed
+        print(
+            f"  {name:<22} p95 {p95_change:+7.1%}  throughput {rps_change:+7.1%}  "
+            f"errors {base['errors']} -> {result['errors']}" + ("  REGRESSION" if regressed else "")
+        )
+    return ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--database-uri", default=os.environ.get("BENCHMARK_DATABASE_URI"),
+        help="database to seed and benchmark (required; env BENCHMARK_DATABASE_URI)",
+    )
+    parser.add_argument("--posts", type=int, default=1000, help="dataset size, e.g. 1000 / 10000 / 100000")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--scenarios", nargs="*", help="subset of scenarios to run")
+    parser.add_argument("--save", type=Path, help="write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare with a saved JSON baseline")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed slowdown ratio (default 0.2)")
+    parser.add_argument("--drop", action="store_true", help="delete benchmark posts and exit")
+    args = parser.parse_args(argv)
+
+    if not args.database_uri:
+        parser.error("--database-uri (or BENCHMARK_DATABASE_URI) is required; use a dedicated database")
+    # app 모듈을 import하기 전에 설정해야 엔진이 벤치마크용 DB를 사용합니다.
+    os.environ["DATABASE_URI"] = args.database_uri
+    os.environ.pop("ASYNC_DATABASE_URI", None)
+
+    if args.drop:
+        from app.db.session import SessionLocal
+
+        db = SessionLocal()
+        try:
+            print(f"Deleted {drop(db)} benchmark posts")
+        finally:
+            db.close()
+        return 0
+
+    report = asyncio.run(run_benchmarks(args))
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"\nSaved baseline to {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if not compare(report, baseline, args.max_regression):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
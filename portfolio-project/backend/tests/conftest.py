@@ -0,0 +1,94 @@
+"""
+통합 테스트 공통 설정
+
+전문 검색, ON CONFLICT, RETURNING 등 PostgreSQL 기능을 그대로 검증하므로 실제 DB가 필요합니다.
+DATABASE_URI를 테스트용 DB로 지정하고 실행하세요. (테이블이 없으면 생성)
+필수 환경 변수가 없거나 DB에 연결할 수 없으면 테스트를 건너뜁니다.
+
+    DATABASE_URI=postgresql+psycopg2://user:pw@localhost/portfolio_test python -m pytest -q
+"""
+import pytest
+
+try:
+    from app.core.config import settings  # noqa: F401
+except Exception:  # 필수 설정(.env / 환경 변수)이 없는 환경
+    collect_ignore_glob = ["test_*.py"]
+
+# 테스트가 만든 게시글/태그 (끝나면 이 접두어로 정리)
+TEST_TITLE_PREFIX = "[test] "
+TEST_TAG_PREFIX = "test-"
+TEST_OWNER_USERNAME = "test-owner"
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    from sqlalchemy.exc import OperationalError
+
+    from app import models  # noqa: F401 - 모든 모델을 매퍼에 등록
+    from app.db import base
+    from app.db.session import engine
+
+    try:
+        base.Base.metadata.create_all(bind=engine)
+    except OperationalError as exc:
+        pytest.skip(f"Database is not available: {exc}")
+    return engine
+
+
+def _cleanup(db) -> None:
+    from sqlalchemy import delete, select
+
+    from app.crud import crud_board
+    from app.crud.base import crud_cache
+    from app.models.board import Board
+    from app.models.tag import Tag, board_tag
+
+    test_posts = select(Board.id).where(Board.title.startswith(TEST_TITLE_PREFIX))
+    db.execute(delete(board_tag).where(board_tag.c.board_id.in_(test_posts)))
+    db.execute(delete(Board).where(Board.title.startswith(TEST_TITLE_PREFIX)))
+    db.commit()
+    crud_board.board.touch_collection(db)
+    crud_board.board.recount_tags(db)
+    db.execute(delete(Tag).where(Tag.name.startswith(TEST_TAG_PREFIX)))
+    db.commit()
+    if crud_cache is not None:
+        crud_cache.clear()
+
+
+@pytest.fixture
+def db(db_engine):
+    from app.db.session import SessionLocal
+
+    session = SessionLocal()
+    _cleanup(session)
+    try:
+        yield session
+    finally:
+        session.rollback()
+        _cleanup(session)
+        session.close()
+
+
+@pytest.fixture
+def owner(db):
+    from app import schemas
+    from app.crud import crud_user
+
+    user = crud_user.user.get_by_username(db, username=TEST_OWNER_USERNAME)
+    if user is None:
+        user = crud_user.user.create(
+            db, obj_in=schemas.UserCreate(username=TEST_OWNER_USERNAME, password="test-password")
+        )
+    return user
+
+
+def api_get(url: str, **kwargs):
+    """앱에 GET 요청을 보냅니다. (lifespan의 브라우저 풀 등은 시작하지 않음)"""
+    from fastapi.testclient import TestClient
+
+    from app.db.session import async_engine
+    from app.main import app
+
+    # 컨텍스트 없이 쓰는 TestClient는 요청마다 새 이벤트 루프를 쓰므로, 요청 전에 이전 루프의 연결을 버립니다.
+    async_engine.sync_engine.dispose(close=False)
+    return TestClient(app).get(url, **kwargs)
@@ -0,0 +1,43 @@
+from app import schemas
+from app.crud import crud_board
+
+from .conftest import TEST_TITLE_PREFIX, api_get
+
+TAG = "test-paging"
+
+
+def _create_posts(db, owner, count: int):
+    # 한 트랜잭션에서 만들면 created_at이 모두 같으므로, 커서가 id로 순서를 정하는지도 함께 확인됩니다.
+    return crud_board.board.create_multi_with_owner(
+        db,
+        objs_in=[
+            schemas.BoardCreate(title=f"{TEST_TITLE_PREFIX}page {i}", content="본문", tags=TAG) for i in range(count)
+        ],
+        owner_id=owner.id,
+    )
+
+
+def test_limit_and_skip_are_bounded():
+    for path in ("/api/v1/board/", "/api/v1/board/summary"):
+        assert api_get(path, params={"limit": 0}).status_code == 422
+        assert api_get(path, params={"limit": -1}).status_code == 422
+        assert api_get(path, params={"skip": -1}).status_code == 422
+
+
+def test_cursor_with_limit_one_visits_every_post(db, owner):
+    posts = _create_posts(db, owner, 3)
+    expected = sorted((post.id for post in posts), reverse=True)
+
+    seen = []
+    params = {"tags": TAG, "limit": 1}
+    for _ in range(len(posts) + 1):
+        response = api_get("/api/v1/board/summary", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) == 1
+        seen.append(page[0]["id"])
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+        params = {"tags": TAG, "limit": 1, "cursor": cursor}
+    assert seen == expected
@@ -0,0 +1,95 @@
+"""
+일괄 처리(create_multi_with_owner / update_multi / remove_multi)가 단건 처리와 같은
+태그 개수(tag.post_count)와 태그 연결(board_tag)을 남기는지 확인합니다.
+"""
+from sqlalchemy import select
+
+from app import schemas
+from app.crud import crud_board
+from app.models.board import Board
+from app.models.tag import Tag, board_tag
+
+from .conftest import TEST_TAG_PREFIX, TEST_TITLE_PREFIX, _cleanup
+
+A, B, C = (TEST_TITLE_PREFIX + name for name in "abc")
+
+CREATE = [
+    schemas.BoardCreate(title=A, content="본문 a", tags="test-x, test-y"),
+    schemas.BoardCreate(title=B, content="본문 b", tags="test-y"),
+    # 고정 페이지의 태그는 개수에 포함되지 않습니다.
+    schemas.BoardCreate(title=C, content="본문 c", tags="test-x", slug="test-page-c"),
+]
+UPDATE = {
+    A: schemas.BoardUpdate(tags="test-z"),                            # 태그 변경
+    B: schemas.BoardUpdate(tags="test-y, test-z", slug="test-page-b"),  # 태그 변경 + slug 지정
+    C: schemas.BoardUpdate(slug=None),                                # slug 해제
+}
+REMOVE = [A, C]
+
+
+def _tag_state(db):
+    """(테스트 태그별 post_count, {(게시글 제목, 태그 이름)} 연결)"""
+    counts = dict(
+        db.execute(select(Tag.name, Tag.post_count).where(Tag.name.startswith(TEST_TAG_PREFIX))).all()
+    )
+    links = set(
+        db.execute(
+            select(Board.title, Tag.name)
+            .join(board_tag, board_tag.c.board_id == Board.id)
+            .join(Tag, Tag.id == board_tag.c.tag_id)
+            .where(Board.title.startswith(TEST_TITLE_PREFIX))
+        ).all()
+    )
+    return counts, links
+
+
+def _run_single(db, owner_id):
+    board = crud_board.board
+    posts = {obj_in.title: board.create_with_owner(db, obj_in=obj_in, owner_id=owner_id) for obj_in in CREATE}
+    states = [_tag_state(db)]
+    for title, obj_in in UPDATE.items():
+        board.update(db, db_obj=posts[title], obj_in=obj_in)
+    states.append(_tag_state(db))
+    for title in REMOVE:
+        board.remove(db, id=posts[title].id)
+    states.append(_tag_state(db))
+    return states
+
+
+def _run_bulk(db, owner_id):
+    board = crud_board.board
+    posts = {post.title: post for post in board.create_multi_with_owner(db, objs_in=CREATE, owner_id=owner_id)}
+    states = [_tag_state(db)]
+    board.update_multi(db, objs_in={posts[title].id: obj_in for title, obj_in in UPDATE.items()})
+    states.append(_tag_state(db))
+    board.remove_multi(db, ids=[posts[title].id for title in REMOVE])
+    states.append(_tag_state(db))
+    return states
+
+
+def test_bulk_tag_counts_and_links_match_single_object_crud(db, owner):
+    single = _run_single(db, owner.id)
+    _cleanup(db)
+    bulk = _run_bulk(db, owner.id)
+
+    assert bulk == single
+    created, updated, removed = bulk
+    assert created == (
+        {"test-x": 1, "test-y": 2},
+        {(A, "test-x"), (A, "test-y"), (B, "test-y"), (C, "test-x")},
+    )
+    assert updated == (
+        {"test-x": 1, "test-y": 0, "test-z": 1},
+        {(A, "test-z"), (B, "test-y"), (B, "test-z"), (C, "test-x")},
+    )
+    assert removed == (
+        {"test-x": 0, "test-y": 0, "test-z": 0},
+        {(B, "test-y"), (B, "test-z")},
+    )
+
+
+def test_bulk_tag_counts_match_recount(db, owner):
+    _run_bulk(db, owner.id)
+    counts, _ = _tag_state(db)
+    crud_board.board.recount_tags(db)
+    assert _tag_state(db)[0] == counts
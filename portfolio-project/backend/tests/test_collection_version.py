@@ -0,0 +1,38 @@
+from app import schemas
+from app.crud import crud_board
+
+from .conftest import TEST_TITLE_PREFIX, api_get
+
+
+def _version(db):
+    return crud_board.board.get_collection_version(db)[0]
+
+
+def test_crud_writes_bump_collection_version(db, owner):
+    board = crud_board.board
+    before = _version(db)
+
+    post = board.create_with_owner(db, obj_in=schemas.BoardCreate(title=TEST_TITLE_PREFIX + "v", content="c"), owner_id=owner.id)
+    board.update(db, db_obj=post, obj_in=schemas.BoardUpdate(content="c2"))
+    board.remove(db, id=post.id)
+    assert _version(db) == before + 3
+
+    posts = board.create_multi_with_owner(
+        db, objs_in=[schemas.BoardCreate(title=TEST_TITLE_PREFIX + f"v{i}", content="c") for i in range(2)], owner_id=owner.id
+    )
+    board.update_multi(db, objs_in={post.id: schemas.BoardUpdate(content="c2") for post in posts})
+    board.remove_multi(db, ids=[post.id for post in posts])
+    # 일괄 처리는 게시글 수와 상관없이 트랜잭션당 한 번 올립니다.
+    assert _version(db) == before + 6
+
+
+def test_list_etag_changes_after_write(db, owner):
+    first = api_get("/api/v1/board/summary")
+    assert api_get("/api/v1/board/summary", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    crud_board.board.create_with_owner(
+        db, obj_in=schemas.BoardCreate(title=TEST_TITLE_PREFIX + "new", content="c"), owner_id=owner.id
+    )
+    second = api_get("/api/v1/board/summary", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
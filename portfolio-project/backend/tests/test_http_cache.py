@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi import Request, Response
+
+from app.core.http_cache import conditional_response, make_etag
+
+MODIFIED = datetime(2026, 10, 18, 12, 0, 0, 500_000, tzinfo=timezone.utc)
+HTTP_DATE = "Sun, 18 Oct 2026 12:00:00 GMT"
+
+
+def _request(**headers) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def _check(request: Request, etag: str, **kwargs):
+    response = Response()
+    return conditional_response(request, response, etag=etag, last_modified=MODIFIED, max_age=30, **kwargs), response
+
+
+def test_make_etag_is_strong_and_depends_on_every_part():
+    etag = make_etag("post", 1, MODIFIED)
+    assert etag.startswith('"') and etag.endswith('"') and not etag.startswith("W/")
+    assert etag == make_etag("post", 1, MODIFIED)
+    assert etag != make_etag("post", 1, MODIFIED + timedelta(microseconds=1))
+    assert etag != make_etag("post", 2, MODIFIED)
+    # 부분의 경계도 구분됩니다. ("ab", "c") != ("a", "bc")
+    assert make_etag("ab", "c") != make_etag("a", "bc")
+
+
+def test_fresh_copy_gets_304_with_cache_headers():
+    etag = make_etag("x")
+    not_modified, _ = _check(_request(if_none_match=etag), etag)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.headers["last-modified"] == HTTP_DATE
+    assert not_modified.headers["cache-control"] == "public, max-age=30, must-revalidate"
+
+
+def test_stale_copy_sets_headers_and_continues():
+    etag = make_etag("x")
+    not_modified, response = _check(_request(if_none_match=make_etag("old")), etag)
+    assert not_modified is None
+    assert response.headers["etag"] == etag
+
+
+def test_if_none_match_accepts_lists_weak_tags_and_star():
+    etag = make_etag("x")
+    assert _check(_request(if_none_match=f'"other", W/{etag}'), etag)[0].status_code == 304
+    assert _check(_request(if_none_match="*"), etag)[0].status_code == 304
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    etag = make_etag("x")
+    not_modified, _ = _check(_request(if_none_match=make_etag("old"), if_modified_since=HTTP_DATE), etag)
+    assert not_modified is None
+
+
+def test_if_modified_since_uses_whole_seconds():
+    etag = make_etag("x")
+    assert _check(_request(if_modified_since=HTTP_DATE), etag)[0].status_code == 304
+    earlier = "Sun, 18 Oct 2026 11:59:59 GMT"
+    assert _check(_request(if_modified_since=earlier), etag)[0] is None
+    assert _check(_request(if_modified_since="not a date"), etag)[0] is None
+
+
+def test_last_modified_can_be_ignored_for_freshness():
+    etag = make_etag("x")
+    not_modified, response = _check(_request(if_modified_since=HTTP_DATE), etag, use_last_modified=False)
+    assert not_modified is None
+    assert response.headers["last-modified"] == HTTP_DATE
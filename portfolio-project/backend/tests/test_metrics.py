@@ -0,0 +1,74 @@
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.metrics import UNMATCHED_ROUTE, MetricsMiddleware, MetricsRegistry, instrument_queries
+
+
+def _client():
+    """DB 없이 확인할 수 있도록 sqlite 메모리 엔진과 작은 앱에 미들웨어를 붙입니다."""
+    registry = MetricsRegistry()
+    engine = create_engine("sqlite://")
+    instrument_queries(engine, registry)
+
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        return {"id": item_id}
+
+    @router.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a", b"b"]), media_type="text/plain")
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/board")
+    return TestClient(MetricsMiddleware(app, registry)), registry, engine
+
+
+def _lines(registry: MetricsRegistry):
+    return registry.render().splitlines()
+
+
+def test_routes_are_labelled_by_template_and_status():
+    client, registry, _ = _client()
+    client.get("/api/v1/board/items/1")
+    client.get("/api/v1/board/items/2")
+    client.get("/api/v1/board/items/x")  # 422
+    client.get("/no/such/path")
+
+    lines = _lines(registry)
+    labels = 'method="GET",route="/api/v1/board/items/{item_id}",group="api"'
+    assert f"http_requests_total{{{labels},status=\"200\"}} 2" in lines
+    assert f"http_requests_total{{{labels},status=\"422\"}} 1" in lines
+    assert f'http_requests_total{{method="GET",route="{UNMATCHED_ROUTE}",group="api",status="404"}} 1' in lines
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in lines
+    assert "http_requests_in_flight 0" in lines
+
+
+def test_db_queries_are_counted_per_request():
+    client, registry, engine = _client()
+    client.get("/api/v1/board/items/1")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 3"))
+
+    lines = _lines(registry)
+    labels = 'method="GET",route="/api/v1/board/items/{item_id}",group="api"'
+    # 요청 하나가 쿼리 2개를 실행했으므로 le="1" 버킷에는 없고 le="2" 버킷부터 포함됩니다.
+    assert f'http_request_db_queries_bucket{{{labels},le="1"}} 0' in lines
+    assert f'http_request_db_queries_bucket{{{labels},le="2"}} 1' in lines
+    assert f"http_request_db_queries_sum{{{labels}}} 2.0" in lines
+    assert "db_queries_outside_request_total 1" in lines
+
+
+def test_search_and_streaming_requests():
+    client, registry, _ = _client()
+    response = client.get("/api/v1/board/stream", params={"search": "x"})
+    assert response.text == "ab"
+
+    lines = _lines(registry)
+    assert 'http_requests_total{method="GET",route="/api/v1/board/stream",group="search",status="200"} 1' in lines
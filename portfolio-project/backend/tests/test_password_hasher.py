@@ -0,0 +1,81 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.password_hasher import PasswordHasher, PasswordHasherBusy
+
+
+def _blocking_job(release: threading.Event):
+    release.wait(5)
+    return "done"
+
+
+def test_rejects_jobs_beyond_max_pending():
+    hasher = PasswordHasher(max_workers=1, max_pending=2)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.create_task(hasher._run(_blocking_job, release)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(PasswordHasherBusy):
+            await hasher._run(_blocking_job, release)
+        release.set()
+        assert await asyncio.gather(*running) == ["done", "done"]
+        assert hasher.stats()["pending"] == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        hasher.shutdown()
+
+
+def test_cancelled_waiter_keeps_slot_until_job_finishes():
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def scenario():
+        task = asyncio.create_task(hasher._run(_blocking_job, release))
+        await asyncio.sleep(0.05)
+        # 요청이 끊겨도 스레드의 작업은 계속 실행 중이므로 자리를 비우면 안 됩니다.
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert hasher.stats()["pending"] == 1
+        with pytest.raises(PasswordHasherBusy):
+            await hasher._run(_blocking_job, release)
+
+        release.set()
+        await asyncio.to_thread(hasher.shutdown)
+        assert hasher.stats()["pending"] == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        hasher.shutdown()
+
+
+def test_login_returns_503_when_hasher_is_busy(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api.v1 import deps
+    from app.api.v1.endpoints import login
+    from app.crud import crud_user
+
+    async def busy(db, *, username, password):
+        raise PasswordHasherBusy()
+
+    async def no_db():
+        yield None
+
+    monkeypatch.setattr(crud_user.user, "aauthenticate", busy)
+    app = FastAPI()
+    app.include_router(login.router, prefix="/login")
+    app.dependency_overrides[deps.get_async_db] = no_db
+
+    response = TestClient(app).post("/login/access-token", data={"username": "a", "password": "b"})
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
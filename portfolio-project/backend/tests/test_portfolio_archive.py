@@ -0,0 +1,159 @@
+import io
+import json
+import tarfile
+
+import pytest
+
+from app import portfolio_archive
+from app.crud import crud_board
+from app.portfolio_archive import ARCHIVE_FORMAT, ARCHIVE_VERSION, ArchiveError
+
+
+def _archive(members) -> io.BytesIO:
+    """(이름, 바이트) 목록으로 메모리 안에 아카이브를 만듭니다."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    return buffer
+
+
+def _posts_archive(*rows) -> io.BytesIO:
+    manifest = json.dumps({"format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION}).encode()
+    posts = b"\n".join(json.dumps(row).encode() for row in rows)
+    return _archive([("manifest.json", manifest), ("posts/000001.ndjson", posts)])
+
+
+class _UnusedSession:
+    """잘못된 행은 DB에 닿기 전에 거부되어야 하므로 rollback 외의 호출은 실패시킵니다."""
+
+    def rollback(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize("created_at", ["yesterday", 20240101, ["2024-01-01"]])
+def test_import_rejects_malformed_timestamp(created_at):
+    archive = _posts_archive({"id": 1, "title": "t", "content": "c", "created_at": created_at})
+    with pytest.raises(ArchiveError, match="Invalid created_at"):
+        portfolio_archive.import_archive(_UnusedSession(), archive, owner_id=1)
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        (b"{not json", "Invalid NDJSON"),
+        (b"[1, 2]", "need at least"),
+        (b'{"id": 1, "content": "c"}', "need at least"),
+        (b'{"id": 1, "title": "t"}', "need at least"),
+        (b'{"title": "t", "content": "c"}', "need an integer"),
+        (b'{"id": "1", "title": "t", "content": "c"}', "need an integer"),
+        (b'{"id": 1, "title": "t", "content": "c", "updated_at": "soon"}', "Invalid updated_at"),
+    ],
+)
+def test_parse_row_rejects_malformed_rows(line, message):
+    with pytest.raises(ArchiveError, match=message):
+        portfolio_archive._parse_row(line)
+
+
+def test_parse_row_drops_empty_created_at():
+    row = portfolio_archive._parse_row(b'{"slug": "about", "title": "t", "content": "c", "created_at": ""}')
+    assert "created_at" not in row
+    row = portfolio_archive._parse_row(b'{"id": 3, "title": "t", "content": "", "updated_at": "2026-10-18T12:00:00+00:00"}')
+    assert row["updated_at"].year == 2026
+
+
+@pytest.fixture
+def image_directory(tmp_path, monkeypatch):
+    directory = tmp_path / "images"
+    monkeypatch.setattr(portfolio_archive, "IMAGE_DIRECTORY", directory)
+    return directory
+
+
+def _extract(members, name):
+    """아카이브의 첫 번째 멤버를 name으로 저장해 봅니다."""
+    with tarfile.open(fileobj=_archive(members), mode="r|gz") as tar:
+        member = next(iter(tar))
+        return portfolio_archive._extract_image(tar, member, name)
+
+
+@pytest.mark.parametrize("name", ["../escape.png", "/etc/passwd", "a/b.png", ".hidden.png", "", "x" * 300])
+def test_extract_image_rejects_unsafe_names(image_directory, tmp_path, name):
+    assert _extract([("images/x", b"data")], name) is False
+    assert not (tmp_path / "escape.png").exists()
+    assert not image_directory.exists() or not any(image_directory.iterdir())
+
+
+def _special_member(kind: bytes, linkname: str = "") -> io.BytesIO:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        info = tarfile.TarInfo("images/link.png")
+        info.type = kind
+        info.linkname = linkname
+        tar.addfile(info)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.mark.parametrize("kind", [tarfile.SYMTYPE, tarfile.LNKTYPE, tarfile.DIRTYPE])
+def test_extract_image_rejects_links_and_directories(image_directory, kind):
+    with tarfile.open(fileobj=_special_member(kind, "/etc/passwd"), mode="r|gz") as tar:
+        member = next(iter(tar))
+        assert portfolio_archive._extract_image(tar, member, "link.png") is False
+    assert not image_directory.exists() or not any(image_directory.iterdir())
+
+
+def test_extract_image_rejects_oversized_files(image_directory, monkeypatch):
+    monkeypatch.setattr(portfolio_archive.settings, "UPLOAD_MAX_BYTES", 3)
+    assert _extract([("images/big.png", b"data")], "big.png") is False
+
+
+def test_extract_image_writes_new_files_and_keeps_existing(image_directory):
+    assert _extract([("images/a.png", b"new")], "a.png") is True
+    assert (image_directory / "a.png").read_bytes() == b"new"
+    # 같은 이름이 이미 있으면 덮어쓰지 않습니다.
+    assert _extract([("images/a.png", b"other")], "a.png") is False
+    assert (image_directory / "a.png").read_bytes() == b"new"
+    assert [path.name for path in image_directory.iterdir()] == ["a.png"]
+
+
+def test_export_import_round_trip_images(image_directory, monkeypatch):
+    """내보낸 아카이브를 다시 읽으면 본문이 참조하는 이미지만 그대로 복원됩니다."""
+    image_directory.mkdir()
+    (image_directory / "used.webp").write_bytes(b"used")
+    (image_directory / "unused.webp").write_bytes(b"unused")
+    rows = [{"id": 1, "title": "t", "content": '<img src="/static/images/used.webp">', "slug": None}]
+    monkeypatch.setattr(crud_board.board, "iter_archive_rows", lambda db, batch_size: iter(rows))
+    archive = io.BytesIO(b"".join(portfolio_archive.iter_export(None)))
+
+    saved = []
+
+    def upsert_archive_batch(db, *, rows, owner_id):
+        saved.extend(rows)
+        return {"saved": 0, "skipped": len(rows)}
+
+    monkeypatch.setattr(crud_board.board, "upsert_archive_batch", upsert_archive_batch)
+    (image_directory / "used.webp").unlink()
+    (image_directory / "unused.webp").unlink()
+    stats = portfolio_archive.import_archive(_UnusedSession(), archive, owner_id=1)
+
+    assert stats["posts"] == 1 and stats["images"] == 1
+    assert [row["content"] for row in saved] == [rows[0]["content"]]
+    assert sorted(path.name for path in image_directory.iterdir()) == ["used.webp"]
+
+
+def test_import_skips_images_outside_image_directory(image_directory, tmp_path):
+    manifest = json.dumps({"format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION}).encode()
+    archive = _archive([
+        ("manifest.json", manifest),
+        ("images/../escape.png", b"x"),
+        ("images/nested/escape.png", b"x"),
+        ("images/ok.png", b"ok"),
+    ])
+    stats = portfolio_archive.import_archive(_UnusedSession(), archive, owner_id=1)
+
+    assert stats["images"] == 1
+    assert not (tmp_path / "escape.png").exists()
+    assert [path.name for path in image_directory.iterdir()] == ["ok.png"]
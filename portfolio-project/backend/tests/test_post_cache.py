@@ -0,0 +1,41 @@
+from sqlalchemy import func, update
+
+from app import schemas
+from app.crud import crud_board
+from app.models.board import Board
+
+from .conftest import TEST_TITLE_PREFIX, api_get
+
+
+def _edit_outside_api(db, post: Board, **values) -> None:
+    """다른 프로세스(CLI, 다른 워커)가 수정한 것처럼 CRUD 캐시를 거치지 않고 DB만 바꿉니다."""
+    db.execute(update(Board).where(Board.id == post.id).values(updated_at=func.now(), **values))
+    db.commit()
+
+
+def test_read_post_reloads_cached_post_older_than_etag(db, owner):
+    post = crud_board.board.create_with_owner(
+        db, obj_in=schemas.BoardCreate(title=TEST_TITLE_PREFIX + "before", content="본문"), owner_id=owner.id
+    )
+    first = api_get(f"/api/v1/board/{post.id}")
+    assert first.json()["title"] == TEST_TITLE_PREFIX + "before"
+
+    _edit_outside_api(db, post, title=TEST_TITLE_PREFIX + "after")
+    second = api_get(f"/api/v1/board/{post.id}")
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json()["title"] == TEST_TITLE_PREFIX + "after"
+
+
+def test_read_post_by_slug_reloads_cached_post_older_than_etag(db, owner):
+    post = crud_board.board.create_with_owner(
+        db,
+        obj_in=schemas.BoardCreate(title=TEST_TITLE_PREFIX + "page", content="이전 내용", slug="test-cached-page"),
+        owner_id=owner.id,
+    )
+    first = api_get("/api/v1/board/slug/test-cached-page")
+    assert first.json()["content"] == "이전 내용"
+
+    _edit_outside_api(db, post, content="새 내용")
+    second = api_get("/api/v1/board/slug/test-cached-page")
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json()["content"] == "새 내용"
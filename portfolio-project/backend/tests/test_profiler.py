@@ -0,0 +1,33 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.db.profiler import QueryBudgetExceeded, SQLProfilerMiddleware, profile_queries
+from app.db.session import async_engine
+from app.main import app
+
+# 게시글 목록은 컬렉션 버전 조회 + 페이지 조회로 최소 2개의 쿼리를 실행합니다.
+POSTS_URL = "/api/v1/board/?limit=5"
+
+
+@pytest.fixture(params=["app", "with_request_middleware"])
+def client(request, db_engine):
+    # 컨텍스트 없이 쓰는 TestClient는 요청마다 새 이벤트 루프에서 실행되므로,
+    # 이전 루프에 묶인 asyncpg 연결을 버리고(닫지 않음) 새 풀로 시작합니다.
+    async_engine.sync_engine.dispose(close=False)
+    # SQL_PROFILER_ENABLED일 때처럼 요청별 미들웨어가 있어도 바깥 profile_queries()가 적용되어야 합니다.
+    asgi_app = app if request.param == "app" else SQLProfilerMiddleware(app)
+    return TestClient(asgi_app)
+
+
+def test_query_budget_fails_request_over_budget(client):
+    with profile_queries("list posts", budget=1):
+        with pytest.raises(QueryBudgetExceeded):
+            client.get(POSTS_URL)
+
+
+def test_queries_within_budget_are_recorded(client):
+    with profile_queries("list posts", budget=20) as profile:
+        response = client.get(POSTS_URL)
+    assert response.status_code == 200
+    assert profile.count >= 2
+    assert all(entry["call_site"].startswith("app/") for entry in profile.statements)
@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints import sitemap
+from app.core.config import settings
+from app.crud import crud_board
+
+POST_TOTAL = 7
+TAGS = ["AI", "a&b", "한글 태그"]
+MODIFIED = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def fake_posts(monkeypatch):
+    """게시글 스트림을 id 1..POST_TOTAL로 대신하여 DB 없이 분할 범위를 확인합니다."""
+
+    def iter_post_last_modified(db, *, skip=0, limit=None, batch_size=1000):
+        stop = POST_TOTAL if limit is None else min(skip + limit, POST_TOTAL)
+        for post_id in range(skip + 1, stop + 1):
+            yield post_id, MODIFIED
+
+    monkeypatch.setattr(crud_board.board, "iter_post_last_modified", iter_post_last_modified)
+    monkeypatch.setattr(sitemap, "_sitemap_cache", sitemap.LRUCache(max_items=16))
+
+
+def _locs(entries):
+    return [entry.split("<loc>")[1].split("</loc>")[0] for entry in entries]
+
+
+def _all_urls():
+    return _locs(sitemap._iter_url_entries(None, start=0, stop=10**6, post_total=POST_TOTAL, tags=TAGS))
+
+
+def test_url_order_and_escaping():
+    base = settings.SITE_URL.rstrip("/")
+    urls = _all_urls()
+    assert len(urls) == len(sitemap.STATIC_PAGES) + POST_TOTAL + len(TAGS)
+    assert urls[len(sitemap.STATIC_PAGES)] == f"{base}/post/1"
+    assert urls[-2:] == [f"{base}/?tag=a%26b", f"{base}/?tag=%ED%95%9C%EA%B8%80%20%ED%83%9C%EA%B7%B8"]
+
+
+@pytest.mark.parametrize("shard_size", [1, 2, 3, 4, 5, 13])
+def test_shards_cover_every_url_exactly_once(shard_size):
+    total = len(_all_urls())
+    shards = [
+        _locs(sitemap._iter_url_entries(None, start=start, stop=start + shard_size, post_total=POST_TOTAL, tags=TAGS))
+        for start in range(0, total, shard_size)
+    ]
+    assert all(len(shard) <= shard_size for shard in shards)
+    assert [url for shard in shards for url in shard] == _all_urls()
+
+
+def _body(response) -> str:
+    if not hasattr(response, "body_iterator"):
+        return response.body.decode()  # 캐시된 결과
+
+    async def read() -> str:
+        return "".join([chunk.decode() async for chunk in response.body_iterator])
+
+    return asyncio.run(read())
+
+
+def _use_layout(monkeypatch, shard_size):
+    # _sitemap_layout이 게시글 수와 태그로 분할 파일 수를 계산하도록 CRUD 조회만 바꿉니다.
+    monkeypatch.setattr(settings, "SITEMAP_MAX_URLS", shard_size)
+    monkeypatch.setattr(sitemap, "_layout_cache", sitemap.LRUCache(max_items=4))
+    monkeypatch.setattr(crud_board.board, "get_collection_version", lambda db: (1, MODIFIED))
+    monkeypatch.setattr(crud_board.board, "count_posts_only", lambda db: POST_TOTAL)
+    monkeypatch.setattr(crud_board.board, "get_all_tags", lambda db: TAGS)
+
+
+def test_small_sitemap_is_a_single_urlset(monkeypatch):
+    _use_layout(monkeypatch, 50_000)
+    body = _body(sitemap.generate_sitemap(db=None))
+    assert "<urlset" in body and "<sitemapindex" not in body
+    assert body.count("<url>") == len(_all_urls())
+
+
+def test_large_sitemap_is_an_index_of_shards(monkeypatch):
+    _use_layout(monkeypatch, 4)
+    index = _body(sitemap.generate_sitemap(db=None))
+    assert "<sitemapindex" in index
+    assert "<lastmod>2026-10-18</lastmod>" in index
+    # 고정 페이지 3 + 게시글 7 + 태그 3 = 13개 URL -> 4개씩 4개 파일
+    shard_count = index.count("<sitemap>")
+    assert shard_count == 4
+
+    urls = []
+    for page in range(1, shard_count + 1):
+        shard = _body(sitemap.generate_sitemap_shard(page, db=None))
+        urls += _locs(line for line in shard.splitlines() if "<url>" in line)
+    assert urls == _all_urls()
+
+    for page in (0, shard_count + 1):
+        with pytest.raises(HTTPException) as exc_info:
+            sitemap.generate_sitemap_shard(page, db=None)
+        assert exc_info.value.status_code == 404
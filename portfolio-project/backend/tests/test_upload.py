@@ -0,0 +1,102 @@
+import io
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from app.api.v1 import deps
+from app.api.v1.endpoints import upload
+from app.core.config import settings
+from app.core.image_jobs import ImageJobQueue
+
+MAX_BYTES = 4096
+
+
+def _png(width: int = 8, height: int = 4) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def jobs(monkeypatch):
+    queue = ImageJobQueue(max_workers=1, max_pending=2)
+    monkeypatch.setattr(upload, "image_jobs", queue)
+    yield queue
+    queue.shutdown()
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path, jobs):
+    """DB 없이 확인할 수 있도록 관리자 확인을 대신하고 업로드 라우터만 붙인 앱을 씁니다."""
+    monkeypatch.setattr(upload, "UPLOAD_DIRECTORY", tmp_path)
+    # 요청 본문 한도는 라우트를 만들 때 계산되므로 앱을 만들기 전에 바꿉니다.
+    monkeypatch.setattr(settings, "UPLOAD_MAX_BYTES", MAX_BYTES)
+
+    app = FastAPI()
+    app.include_router(upload.router, prefix="/upload")
+    app.dependency_overrides[deps.get_current_active_admin_user] = lambda: None
+    # 작업의 future가 요청 사이에도 같은 이벤트 루프에 남아 있도록 컨텍스트 안에서 씁니다.
+    with TestClient(app) as client:
+        yield client
+
+
+def _post(client, data: bytes, content_type: str = "image/png", **params):
+    return client.post("/upload/", params=params, files={"file": ("a.png", data, content_type)})
+
+
+def test_upload_converts_to_webp(client, tmp_path):
+    response = _post(client, _png())
+    assert response.status_code == 200
+    name = response.json()["file_path"].rsplit("/", 1)[1]
+    with Image.open(tmp_path / name) as img:
+        assert (img.format, img.size) == ("WEBP", (8, 4))
+
+
+def test_upload_job_can_be_polled(client, tmp_path):
+    response = _post(client, _png(), wait="false")
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    deadline = time.monotonic() + 30
+    while (job := client.get(f"/upload/jobs/{job_id}").json())["status"] == "pending":
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    assert job["status"] == "done" and job["error"] is None
+    assert (tmp_path / job["file_path"].rsplit("/", 1)[1]).exists()
+
+    assert client.get("/upload/jobs/unknown").status_code == 404
+
+
+def test_failed_job_reports_error(client):
+    job_id = _post(client, b"not an image", wait="false").json()["job_id"]
+    deadline = time.monotonic() + 30
+    while (job := client.get(f"/upload/jobs/{job_id}").json())["status"] == "pending":
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    assert job["status"] == "failed" and job["error"] and job["file_path"] is None
+
+
+@pytest.mark.parametrize("data, content_type", [(b"x", "text/plain"), (b"", "image/png")])
+def test_upload_rejects_non_images_and_empty_files(client, data, content_type):
+    assert _post(client, data, content_type).status_code == 400
+
+
+@pytest.mark.parametrize("size", [MAX_BYTES + 1, MAX_BYTES + upload.MULTIPART_OVERHEAD_BYTES + 1])
+def test_upload_rejects_oversized_files(client, tmp_path, size):
+    # 한도를 조금 넘으면 복사 중에, 여유분까지 넘으면 multipart를 읽기 전에 413으로 거절됩니다.
+    response = _post(client, b"\0" * size)
+    assert response.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_upload_rejects_decompression_bombs(client, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_MAX_IMAGE_PIXELS", 16)
+    assert _post(client, _png()).status_code == 413
+
+
+def test_upload_returns_503_when_queue_is_full(client, jobs):
+    jobs._pending = jobs.max_pending
+    assert _post(client, _png()).status_code == 503
@@ -0,0 +1,20 @@
+from app.crud import crud_user
+from app.db.session import SessionLocal
+
+
+def test_cached_user_omits_password_hash(db, owner):
+    users = crud_user.user
+    users._cache_invalidate(users._cache_keys(owner))
+    users.get(db, id=owner.id)
+
+    cached = users.cache.get(users._cache_key("id", owner.id))
+    assert cached["username"] == owner.username
+    assert "hashed_password" not in cached
+
+    # 캐시에서 꺼낸 사용자도 필요하면 DB에서 해시를 읽어 옵니다.
+    other = SessionLocal()
+    try:
+        user = users.get(other, id=owner.id)
+        assert user.hashed_password == owner.hashed_password
+    finally:
+        other.close()